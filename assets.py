@@ -0,0 +1,101 @@
+import hashlib
+import os
+
+import pygame
+
+from contantes import ASSET_CACHE_PATH, IMAGE_PATH
+
+# Images des cases du plateau : nom -> fichier source
+TILE_IMAGES = {'wall': 'wall.png', 'block': 'block.png', 'grass': 'grass.png'}
+
+
+class AssetManager:
+    """Images du jeu mises à la taille des cases, chargées à la demande.
+
+    Une image mise à l'échelle est gardée sur disque (pixels bruts, sans PNG à décoder) sous une
+    clé formée de l'empreinte du fichier source et de la taille des cases : au démarrage suivant,
+    elle est relue telle quelle, et une image source modifiée est recalculée. Les images sans
+    transparence sont converties avec convert() (copie directe, plus rapide à afficher) ; les
+    autres avec convert_alpha(). Il faut un mode vidéo actif pour charger une image.
+    """
+
+    def __init__(self, tile_size, image_path=IMAGE_PATH, cache_path=ASSET_CACHE_PATH):
+        self.tile_size = tile_size
+        self.image_path = image_path
+        self.cache_path = cache_path
+        self.surfaces = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name, filename=None):
+        # Image « name » à la taille des cases (chargée au premier appel)
+        surface = self.surfaces.get(name)
+        if surface is None:
+            surface = self.load(filename or TILE_IMAGES[name])
+            self.surfaces[name] = surface
+        return surface
+
+    def atlas(self, names):
+        """Réunit les images données dans une seule surface (une ligne de cases).
+
+        Renvoie un dictionnaire nom -> sous-surface de l'atlas, utilisable comme les images seules.
+        """
+        tiles = [self.get(name) for name in names]
+        opaque = all(not tile.get_flags() & pygame.SRCALPHA for tile in tiles)
+        size = self.tile_size
+        sheet = pygame.Surface((size * len(tiles), size), 0 if opaque else pygame.SRCALPHA)
+        sheet = sheet.convert() if opaque else sheet.convert_alpha()
+        sheet.blits([(tile, (i * size, 0)) for i, tile in enumerate(tiles)], doreturn=False)
+        return {name: sheet.subsurface((i * size, 0, size, size)) for i, name in enumerate(names)}
+
+    def load(self, filename):
+        path = os.path.join(self.image_path, filename)
+        with open(path, "rb") as file:
+            source = file.read()
+        key = hashlib.sha1(source).hexdigest()[:16]
+        stem = os.path.splitext(filename)[0]
+
+        # Image déjà mise à l'échelle lors d'un démarrage précédent
+        for pixel_format in ('RGB', 'RGBA'):
+            cached = os.path.join(self.cache_path, f"{stem}-{self.tile_size}-{key}.{pixel_format.lower()}")
+            try:
+                with open(cached, "rb") as file:
+                    pixels = file.read()
+            except OSError:
+                continue
+            if len(pixels) == self.tile_size * self.tile_size * len(pixel_format):
+                self.hits += 1
+                surface = pygame.image.frombytes(pixels, (self.tile_size, self.tile_size), pixel_format)
+                return surface.convert() if pixel_format == 'RGB' else surface.convert_alpha()
+
+        # Sinon : décoder, mettre à l'échelle et garder le résultat
+        self.misses += 1
+        image = pygame.image.load(path).convert_alpha()
+        image = pygame.transform.scale(image, (self.tile_size, self.tile_size))
+        opaque = self.is_opaque(image)
+        pixel_format = 'RGB' if opaque else 'RGBA'
+        self.save(f"{stem}-{self.tile_size}-{key}.{pixel_format.lower()}",
+                  pygame.image.tobytes(image, pixel_format))
+        return image.convert() if opaque else image
+
+    @staticmethod
+    def is_opaque(image):
+        # Aucun pixel transparent, même partiellement
+        return bool(pygame.surfarray.pixels_alpha(image).min() == 255)
+
+    def save(self, name, pixels):
+        # Écriture dans un fichier temporaire puis renommage : jamais de fichier à moitié écrit.
+        # Un cache impossible à écrire (disque en lecture seule) n'empêche pas de jouer.
+        try:
+            os.makedirs(self.cache_path, exist_ok=True)
+            path = os.path.join(self.cache_path, name)
+            temporary = f"{path}.{os.getpid()}.tmp"
+            with open(temporary, "wb") as file:
+                file.write(pixels)
+            os.replace(temporary, path)
+        except OSError:
+            pass
+
+    def clear(self):
+        # Oublier les images chargées (changement de taille des cases) ; le cache disque reste
+        self.surfaces.clear()
@@ -0,0 +1,251 @@
+"""Mesures de performance des chemins critiques de la simulation et de l'affichage.
+
+Tourne avec le pilote vidéo SDL « dummy » (aucune fenêtre). Les résultats sont écrits en JSON
+et comparés à une référence enregistrée : le script échoue si une mesure se dégrade au-delà
+de la tolérance. Les références dépendent de la machine : les réenregistrer avec
+--save-baseline sur la machine de mesure. Sans référence, le script échoue aussi, sauf avec
+--allow-missing-baseline (simple mesure, rien à comparer).
+
+Utilisation : python benchmark.py [--output resultats.json] [--baseline FICHIER] [--save-baseline]
+              [--allow-missing-baseline]
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from bomberman import Bomberman
+from config import Config
+from contantes import *
+from grid import *
+from assets import AssetManager
+from rollback import Rollback
+
+BASELINE_PATH = "benchmark_baseline.json"
+DRAW_TILE_SIZES = (24, 45, 64)
+BENCH_TILE_SIZE = 48  # Taille des cases des mesures de simulation (indépendantes de l'écran)
+HEADLESS = Config(tile_size=BENCH_TILE_SIZE)
+
+
+def measure(function, setup=None, repeat=7, number=20):
+    # Durée d'un appel en microsecondes : médiane et minimum sur plusieurs séries
+    runs = []
+    for _ in range(repeat):
+        total = 0.0
+        for _ in range(number):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            function()
+            total += time.perf_counter() - start
+        runs.append(total / number * 1e6)
+    return {"median_us": statistics.median(runs), "min_us": min(runs)}
+
+
+def fill_with_bombs(game):
+    # Plateau sans blocs, une bombe sur chaque case libre hors des coins de départ
+    game.grid[:] = grid_template(GRID_WIDTH, GRID_HEIGHT)
+    game.bombs.clear()
+    game.bomb_store.clear()
+    game.danger.clear()
+    game.explosions.clear()
+    owner = game.players[0]
+    for y in range(1, GRID_HEIGHT - 1):
+        for x in range(1, GRID_WIDTH - 1):
+            if game.grid[y, x] == EMPTY and (x, y) not in ((1, 1), (GRID_WIDTH - 2, GRID_HEIGHT - 2)):
+                game.add_bomb(game.bomb_store.create(x, y, 3, owner))
+    for p in game.players:
+        p.alive = True
+
+
+def bench_create_grid(quick):
+    game = Bomberman(None, seed=0, config=HEADLESS)
+    return measure(game.create_grid, number=50 if not quick else 5)
+
+
+def bench_explode_chain(quick):
+    game = Bomberman(None, seed=0, config=HEADLESS)
+    return measure(lambda: game.explode_bomb(next(iter(game.bombs))), setup=lambda: fill_with_bombs(game),
+                   repeat=5, number=10 if not quick else 2)
+
+
+def bench_can_move(quick):
+    # Joueur entouré de bombes : chaque test de collision passe par la branche TileType.BOMB
+    game = Bomberman(None, seed=0, config=HEADLESS)
+    fill_with_bombs(game)
+    p = game.players[0]
+    positions = [(p.x + dx, p.y + dy) for dx in range(-6, 7, 3) for dy in range(-6, 7, 3)]
+
+    def run():
+        for x, y in positions:
+            p.can_move(x, y, game)
+
+    result = measure(run, number=200 if not quick else 20)
+    # Ramené à un appel de can_move
+    return {key: value / len(positions) for key, value in result.items()}
+
+
+def bench_update_tick(quick):
+    # Tick complet (entrées + update) en milieu de partie, avec des bombes et des explosions
+    game = Bomberman(None, seed=0, config=HEADLESS)
+    rng = np.random.default_rng(0)
+    actions = rng.integers(0, 5, (4096, len(game.players))) | np.where(rng.random((4096, 2)) < 0.05, ACTION_BOMB, 0)
+    tick = [0]
+
+    def run():
+        nonlocal game
+        if game.game_over:
+            game = Bomberman(None, seed=tick[0], config=HEADLESS)
+        game.step(actions[tick[0] % len(actions)].tolist())
+        tick[0] += 1
+
+    return measure(run, number=500 if not quick else 50)
+
+
+def bench_bots(quick):
+    # Décision de tous les joueurs confiés à l'ordinateur, sur des parties entières
+    game = Bomberman(None, seed=0, config=HEADLESS)
+    tick = [0]
+
+    def setup():
+        nonlocal game
+        if game.game_over:
+            tick[0] += 1
+            game = Bomberman(None, seed=tick[0], config=HEADLESS)
+        if game.players[0].controller is None:
+            for index in range(len(game.players)):
+                game.add_bot(index)
+
+    def run():
+        game.step(game.read_actions())
+
+    return measure(run, setup=setup, number=500 if not quick else 50)
+
+
+def bench_rollback(quick):
+    # Prédiction fausse sur le plus ancien tick de la fenêtre : retour en arrière et 8 ticks re-simulés
+    game = Bomberman(None, seed=0, config=HEADLESS)
+    rollback = Rollback(game, window=8)
+    for tick in range(600):
+        rollback.advance([tick % 5 | (ACTION_BOMB if tick % 50 == 0 else 0), (tick // 3) % 5])
+
+    def run():
+        tick, _, actions, _, _ = rollback.history[0]
+        rollback.correct(tick, 0, (actions[0] + 1) % 5)
+
+    return measure(run, number=50 if not quick else 5)
+
+
+def bench_draw(tile_size, quick):
+    screen = pygame.display.set_mode((tile_size * GRID_WIDTH, tile_size * GRID_HEIGHT))
+    game = Bomberman(screen, seed=0, config=Config(screen.get_size(), tile_size))
+    number = 30 if not quick else 3
+    results = {
+        f"draw_grid@{tile_size}": measure(game.draw_grid, number=number),
+        f"draw_ui@{tile_size}": measure(game.draw_ui, number=number),
+    }
+
+    # Grande réaction en chaîne : une explosion sur chaque case, des bombes sur une ligne sur deux
+    for y in range(GRID_HEIGHT):
+        for x in range(GRID_WIDTH):
+            game.explosions.create(x, y, 0.5)
+            if y % 2:
+                game.bomb_store.create(x, y, 1, None)
+    results[f"draw_sprites@{tile_size}"] = measure(
+        lambda: game.draw_sprites(0, 0, GRID_WIDTH, GRID_HEIGHT), number=number)
+    return results
+
+
+def bench_load_images(quick):
+    # Démarrage avec le cache disque déjà rempli (cas normal après le premier lancement)
+    AssetManager(BENCH_TILE_SIZE).atlas(('wall', 'block', 'grass'))
+    return measure(lambda: AssetManager(BENCH_TILE_SIZE).atlas(('wall', 'block', 'grass')),
+                   number=20 if not quick else 2)
+
+
+def run_benchmarks(quick=False):
+    pygame.display.set_mode((GRID_WIDTH * 32, GRID_HEIGHT * 32))
+    results = {
+        "create_grid": bench_create_grid(quick),
+        "explode_chain": bench_explode_chain(quick),
+        "can_move": bench_can_move(quick),
+        "update_tick": bench_update_tick(quick),
+        "bots_tick": bench_bots(quick),
+        "rollback_8": bench_rollback(quick),
+        "load_images": bench_load_images(quick),
+    }
+    for tile_size in DRAW_TILE_SIZES:
+        results.update(bench_draw(tile_size, quick))
+    return results
+
+
+def compare(results, baseline, tolerance):
+    # Renvoie la liste des mesures plus lentes que la référence au-delà de la tolérance.
+    # On compare les minimums, moins sensibles que les médianes à la charge de la machine.
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        ratio = result["min_us"] / reference["min_us"]
+        status = "RÉGRESSION" if ratio > 1 + tolerance else "ok"
+        print(f"{name:20s} {result['min_us']:12.1f} µs  référence {reference['min_us']:12.1f} µs  "
+              f"x{ratio:5.2f}  {status}")
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de Bomberman")
+    parser.add_argument("--output", help="fichier JSON des résultats")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="fichier de référence")
+    parser.add_argument("--save-baseline", action="store_true", help="enregistrer les résultats comme référence")
+    parser.add_argument("--allow-missing-baseline", action="store_true",
+                        help="ne pas échouer sans fichier de référence")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="dégradation tolérée (0.25 = 25%%)")
+    parser.add_argument("--quick", action="store_true", help="moins d'itérations (vérification rapide)")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.quick)
+    report = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Référence enregistrée dans {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(json.dumps(report, indent=2))
+        print(f"Pas de référence ({args.baseline}) : rien à comparer")
+        return 0 if args.allow_missing_baseline else 1
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)["results"]
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} régression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,39 +1,61 @@
-import pygame
+import numpy as np
 from contantes import *
+from entities import EntityField, EntityStore, ObjectField
 
 
 class Bomb:
-    def __init__(self, x, y, power, owner):
-        self.x = x
-        self.y = y
-        self.power = power
-        self.owner = owner
-        self.timer = FPS * 3  # 3 secondes avant explosion
-        self.just_placed = True
-        self.radius = TILE_SIZE // 2 - 5
-
-    def update(self):
+    # Poignée vers un emplacement de BombStore : les données vivent dans les tableaux du magasin
+    __slots__ = ('store', 'slot')
+
+    x = EntityField()
+    y = EntityField()
+    power = EntityField()
+    timer = EntityField()  # 3 secondes avant explosion
+    serial = EntityField()  # Ordre de pose
+    owner = ObjectField()
+
+    def __init__(self, store, slot):
+        self.store = store
+        self.slot = slot
+
+    @property
+    def just_placed(self):
         # La bombe n'est plus considérée comme "juste posée" après quelques frames
-        if self.timer < FPS * 3 - 10:
-            self.just_placed = False
-
-    def draw(self, screen, offset_x, offset_y):
-        # Dessiner la bombe (un cercle noir avec une mèche qui pulse)
-        rect = pygame.Rect(
-            offset_x + self.x * TILE_SIZE,
-            offset_y + self.y * TILE_SIZE,
-            TILE_SIZE,
-            TILE_SIZE
-        )
-        pulse_factor = (self.timer % 20) / 20  # Effet de pulsation
-        size = int(self.radius * (0.8 + 0.2 * pulse_factor))
-
-        pygame.draw.circle(screen, BLACK, rect.center, size)
-
-        # Dessiner la mèche
-        fuse_length = int(TILE_SIZE * 0.2 * (self.timer / (FPS * 3)))
-        if fuse_length > 0:
-            pygame.draw.line(screen, RED,
-                             (rect.centerx, rect.centery - size // 2),
-                             (rect.centerx, rect.centery - size // 2 - fuse_length),
-                             3)
+        return self.timer >= BOMB_TIMER - 10
+
+
+class BombStore(EntityStore):
+    fields = {'x': np.int32, 'y': np.int32, 'power': np.int32, 'timer': np.int32, 'serial': np.int64}
+    object_fields = ('owner',)
+    entity_class = Bomb
+
+    def __init__(self, capacity=32):
+        super().__init__(capacity)
+        self.next_serial = 0  # Ordre de pose des bombes
+
+    def create(self, x, y, power, owner):
+        bomb = self.acquire()
+        slot = bomb.slot
+        self.x[slot] = x
+        self.y[slot] = y
+        self.power[slot] = power
+        self.timer[slot] = BOMB_TIMER
+        self.serial[slot] = self.next_serial
+        self.owner[slot] = owner
+        self.next_serial += 1
+        return bomb
+
+    def snapshot(self):
+        return super().snapshot(), self.next_serial
+
+    def restore(self, snapshot):
+        columns, self.next_serial = snapshot
+        super().restore(columns)
+
+    def tick(self):
+        # Décompte de toutes les bombes ; renvoie celles qui explosent, dans l'ordre de pose
+        due = self.countdown()
+        if due.size == 0:
+            return []
+        due = due[np.argsort(self.serial[due])]
+        return [self.entities[slot] for slot in due.tolist()]
@@ -0,0 +1,52 @@
+class BombIndex:
+    """Bombes posées, indexées par case et par propriétaire.
+
+    Remplace la liste Bomberman.bombs : recherche, ajout et retrait en O(1). L'ordre d'itération
+    est l'ordre de pose, comme avec la liste. Bomberman.add_bomb et Bomberman.remove_bomb
+    gardent l'index synchronisé avec les cases TileType.BOMB de la grille.
+    """
+
+    def __init__(self):
+        self.by_tile = {}
+        self.by_owner = {}
+
+    def __len__(self):
+        return len(self.by_tile)
+
+    def __iter__(self):
+        return iter(self.by_tile.values())
+
+    def __contains__(self, bomb):
+        return self.by_tile.get((bomb.x, bomb.y)) is bomb
+
+    def at(self, x, y):
+        # Bombe posée sur la case (x, y), ou None
+        return self.by_tile.get((x, y))
+
+    def add(self, bomb):
+        key = (bomb.x, bomb.y)
+        if key in self.by_tile:
+            raise ValueError(f"Une bombe est déjà posée en {key}")
+        self.by_tile[key] = bomb
+        self.by_owner.setdefault(bomb.owner, {})[key] = bomb
+
+    def remove(self, bomb):
+        key = (bomb.x, bomb.y)
+        if self.by_tile.get(key) is not bomb:
+            raise ValueError(f"Bombe absente de l'index en {key}")
+        del self.by_tile[key]
+        del self.by_owner[bomb.owner][key]
+
+    def count(self, owner):
+        # Bombes encore posées par ce joueur (limite de Player.max_bombs)
+        return len(self.by_owner.get(owner, ()))
+
+    def clear(self):
+        self.by_tile.clear()
+        self.by_owner.clear()
+
+    def rebuild(self, bombs):
+        # Réindexer les bombes données, dans leur ordre de pose
+        self.clear()
+        for bomb in sorted(bombs, key=lambda bomb: bomb.serial):
+            self.add(bomb)
@@ -2,115 +2,414 @@ import pygame
 from player import Player
 from contantes import *
 import random
-from explosion import Explosion
+import time
+import zlib
+from collections import deque
+import numpy as np
+from bomb import BombStore
+from explosion import ExplosionStore
+from grid import *
+from text_cache import TextCache
+from bomb_index import BombIndex
+from danger import DangerMap, NEVER
+from profiler import NullProfiler
+from bot import BotController, WorldView
+from camera import Camera
+from collision import CollisionMap
+from assets import AssetManager
+from sprites import SpriteAtlas
+from config import Config, get_config
+from events import (EventBus, MatchStart, ImagesLoaded, Detonation, Chain, BlockDestroyed, PowerUpSpawned,
+                    Kill, MatchEnd, player_number)
+
+DANGER_LEVELS = 4  # Nuances du voile de l'affichage des dangers
+
+# Touches des joueurs au clavier ; les joueurs suivants n'en ont pas (bots ou joueurs distants)
+KEY_BINDINGS = [
+    (pygame.K_z, pygame.K_s, pygame.K_q, pygame.K_d, pygame.K_e),
+    (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE),
+]
+NO_KEYS = (None,) * 5
+
 
 class Bomberman:
-    def __init__(self, screen):
-        # Initialisation de l'affichage
+    def __init__(self, screen, dirty_rects=False, seed=None, profiler=None, width=GRID_WIDTH,
+                 height=GRID_HEIGHT, n_players=2, config=None, scoring=DEFAULT_SCORING, events=None,
+                 maps=None, grid=None, best_of=1):
+        # Initialisation de l'affichage (screen à None : partie sans affichage, ex. relecture)
         self.screen=screen
-        pygame.display.set_caption("Bomberman")
-
-        # Calculer le décalage pour centrer le jeu sur l'écran
-        self.offset_x = (SCREEN_WIDTH - WIDTH) // 2
-        self.offset_y = (SCREEN_HEIGHT - HEIGHT) // 2
+        if screen is not None:
+            pygame.display.set_caption("Bomberman")
+
+        # Taille de l'écran et des cases : par défaut celle de l'écran donné (ou du bureau)
+        if config is None:
+            config = Config(screen.get_size()) if screen is not None else get_config()
+        self.config = config
+        self.tile_size = config.tile_size
+
+        # Taille du plateau (impaire pour que les murs fixes ferment les bords) et nombre de joueurs
+        for size in (width, height):
+            if not MIN_GRID_SIZE <= size <= MAX_GRID_SIZE or size % 2 == 0:
+                raise ValueError(f"Taille de plateau invalide: {width}x{height} "
+                                 f"(impaire, de {MIN_GRID_SIZE} à {MAX_GRID_SIZE})")
+        if not 2 <= n_players <= MAX_PLAYERS:
+            raise ValueError(f"Nombre de joueurs invalide: {n_players} (2 à {MAX_PLAYERS})")
+        if best_of < 1:
+            raise ValueError(f"Nombre de manches invalide: {best_of}")
+        self.width = width
+        self.height = height
+
+        # Événements de la partie (voir events.py), publiés dès le chargement des images
+        self.events = events if events is not None else EventBus()
+        self.quiet = False  # Partie sans spectateur (tournoi) : pas d'événements
+        self.game_time = 0  # Temps de jeu en ticks
 
         # Initialisation des ressources
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont('Arial', int(TILE_SIZE * 0.6))
-        self.load_images()
+        self.text_cache = TextCache()
+        self.images = None
+        self.assets = None  # AssetManager, créé au premier chargement d'images
+        self.danger_surfaces = None  # Voiles de l'affichage des dangers, créés au premier usage
+        self.background = None
+        self.apply_layout()
+
+        # Générateur aléatoire propre à la partie : avec la même graine et les mêmes entrées,
+        # une partie se rejoue à l'identique
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = np.random.default_rng(self.seed)
+        self.recorder = None  # InputRecorder éventuel, alimenté à chaque tick
+        self.scoring = scoring  # Points par bloc, power-up, élimination, victoire et seconde de survie
+        # Mesure des phases de chaque image (FrameProfiler), sans coût si absente
+        self.profiler = profiler if profiler is not None else NullProfiler()
 
         # Initialisation des éléments du jeu
-        self.grid = self.create_grid()
-        self.bombs = []
-        self.explosions = []
+        spawns = spawn_positions(width, height, n_players)
+        # Plateau : donné (relecture), sinon tiré pour la manche (voir new_grid)
+        self.maps = maps  # Réserve de plateaux validés (MapPool) éventuelle
+        self.map_index = None  # Numéro du plateau dans la réserve
+        if grid is not None:
+            if grid.shape != (height, width):
+                raise ValueError(f"Plateau de {grid.shape[1]}x{grid.shape[0]} cases pour une partie "
+                                 f"en {width}x{height}")
+            self.grid = np.array(grid, np.uint8)
+        else:
+            self.grid = self.new_grid(spawns)
+        # Obstacles de la grille pour les déplacements, tenus à jour par set_tile
+        self.collision = CollisionMap(self.tile_size, width, height)
+        # Bombes et explosions : données dans des magasins en tableaux, bombes indexées par case
+        self.bomb_store = BombStore()
+        self.bombs = BombIndex()
+        self.explosions = ExplosionStore()
+        # Tick de la prochaine explosion de chaque case, tenu à jour à chaque événement
+        self.danger = DangerMap(width, height)
+        self.show_danger = False
         self.players = [
-            Player(1, 1, RED, pygame.K_z, pygame.K_s, pygame.K_q, pygame.K_d, pygame.K_e),
-            Player(GRID_WIDTH - 2, GRID_HEIGHT - 2, BLUE, pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT,
-                   pygame.K_SPACE)
+            Player(x, y, PLAYER_COLORS[i], *(KEY_BINDINGS[i] if i < len(KEY_BINDINGS) else NO_KEYS), number=i + 1,
+                   tile_size=self.tile_size)
+            for i, (x, y) in enumerate(spawns)
         ]
 
         # État du jeu
         self.running = True
         self.game_over = False
-        self.game_time = 0  # Temps de jeu en frames
+        self.keys = None
+        # Incrémenté à chaque modification de la grille (bombes comprises) : les bots ne
+        # recalculent leurs chemins que lorsqu'il change
+        self.world_version = 0
+        self.bot_view = None  # Données de planification partagées par les bots
+        # Série de manches : au plus best_of manches, gagnée par le premier à en remporter la
+        # majorité (voir rematch)
+        self.best_of = best_of
+        self.rounds = []  # Manches terminées de la série : (indice du vainqueur ou None, scores)
+        self.recordings = []  # Enregistrements des manches précédentes, si la partie est enregistrée
+        self.rematch_allowed = True  # Touche R en fin de partie (pas pour un client réseau ni une relecture)
+        self.startup = None  # StartupTimer éventuel, arrêté à la première image affichée
+
+        # Rendu par rectangles modifiés : fond (murs, sol, power-ups) pré-composé dans une surface
+        self.changed_tiles = set()
+        self.previous_rects = []
+        # Le fond pré-composé a la taille de l'écran : seulement quand le plateau ne défile pas
+        if dirty_rects and not self.camera.scrolls:
+            self.build_background()
+
+        self.emit(MatchStart(self.game_time, self.seed, width, height, n_players))
+
+    def emit(self, event):
+        # Publier un événement (voir Rollback pour ceux des ticks re-simulés)
+        if not self.quiet:
+            self.events.emit(event)
+
+    def apply_layout(self):
+        # Tout ce qui dépend de la taille de l'écran et des cases
+        tile_size = self.tile_size
+        # Partie visible du plateau : centrée s'il tient à l'écran, sinon elle suit les joueurs
+        self.camera = Camera(*self.config.screen_size, self.width, self.height, tile_size) \
+            if self.screen is not None else None
+        self.offset_x = self.camera.offset_x if self.camera is not None else 0
+        self.offset_y = self.camera.offset_y if self.camera is not None else 0
+        self.font_size = int(tile_size * 0.6)
+        self.legend_font_size = int(tile_size * 0.4)
+        self.danger_surfaces = None
+        self.sprites = None
+        if self.screen is not None:
+            self.font = self.text_cache.font('Arial', self.font_size)
+            self.load_images()
+            # Images des bombes, explosions et power-ups, dessinées une fois pour cette taille de cases
+            self.sprites = SpriteAtlas(tile_size)
+
+    def set_config(self, config, screen=None):
+        """Change de résolution en cours de partie (nouvel écran éventuel), sans redémarrer.
+
+        Les positions des joueurs sont mises à l'échelle de la nouvelle taille des cases.
+        """
+        if screen is not None:
+            self.screen = screen
+        scale = config.tile_size / self.tile_size
+        self.config = config
+        self.tile_size = config.tile_size
+        self.collision = CollisionMap(self.tile_size, self.width, self.height)
+        for player in self.players:
+            player.tile_size = self.tile_size
+            player.radius = self.tile_size // 2 - 8
+            player.x, player.y = round(player.x * scale), round(player.y * scale)
+            player.previous_x, player.previous_y = player.x, player.y
+            player.grid_x, player.grid_y = player.x // self.tile_size, player.y // self.tile_size
+        dirty_rects = self.background is not None
+        self.background = None
+        self.apply_layout()
+        if dirty_rects and not self.camera.scrolls:
+            self.build_background()
 
     def load_images(self):
-        # Créer un dictionnaire pour stocker les images
-        self.images = {}
-
+        # Images du mur, du bloc et du sol, à la taille des cases, réunies dans un atlas ;
+        # mises à l'échelle une seule fois puis relues depuis le cache disque
+        if self.assets is None or self.assets.tile_size != self.tile_size:
+            self.assets = AssetManager(self.tile_size)
         try:
-            # Charger l'image du mur indestructible
-            wall_img = pygame.image.load(f"{IMAGE_PATH}wall.png").convert_alpha()
-            self.images['wall'] = pygame.transform.scale(wall_img, (TILE_SIZE, TILE_SIZE))
-
-            # Charger l'image du bloc destructible
-            block_img = pygame.image.load(f"{IMAGE_PATH}block.png").convert_alpha()
-            self.images['block'] = pygame.transform.scale(block_img, (TILE_SIZE, TILE_SIZE))
-
-            # Charger l'image du sol (pelouse)
-            grass_img = pygame.image.load(f"{IMAGE_PATH}grass.png").convert_alpha()
-            self.images['grass'] = pygame.transform.scale(grass_img, (TILE_SIZE, TILE_SIZE))
+            self.images = self.assets.atlas(('wall', 'block', 'grass'))
+            self.emit(ImagesLoaded(self.game_time, self.tile_size, None))
 
-            print("Images chargées avec succès!")
-
-        except pygame.error as e:
-            print(f"Erreur lors du chargement des images: {e}")
-            print("Utilisation des formes par défaut.")
+        except (pygame.error, OSError) as e:
+            # Utilisation des formes par défaut
+            self.emit(ImagesLoaded(self.game_time, self.tile_size, str(e)))
             self.images = None
 
+    def new_grid(self, spawns):
+        # Plateau de la manche : pris dans la réserve de plateaux validés (sans consommer le
+        # générateur aléatoire) si elle correspond à la partie, sinon généré
+        if self.maps is not None and self.maps.fits(self.width, self.height, len(spawns)):
+            self.map_index, grid = self.maps.pick(self.seed)
+            return grid
+        self.map_index = None
+        return create_grid(self.rng, self.width, self.height, spawns)
+
     def create_grid(self):
-        # Crée la grille initiale du jeu
-        grid = [[TileType.EMPTY for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
-
-        # Ajoute les murs fixes (non destructibles)
-        for x in range(GRID_WIDTH):
-            for y in range(GRID_HEIGHT):
-                # Bords de la grille
-                if x == 0 or y == 0 or x == GRID_WIDTH - 1 or y == GRID_HEIGHT - 1:
-                    grid[y][x] = TileType.WALL
-                # Murs intérieurs (motif classique de Bomberman)
-                elif x % 2 == 0 and y % 2 == 0:
-                    grid[y][x] = TileType.WALL
-
-        # Ajoute des blocs destructibles aléatoirement
-        for x in range(GRID_WIDTH):
-            for y in range(GRID_HEIGHT):
-                if grid[y][x] == TileType.EMPTY:
-                    # Laisse des espaces libres pour les joueurs dans les coins
-                    if (x <= 2 and y <= 2) or (x >= GRID_WIDTH - 3 and y >= GRID_HEIGHT - 3):
-                        continue
-                    # 40% de chance d'ajouter un bloc destructible
-                    if random.random() < 0.4:
-                        grid[y][x] = TileType.BLOCK
-
-        return grid
+        # Crée la grille initiale du jeu : murs fixes, puis 40% de blocs destructibles
+        # en laissant des espaces libres autour des cases de départ des joueurs
+        spawns = spawn_positions(self.width, self.height, len(self.players))
+        return create_grid(self.rng, self.width, self.height, spawns)
+
+    def set_tile(self, x, y, tile_type):
+        # Modifier une case de la grille en notant qu'elle doit être redessinée dans le fond
+        self.grid[y, x] = tile_type
+        self.world_version += 1
+        self.collision.set_tile(x, y, tile_type, self.world_version)
+        if self.background is not None:
+            self.changed_tiles.add((x, y))
 
     # ----------------------------------------
     # MÉTHODES PRINCIPALES DU JEU
     # ----------------------------------------
     def run(self):
-        # Boucle principale du jeu
+        # Boucle principale à pas fixe : la simulation avance de TICK_RATE ticks par seconde
+        # quelle que soit la vitesse d'affichage, et l'image est interpolée entre deux ticks
+        tick_duration = 1.0 / TICK_RATE
+        accumulator = 0.0
+        previous_time = time.perf_counter()
+
         while self.running:
-            self.clock.tick(FPS)
-            self.handle_events()
+            self.clock.tick(RENDER_FPS)
+            now = time.perf_counter()
+            # Limiter le retard à rattraper après un gros ralentissement
+            accumulator += min(now - previous_time, MAX_FRAME_TIME)
+            previous_time = now
+
+            with self.profiler.section('handle_events'):
+                self.handle_events()
+            while accumulator >= tick_duration:
+                self.step(self.read_actions())
+                accumulator -= tick_duration
+
+            self.draw(accumulator / tick_duration)
+            self.profiler.end_frame(len(self.bombs), len(self.explosions))
+            if self.startup is not None:
+                self.startup.mark('first_frame')
+                self.startup = None
+
+    def add_bot(self, index, **options):
+        # Confier le joueur « index » à l'ordinateur
+        if self.bot_view is None:
+            self.bot_view = WorldView()
+        options.setdefault('seed', self.seed + index)
+        player = self.players[index]
+        player.controller = BotController(player, self.bot_view, **options)
+        return player.controller
+
+    def read_actions(self):
+        # Actions des joueurs pour ce tick : contrôleur des bots, sinon état du clavier
+        actions = []
+        for player in self.players:
+            if player.controller is not None:
+                actions.append(player.controller.next_action(self))
+            elif self.keys is not None and player.key_up is not None:
+                actions.append(player.read_action(self.keys))
+            else:
+                actions.append(ACTION_NONE)
+        return actions
+
+    def step(self, actions):
+        # Un tick de simulation : actions des joueurs (codes ACTION_*) puis mise à jour du jeu
+        for player in self.players:
+            player.previous_x, player.previous_y = player.x, player.y
+
+        if not self.game_over:
+            self.collision.refresh(self)
+            if self.recorder is not None:
+                self.recorder.record(actions)
+            for player, action in zip(self.players, actions):
+                if player.alive:
+                    player.apply_action(action, self)
+
+        with self.profiler.section('update'):
             self.update()
-            self.draw()
+
+    def checksum(self):
+        # Empreinte de l'état de la partie, pour comparer deux exécutions (désynchronisation)
+        state = [self.game_time, self.game_over]
+        for player in self.players:
+            state += [player.x, player.y, player.alive, player.score, player.speed, player.sub_pixel,
+                      player.max_bombs, player.bomb_power, self.bombs.count(player)]
+        for bomb in self.bombs:
+            state += [bomb.x, bomb.y, bomb.timer, bomb.power]
+        return zlib.crc32(repr(state).encode(), zlib.crc32(self.grid.tobytes()))
+
+    def snapshot(self):
+        """État complet de la simulation, pour y revenir avec restore().
+
+        Copie les tableaux (grille, magasins de bombes et d'explosions) et les attributs des
+        joueurs, sans deepcopy : quelques microsecondes. Les bots et l'affichage n'en font pas partie.
+        """
+        return (self.game_time, self.game_over, self.grid.copy(), self.rng.bit_generator.state,
+                [player.snapshot() for player in self.players], self.bomb_store.snapshot(),
+                self.explosions.snapshot(), self.danger.snapshot())
+
+    def restore(self, snapshot):
+        game_time, game_over, grid, rng_state, players, bombs, explosions, danger = snapshot
+        if self.background is not None:
+            # Cases à redessiner dans le fond
+            ys, xs = np.nonzero(self.grid != grid)
+            self.changed_tiles.update(zip(xs.tolist(), ys.tolist()))
+        self.game_time = game_time
+        self.game_over = game_over
+        self.grid[:] = grid
+        self.rng.bit_generator.state = rng_state
+        for player, state in zip(self.players, players):
+            player.restore(state)
+        self.bomb_store.restore(bombs)
+        self.bombs.rebuild(self.bomb_store)
+        self.explosions.restore(explosions)
+        self.danger.restore(danger)
+        self.world_version += 1
+
+        # Les ticks annulés sont retirés de l'enregistrement : ils seront enregistrés à nouveau
+        if self.recorder is not None:
+            del self.recorder.actions[game_time * self.recorder.n_players:]
+
+    def rematch(self):
+        """Commence la manche suivante sur place.
+
+        Plateau, joueurs, bombes et explosions sont remis à zéro ; images, polices, surfaces,
+        magasins d'entités (avec leur capacité) et bots sont gardés. Le résultat de la manche
+        terminée est ajouté à la série ; une série terminée laisse place à une nouvelle.
+        """
+        if self.series_over:
+            self.rounds = []
+        elif self.game_over:
+            self.rounds.append(self.round_result())
+        if self.recorder is not None:
+            # Un enregistrement ne couvre qu'une manche (une graine, un plateau)
+            self.recorder.finish(self)
+            self.recordings.append(self.recorder)
+
+        # Nouvelle graine tirée de la précédente : la série se rejoue à l'identique
+        self.seed = int(self.rng.integers(2 ** 32))
+        self.rng = np.random.default_rng(self.seed)
+        spawns = spawn_positions(self.width, self.height, len(self.players))
+        self.grid[:] = self.new_grid(spawns)
+        self.bomb_store.clear()
+        self.bomb_store.next_serial = 0
+        self.bombs.clear()
+        self.explosions.clear()
+        self.danger.clear()
+        for player, (x, y) in zip(self.players, spawns):
+            player.reset(x, y)
+            if player.controller is not None:
+                player.controller.reset()
+
+        self.game_over = False
+        self.game_time = 0
+        self.world_version += 1
+        if self.recorder is not None:
+            self.recorder = self.recorder.for_game(self)
+        if self.background is not None:
+            self.build_background()
+        self.emit(MatchStart(self.game_time, self.seed, self.width, self.height, len(self.players)))
+
+    def round_result(self):
+        # Vainqueur (indice du joueur encore en vie, None pour un match nul) et scores de la manche
+        alive = [i for i, player in enumerate(self.players) if player.alive]
+        return (alive[0] if len(alive) == 1 else None), [player.score for player in self.players]
+
+    def standings(self):
+        # Manches gagnées et total des points de chaque joueur dans la série, manche finie comprise
+        rounds = self.rounds + [self.round_result()] if self.game_over else self.rounds
+        wins = [0] * len(self.players)
+        totals = [0] * len(self.players)
+        for winner, scores in rounds:
+            if winner is not None:
+                wins[winner] += 1
+            totals = [total + score for total, score in zip(totals, scores)]
+        return len(rounds), wins, totals
+
+    @property
+    def series_over(self):
+        # Majorité des manches atteinte par un joueur, ou toutes les manches jouées
+        played, wins, _ = self.standings()
+        return played >= self.best_of or max(wins) > self.best_of // 2
 
     def handle_events(self):
         # Gestion des événements
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.VIDEORESIZE:
+                # Nouvelle taille de fenêtre : la disposition suit, la partie continue
+                self.set_config(Config(event.size), pygame.display.get_surface())
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
-
-        # Prise en compte des entrées des joueurs
-        if not self.game_over:
-            keys = pygame.key.get_pressed()
-            for player in self.players:
-                if player.alive:
-                    player.handle_input(keys, self)
+                elif event.key == pygame.K_F3:
+                    # Afficher ou masquer le graphe du profileur
+                    self.profiler.toggle()
+                elif event.key == pygame.K_F4:
+                    # Afficher ou masquer les zones qui vont exploser
+                    self.show_danger = not self.show_danger
+                elif event.key == pygame.K_r and self.game_over and self.rematch_allowed:
+                    # Manche suivante (ou nouvelle série), sans rien recharger
+                    self.rematch()
+
+        # État du clavier, appliqué aux joueurs à chaque tick de simulation
+        self.keys = pygame.key.get_pressed()
 
     def update(self):
         if self.game_over:
@@ -126,15 +425,17 @@ class Bomberman:
                 # Augmenter le temps de survie pour les joueurs en vie
                 player.survival_time += 1
 
-                # Attribuer des points de survie (1 point par seconde)
+                # Attribuer des points de survie (chaque seconde, selon le barème)
                 if self.game_time % FPS == 0:  # Toutes les secondes
-                    player.score += 1
+                    player.score += self.scoring.survival
 
         # Mise à jour des bombes
-        self.update_bombs()
+        with self.profiler.section('update_bombs'):
+            self.update_bombs()
 
         # Mise à jour des explosions
-        self.update_explosions()
+        with self.profiler.section('update_explosions'):
+            self.update_explosions()
 
         # Vérification des conditions de fin de partie
         alive_count = sum(1 for player in self.players if player.alive)
@@ -142,245 +443,442 @@ class Bomberman:
             self.game_over = True
 
             # Bonus pour le gagnant
+            winner = None
             for player in self.players:
                 if player.alive:
-                    player.score += 10000  # Bonus important pour avoir gagné
+                    player.score += self.scoring.win  # Bonus important pour avoir gagné
+                    winner = player.number
+            self.emit(MatchEnd(self.game_time, winner, [player.score for player in self.players]))
 
     # ----------------------------------------
     # MÉTHODES DE GESTION DES BOMBES ET EXPLOSIONS
     # ----------------------------------------
+    def add_bomb(self, bomb):
+        # Poser une bombe : l'index des bombes et la grille restent synchronisés
+        self.bombs.add(bomb)
+        self.set_tile(bomb.x, bomb.y, TileType.BOMB)
+        self.danger.add_bomb(bomb, self.grid, self.game_time)
+
+    def remove_bomb(self, bomb):
+        self.bombs.remove(bomb)
+        self.danger.remove_bomb(bomb)
+        if self.grid[bomb.y, bomb.x] == BOMB:
+            self.set_tile(bomb.x, bomb.y, TileType.EMPTY)
+        self.bomb_store.release(bomb)
+
     def update_bombs(self):
-        # Mise à jour des bombes et détection des explosions
-        for bomb in self.bombs[:]:
-            bomb.timer -= 1
-            if bomb.timer <= 0:
-                self.explode_bomb(bomb)
-                self.bombs.remove(bomb)
+        # Mise à jour des bombes : celles qui arrivent à zéro explosent ensemble
+        due = self.bomb_store.tick()
+        if due:
+            self.resolve_explosions(due)
 
     def explode_bomb(self, bomb):
-        x, y = bomb.x, bomb.y
-
-        # Retirer la bombe de la grille
-        if self.grid[y][x] == TileType.BOMB:
-            self.grid[y][x] = TileType.EMPTY
-
-        # Décrémenter le compteur de bombes actives du joueur
-        if bomb.owner:
-            bomb.owner.active_bombs -= 1
-
-        # Créer une explosion au centre
-        self.add_explosion(x, y, 2.0)  # La durée est en secondes
-
-        # Propager l'explosion dans les 4 directions
-        for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:  # Haut, Droite, Bas, Gauche
-            for i in range(1, bomb.power + 1):
-                nx, ny = x + dx * i, y + dy * i
-
-                # Vérifier si la position est dans la grille
-                if 0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT:
-                    tile_type = self.grid[ny][nx]
-
-                    if tile_type == TileType.WALL:
-                        # L'explosion est bloquée par un mur fixe
-                        break
-                    elif tile_type == TileType.BLOCK:
-                        # Le bloc est détruit
-                        self.grid[ny][nx] = TileType.EMPTY
-
-                        # Attribuer des points au propriétaire de la bombe pour avoir détruit un bloc
-                        if bomb.owner:
-                            bomb.owner.blocks_destroyed += 1
-                            bomb.owner.score += 100  # 100 points par bloc détruit
-
-                        # Chance de spawner un power-up
-                        if random.random() < 0.3:
-                            # Choisir aléatoirement un type de power-up
-                            power_up_type = random.choice([
-                                TileType.POWER_UP_BOMB,
-                                TileType.POWER_UP_FLAME,
-                                TileType.POWER_UP_SPEED
-                            ])
-                            self.grid[ny][nx] = power_up_type
-
-                        # L'explosion est bloquée après avoir détruit un bloc
-                        self.add_explosion(nx, ny, 2.0)
-                        break
-                    elif tile_type == TileType.BOMB:
-                        # Déclencher une réaction en chaîne
-                        for other_bomb in self.bombs[:]:
-                            if other_bomb.x == nx and other_bomb.y == ny:
-                                self.explode_bomb(other_bomb)
-                                if other_bomb in self.bombs:
-                                    self.bombs.remove(other_bomb)
-                                break
-
-                    # Ajouter une explosion à cette position
-                    self.add_explosion(nx, ny, 2.0)
-
-    def add_explosion(self, x, y, duration):
-        # Ajouter une explosion à la liste
-        self.explosions.append(Explosion(x, y, duration))
+        # Faire exploser immédiatement une bombe, réactions en chaîne comprises
+        self.resolve_explosions([bomb])
+
+    def resolve_explosions(self, bombs):
+        """Fait exploser un lot de bombes et toutes celles touchées en chaîne, en une seule passe.
+
+        Les bombes touchées sont ajoutées à une liste de travail au lieu d'un appel récursif.
+        Chaque case touchée ne reçoit qu'une explosion, attribuée à la première bombe qui
+        l'atteint. Les blocs touchés, les joueurs éliminés et les points d'élimination sont
+        traités une seule fois, à la fin.
+        """
+        blast = {}  # (x, y) -> propriétaire de la bombe qui a touché la case
+        blocks = {}  # (x, y) -> propriétaire de la bombe qui a touché le bloc
+        pending = deque(bombs)
+        first = set(bombs)  # Les autres bombes explosent par réaction en chaîne
+        starter = player_number(bombs[0].owner)
+        detonated = 0
+
+        # Responsable de l'explosion qui menace chaque joueur d'après la carte des dangers,
+        # lu avant que les bombes soient retirées
+        threats = {}
+        for player in self.players:
+            if player.alive and self.danger.detonation[player.grid_y, player.grid_x] <= self.game_time:
+                threats[player] = self.danger.owner_at(player.grid_x, player.grid_y)
+
+        while pending:
+            bomb = pending.popleft()
+            # Une bombe peut être touchée par plusieurs rayons : elle n'explose qu'une fois
+            if bomb not in self.bombs:
+                continue
+
+            # Retirer la bombe de la grille, de l'index et du magasin
+            x, y, power, owner = bomb.x, bomb.y, bomb.power, bomb.owner
+            self.emit(Detonation(self.game_time, player_number(owner), x, y, power, bomb not in first))
+            self.remove_bomb(bomb)
+            detonated += 1
+
+            # Explosion au centre puis dans les 4 directions (haut, droite, bas, gauche) ;
+            # les rayons s'arrêtent aux murs fixes et sur le premier bloc touché
+            blast.setdefault((x, y), owner)
+            xs, ys = blast_rays(self.grid, x, y, power)
+            for nx, ny in zip(xs.tolist(), ys.tolist()):
+                tile_type = self.grid[ny, nx]
+                if tile_type == BLOCK:
+                    # Le bloc reste en place jusqu'à la fin : il arrête aussi les autres rayons
+                    blocks.setdefault((nx, ny), owner)
+                elif tile_type == BOMB:
+                    # Déclencher une réaction en chaîne
+                    pending.append(self.bombs.at(nx, ny))
+                blast.setdefault((nx, ny), owner)
+
+        if detonated > len(first):
+            self.emit(Chain(self.game_time, starter, detonated, len(blast)))
+
+        for (x, y), owner in blocks.items():
+            self.destroy_block(x, y, owner)
+
+        # Une seule explosion par case
+        for (x, y), owner in blast.items():
+            self.add_explosion(x, y, EXPLOSION_DURATION, owner)
 
         # Vérifier si des joueurs sont touchés par l'explosion
         for player in self.players:
-            if player.alive and player.grid_x == x and player.grid_y == y:
+            tile = (player.grid_x, player.grid_y)
+            if player.alive and tile in blast:
                 player.alive = False
 
-                # Trouver quel joueur a posé la bombe qui a tué ce joueur
-                for bomb in self.bombs:
-                    if bomb.owner and bomb.owner != player:  # Ne pas attribuer de points pour suicide
-                        # Points pour avoir éliminé un adversaire
-                        bomb.owner.score += 5000  # Bonus important pour avoir éliminé un adversaire
+                # Points pour le joueur qui a posé la bombe (pas de points pour un suicide)
+                owner = threats.get(player, blast[tile])
+                self.emit(Kill(self.game_time, player_number(owner), player.number))
+                if owner and owner is not player:
+                    owner.score += self.scoring.kill  # Bonus important pour avoir éliminé un adversaire
+
+    def destroy_block(self, x, y, owner):
+        # Le bloc est détruit : les rayons des bombes qui s'arrêtaient sur lui vont plus loin
+        self.set_tile(x, y, TileType.EMPTY)
+        self.danger.open_tile(x, y, self.grid)
+        self.emit(BlockDestroyed(self.game_time, player_number(owner), x, y))
+
+        # Attribuer des points au propriétaire de la bombe pour avoir détruit un bloc
+        if owner:
+            owner.blocks_destroyed += 1
+            owner.score += self.scoring.block  # Points par bloc détruit
+
+        # Chance de spawner un power-up
+        if self.rng.random() < POWER_UP_CHANCE:
+            # Choisir aléatoirement un type de power-up
+            power_up_types = [
+                TileType.POWER_UP_BOMB,
+                TileType.POWER_UP_FLAME,
+                TileType.POWER_UP_SPEED
+            ]
+            power_up = power_up_types[self.rng.integers(len(power_up_types))]
+            self.set_tile(x, y, power_up)
+            self.emit(PowerUpSpawned(self.game_time, x, y, power_up.name))
+
+    def add_explosion(self, x, y, duration, owner=None):
+        # Une case déjà en feu est ravivée plutôt que de recevoir une deuxième explosion
+        return self.explosions.create(x, y, duration, owner)
 
     def update_explosions(self):
         # Mise à jour des explosions et suppression de celles qui sont terminées
-        for explosion in self.explosions[:]:
-            explosion.update()
-            if explosion.is_finished():
-                self.explosions.remove(explosion)
+        self.explosions.tick()
 
     # ----------------------------------------
     # MÉTHODES D'AFFICHAGE
     # ----------------------------------------
-    def draw(self):
+    def draw(self, alpha=1.0):
+        # alpha : position entre le tick précédent (0) et le tick courant (1) pour l'interpolation
+        if self.background is not None:
+            self.draw_dirty(alpha)
+            return
+
         # Effacer l'écran
         self.screen.fill(BLACK)
 
+        # Placer la caméra ; seules les cases visibles sont dessinées
+        self.follow_players()
+        x0, y0, x1, y1 = self.camera.visible_tiles()
+
         # Dessiner la grille
-        self.draw_grid()
+        with self.profiler.section('draw_grid'):
+            self.draw_grid()
 
-        # Dessiner les bombes
-        for bomb in self.bombs:
-            bomb.draw(self.screen, self.offset_x, self.offset_y)
+        # Dessiner les bombes puis les explosions
+        self.draw_sprites(x0, y0, x1, y1)
 
-        # Dessiner les explosions
-        for explosion in self.explosions:
-            explosion.draw(self.screen, self.offset_x, self.offset_y)
+        # Zones qui vont exploser (touche F4)
+        if self.show_danger:
+            self.draw_danger()
 
-        # Dessiner les joueurs
+        # Dessiner les joueurs (une case de marge : ils sont souvent entre deux cases)
         for player in self.players:
-            if player.alive:
-                player.draw(self.screen, self.offset_x, self.offset_y)
+            if player.alive and x0 - 1 <= player.grid_x <= x1 and y0 - 1 <= player.grid_y <= y1:
+                player.draw(self.screen, self.offset_x, self.offset_y, alpha)
 
         # Afficher l'interface utilisateur
-        self.draw_ui()
+        with self.profiler.section('draw_ui'):
+            self.draw_ui()
+        self.profiler.draw(self.screen, self.text_cache)
 
         # Mise à jour de l'affichage
+        with self.profiler.section('display.flip'):
+            pygame.display.flip()
+
+    def follow_players(self):
+        # La caméra suit les joueurs humains en vie, sinon tous les joueurs en vie
+        if not self.camera.scrolls:
+            return
+        alive = [player for player in self.players if player.alive]
+        humans = [player for player in alive if player.controller is None]
+        self.camera.follow([(player.x, player.y) for player in humans or alive])
+        self.offset_x = self.camera.offset_x
+        self.offset_y = self.camera.offset_y
+
+    def build_background(self):
+        # Pré-composer toute la grille dans une surface de la taille de l'écran (gardée d'une
+        # manche à l'autre)
+        if self.background is None or self.background.get_size() != self.screen.get_size():
+            self.background = pygame.Surface(self.screen.get_size()).convert()
+        self.background.fill(BLACK)
+        for y in range(self.height):
+            for x in range(self.width):
+                self.draw_tile(self.background, x, y)
+        self.changed_tiles.clear()
+
+        # La première image est affichée en entier
+        self.screen.blit(self.background, (0, 0))
         pygame.display.flip()
+        self.previous_rects = []
+
+    def draw_dirty(self, alpha=1.0):
+        # Redessiner dans le fond les cases modifiées depuis la dernière image
+        rects = []
+        with self.profiler.section('draw_grid'):
+            for x, y in self.changed_tiles:
+                tile_rect = pygame.Rect(self.offset_x + x * self.tile_size, self.offset_y + y * self.tile_size,
+                                        self.tile_size, self.tile_size)
+                self.background.fill(BLACK, tile_rect)
+                self.draw_tile(self.background, x, y)
+                self.screen.blit(self.background, tile_rect, tile_rect)
+                rects.append(tile_rect)
+            self.changed_tiles.clear()
+
+        # Effacer les éléments mobiles de l'image précédente en recopiant le fond
+        for rect in self.previous_rects:
+            self.screen.blit(self.background, rect, rect)
+        rects.extend(self.previous_rects)
+
+        # Dessiner les éléments mobiles en gardant leurs rectangles
+        frame_rects = self.draw_sprites(0, 0, self.width, self.height, doreturn=True)
+        if self.show_danger:
+            frame_rects.extend(self.draw_danger())
+        for player in self.players:
+            if player.alive:
+                frame_rects.append(player.draw(self.screen, self.offset_x, self.offset_y, alpha))
+        with self.profiler.section('draw_ui'):
+            frame_rects.extend(self.draw_ui())
+        overlay_rect = self.profiler.draw(self.screen, self.text_cache)
+        if overlay_rect is not None:
+            frame_rects.append(overlay_rect)
+        rects.extend(frame_rects)
+
+        # Ne pousser à l'écran que les zones modifiées
+        with self.profiler.section('display.flip'):
+            pygame.display.update(rects)
+        self.previous_rects = frame_rects
+
+    def draw_sprites(self, x0, y0, x1, y1, doreturn=False):
+        # Bombes puis explosions des cases [x0, x1[ x [y0, y1[, copiées depuis l'atlas en un seul
+        # appel ; renvoie leurs rectangles si doreturn
+        tile_size = self.tile_size
+        sheet = self.sprites.sheet
+        blits = []
+        store = self.bomb_store
+        slots = store.slots_in_rect(x0, y0, x1, y1)
+        for x, y, timer in zip(store.x[slots].tolist(), store.y[slots].tolist(), store.timer[slots].tolist()):
+            blits.append((sheet, (self.offset_x + x * tile_size, self.offset_y + y * tile_size),
+                          self.sprites.bomb_area(timer)))
+        store = self.explosions
+        slots = store.slots_in_rect(x0, y0, x1, y1)
+        for x, y, timer, duration in zip(store.x[slots].tolist(), store.y[slots].tolist(),
+                                         store.timer[slots].tolist(), store.duration[slots].tolist()):
+            blits.append((sheet, (self.offset_x + x * tile_size, self.offset_y + y * tile_size),
+                          self.sprites.explosion_area(timer, duration)))
+        return self.screen.blits(blits, doreturn)
 
     def draw_grid(self):
-        # Dessiner la grille de jeu
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                rect = pygame.Rect(
-                    self.offset_x + x * TILE_SIZE,
-                    self.offset_y + y * TILE_SIZE,
-                    TILE_SIZE,
-                    TILE_SIZE
-                )
-
-                if self.grid[y][x] == TileType.EMPTY:
-                    # Utiliser l'image d'herbe si disponible
-                    if self.images and 'grass' in self.images:
-                        self.screen.blit(self.images['grass'], rect)
-                    else:
-                        # Fallback: dessiner un rectangle vert
-                        pygame.draw.rect(self.screen, GREEN, rect)
-                elif self.grid[y][x] == TileType.WALL:
-                    # Utiliser l'image du mur si elle est disponible
-                    if self.images and 'wall' in self.images:
-                        self.screen.blit(self.images['wall'], rect)
-                    else:
-                        # Fallback: dessiner un rectangle gris
-                        pygame.draw.rect(self.screen, GRAY, rect)
-                elif self.grid[y][x] == TileType.BLOCK:
-                    # Utiliser l'image du bloc destructible si disponible
-                    if self.images and 'block' in self.images:
-                        self.screen.blit(self.images['block'], rect)
-                    else:
-                        # Fallback: dessiner un rectangle marron
-                        pygame.draw.rect(self.screen, BROWN, rect)
-                elif self.grid[y][x] == TileType.POWER_UP_BOMB:
-                    pygame.draw.rect(self.screen, GREEN, rect)
-                    pygame.draw.circle(self.screen, ORANGE, rect.center, TILE_SIZE // 3)
-                elif self.grid[y][x] == TileType.POWER_UP_FLAME:
-                    pygame.draw.rect(self.screen, GREEN, rect)
-                    pygame.draw.circle(self.screen, RED, rect.center, TILE_SIZE // 3)
-                elif self.grid[y][x] == TileType.POWER_UP_SPEED:
-                    pygame.draw.rect(self.screen, GREEN, rect)
-                    pygame.draw.circle(self.screen, CYAN, rect.center, TILE_SIZE // 3)
+        # Dessiner les cases visibles de la grille de jeu
+        x0, y0, x1, y1 = self.camera.visible_tiles()
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                self.draw_tile(self.screen, x, y)
+
+    def draw_tile(self, surface, x, y):
+        # Dessiner une case de la grille sur la surface donnée et renvoyer son rectangle
+        tile_size = self.tile_size
+        rect = pygame.Rect(
+            self.offset_x + x * tile_size,
+            self.offset_y + y * tile_size,
+            tile_size,
+            tile_size
+        )
+        tile_type = self.grid[y, x]
+
+        if tile_type == EMPTY:
+            # Utiliser l'image d'herbe si disponible
+            if self.images and 'grass' in self.images:
+                surface.blit(self.images['grass'], rect)
+            else:
+                # Fallback: dessiner un rectangle vert
+                pygame.draw.rect(surface, GREEN, rect)
+        elif tile_type == WALL:
+            # Utiliser l'image du mur si elle est disponible
+            if self.images and 'wall' in self.images:
+                surface.blit(self.images['wall'], rect)
+            else:
+                # Fallback: dessiner un rectangle gris
+                pygame.draw.rect(surface, GRAY, rect)
+        elif tile_type == BLOCK:
+            # Utiliser l'image du bloc destructible si disponible
+            if self.images and 'block' in self.images:
+                surface.blit(self.images['block'], rect)
+            else:
+                # Fallback: dessiner un rectangle marron
+                pygame.draw.rect(surface, BROWN, rect)
+        elif tile_type in self.sprites.power_up_areas:
+            # Fond vert et disque de la couleur du bonus, pré-dessinés dans l'atlas
+            surface.blit(self.sprites.sheet, rect, self.sprites.power_up_areas[tile_type])
+
+        return rect
+
+    def draw_danger(self):
+        # Voile rouge sur les cases menacées, plus opaque quand l'explosion approche
+        if self.danger_surfaces is None:
+            self.danger_surfaces = []
+            for level in range(DANGER_LEVELS):
+                surface = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
+                surface.fill((*RED, 40 + 150 * level // (DANGER_LEVELS - 1)))
+                self.danger_surfaces.append(surface)
+
+        rects = []
+        x0, y0, x1, y1 = self.camera.visible_tiles()
+        ys, xs = np.nonzero(self.danger.detonation[y0:y1, x0:x1] != NEVER)
+        for x, y in zip((xs + x0).tolist(), (ys + y0).tolist()):
+            ticks_left = self.danger.ticks_left(x, y, self.game_time)
+            level = DANGER_LEVELS - 1 - min(ticks_left * DANGER_LEVELS // BOMB_TIMER, DANGER_LEVELS - 1)
+            rects.append(self.screen.blit(self.danger_surfaces[level],
+                                          (self.offset_x + x * self.tile_size, self.offset_y + y * self.tile_size)))
+        return rects
+
+    def render_text(self, text, color, size=None):
+        # Les textes de l'interface passent par le cache : rendus seulement quand ils changent
+        return self.text_cache.render(text, color, 'Arial', size or self.font_size)
 
     def draw_ui(self):
+        # Afficher l'interface et renvoyer les rectangles dessinés
+        rects = []
+        screen_width, screen_height = self.config.screen_size
+
         # Afficher le temps de partie en cours
         if not self.game_over:
             time_text = f"Temps: {self.game_time // FPS}s"
-            time_surface = self.font.render(time_text, True, WHITE)
-            time_rect = time_surface.get_rect(center=(SCREEN_WIDTH // 2, 20))
-            self.screen.blit(time_surface, time_rect)
-
-            # Afficher l'information sur les bonus et scores de chaque joueur
-            player1_info = f"J1: B:{self.players[0].max_bombs} F:{self.players[0].bomb_power} S:{self.players[0].speed} Score:{self.players[0].score}"
-            player2_info = f"J2: B:{self.players[1].max_bombs} F:{self.players[1].bomb_power} S:{self.players[1].speed} Score:{self.players[1].score}"
-
-            player1_text = self.font.render(player1_info, True, RED)
-            player2_text = self.font.render(player2_info, True, BLUE)
-
-            self.screen.blit(player1_text, (10, 10))
-            self.screen.blit(player2_text, (SCREEN_WIDTH - player2_text.get_width() - 10, 10))
+            time_surface = self.render_text(time_text, WHITE)
+            time_rect = time_surface.get_rect(center=(screen_width // 2, 20))
+            rects.append(self.screen.blit(time_surface, time_rect))
+
+            # Afficher l'information sur les bonus et scores de chaque joueur : joueurs impairs
+            # à gauche, pairs à droite, une ligne par paire
+            line_height = self.font_size + 4
+            for i, player in enumerate(self.players):
+                info = f"J{player.number}: B:{player.max_bombs} F:{player.bomb_power} S:{player.speed // SPEED_BONUS} Score:{player.score}"
+                text = self.render_text(info, player.color if player.alive else GRAY)
+                x = 10 if i % 2 == 0 else screen_width - text.get_width() - 10
+                rects.append(self.screen.blit(text, (x, 10 + (i // 2) * line_height)))
 
         # Légende des bonus en bas de l'écran
-        legend_font = pygame.font.SysFont('Arial', int(TILE_SIZE * 0.4))
-        bomb_legend = legend_font.render("Orange = +1 Bombe", True, ORANGE)
-        flame_legend = legend_font.render("Rouge = +1 Puissance", True, RED)
-        speed_legend = legend_font.render("Cyan = +1 Vitesse", True, CYAN)
+        bomb_legend = self.render_text("Orange = +1 Bombe", ORANGE, self.legend_font_size)
+        flame_legend = self.render_text("Rouge = +1 Puissance", RED, self.legend_font_size)
+        speed_legend = self.render_text("Cyan = +1 Vitesse", CYAN, self.legend_font_size)
 
-        self.screen.blit(bomb_legend, (10, SCREEN_HEIGHT - 30))
-        self.screen.blit(flame_legend, (SCREEN_WIDTH // 2 - flame_legend.get_width() // 2, SCREEN_HEIGHT - 30))
-        self.screen.blit(speed_legend, (SCREEN_WIDTH - speed_legend.get_width() - 10, SCREEN_HEIGHT - 30))
+        rects.append(self.screen.blit(bomb_legend, (10, screen_height - 30)))
+        rects.append(self.screen.blit(flame_legend, (screen_width // 2 - flame_legend.get_width() // 2,
+                                                     screen_height - 30)))
+        rects.append(self.screen.blit(speed_legend, (screen_width - speed_legend.get_width() - 10,
+                                                     screen_height - 30)))
 
         # Afficher l'écran de fin de partie si nécessaire
         if self.game_over:
-            self.draw_game_over()
+            rects.extend(self.draw_game_over())
+
+        return rects
 
     def draw_game_over(self):
+        screen_width, screen_height = self.config.screen_size
+        tile_size = self.tile_size
+
         # Déterminer le vainqueur
         winner_text = "Match nul!"
         winner_index = -1
         for i, player in enumerate(self.players):
             if player.alive:
-                winner_text = f"Joueur {i + 1} gagne!"
+                winner_text = f"Joueur {player.number} gagne!"
                 winner_index = i
 
-        text_surface = self.font.render(winner_text, True, WHITE)
-        text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - TILE_SIZE * 2))
+        text_surface = self.render_text(winner_text, WHITE)
+        text_rect = text_surface.get_rect(center=(screen_width // 2, screen_height // 2 - tile_size * 2))
+
+        # Série de manches : manches gagnées et total des points de chaque joueur
+        played, wins, totals = self.standings()
+        series_over = self.series_over
 
         # Afficher les scores finaux
         scores_text = []
         for i, player in enumerate(self.players):
-            color = RED if i == 0 else BLUE
-            stats = f"Joueur {i + 1}: {player.score} points"
+            color = player.color
+            stats = f"Joueur {player.number}: {player.score} points"
+            if self.best_of > 1:
+                stats += f" (total {totals[i]}, manches gagnées: {wins[i]})"
             details = f"(Blocs: {player.blocks_destroyed}, Power-ups: {player.powerups_collected}, Temps: {player.survival_time // FPS}s)"
-            scores_text.append(self.font.render(stats, True, color))
-            scores_text.append(self.font.render(details, True, color))
 
             # Ajouter une couronne au vainqueur
             if winner_index == i:
-                scores_text[len(scores_text) - 2] = self.font.render(f"👑 {stats}", True, color)
-
-        # Positionner les textes
-        score_y = SCREEN_HEIGHT // 2 - TILE_SIZE
+                stats = f"👑 {stats}"
+
+            scores_text.append(self.render_text(stats, color))
+            scores_text.append(self.render_text(details, color))
+
+        # Positionner les textes (lignes resserrées quand il y a beaucoup de joueurs)
+        rects = []
+        line_step = tile_size if len(self.players) <= 2 else self.font_size + 4
+        score_y = screen_height // 2 - tile_size
+        if len(self.players) > 2:
+            score_y = max(screen_height // 2 - len(scores_text) * line_step // 2, tile_size * 3)
+            text_rect.centery = score_y - tile_size
         for text in scores_text:
-            score_rect = text.get_rect(center=(SCREEN_WIDTH // 2, score_y))
-            self.screen.blit(text, score_rect)
-            score_y += TILE_SIZE
-
-        restart_text = self.font.render("Appuyez sur R pour recommencer", True, WHITE)
-        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, score_y + TILE_SIZE))
+            score_rect = text.get_rect(center=(screen_width // 2, score_y))
+            rects.append(self.screen.blit(text, score_rect))
+            score_y += line_step
+
+        if self.best_of > 1:
+            # Au-dessus du vainqueur de la manche : avancement ou vainqueur de la série
+            if series_over:
+                leader = max(range(len(self.players)), key=lambda i: (wins[i], totals[i]))
+                series_text = f"Joueur {self.players[leader].number} remporte la série!"
+            else:
+                series_text = f"Manche {played} sur {self.best_of}"
+            series_surface = self.render_text(series_text, WHITE)
+            rects.append(self.screen.blit(series_surface, series_surface.get_rect(
+                center=(screen_width // 2, text_rect.centery - tile_size))))
+
+        if self.best_of > 1 and not series_over:
+            restart_label = "Appuyez sur R pour la manche suivante"
+        elif self.best_of > 1:
+            restart_label = "Appuyez sur R pour une nouvelle série"
+        else:
+            restart_label = "Appuyez sur R pour recommencer"
+        restart_text = self.render_text(restart_label, WHITE)
+        restart_rect = restart_text.get_rect(center=(screen_width // 2, score_y + tile_size))
 
         # Texte pour quitter
-        quit_text = self.font.render("Appuyez sur Échap pour quitter", True, WHITE)
-        quit_rect = quit_text.get_rect(center=(SCREEN_WIDTH // 2, score_y + TILE_SIZE * 2))
-
-        self.screen.blit(text_surface, text_rect)
-        self.screen.blit(restart_text, restart_rect)
-        self.screen.blit(quit_text, quit_rect)
+        quit_text = self.render_text("Appuyez sur Échap pour quitter", WHITE)
+        quit_rect = quit_text.get_rect(center=(screen_width // 2, score_y + tile_size * 2))
+
+        rects.append(self.screen.blit(text_surface, text_rect))
+        if self.rematch_allowed:
+            rects.append(self.screen.blit(restart_text, restart_rect))
+        rects.append(self.screen.blit(quit_text, quit_rect))
+        return rects
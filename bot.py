@@ -0,0 +1,235 @@
+"""Joueurs contrôlés par l'ordinateur.
+
+Un BotController remplace le clavier pour un joueur : à chaque tick il renvoie une action
+ACTION_*. La planification (champ de distances par parcours en largeur, choix d'un objectif)
+n'est refaite que lorsque la grille change ou que le bot change de case ; entre deux, le bot
+se contente de suivre son chemin, ce qui ne coûte presque rien.
+"""
+from collections import deque
+
+import numpy as np
+
+from contantes import *
+from danger import NEVER
+from grid import *
+
+WALKABLE = (EMPTY, POWER_UP_BOMB, POWER_UP_FLAME, POWER_UP_SPEED)
+
+
+class WorldView:
+    """Données de planification tirées de la partie, partagées par tous les bots.
+
+    Recalculées seulement quand la grille change (pose ou explosion d'une bombe, bloc détruit,
+    power-up ramassé). Les ticks d'explosion viennent de la carte des dangers de la partie.
+    """
+
+    def __init__(self):
+        self.version = None
+        self.tiles = []  # Grille aplatie, en liste Python (accès plus rapide qu'au tableau numpy)
+        self.detonation = []  # Tick de la prochaine explosion de chaque case (NEVER : aucune)
+        self.near_block = b''  # 1 pour les cases voisines d'un bloc destructible
+        self.safe = b''  # 1 pour les cases praticables qui ne vont pas exploser
+
+    def refresh(self, game):
+        if self.version == game.world_version:
+            return
+        self.version = game.world_version
+        self.tiles = game.grid.ravel().tolist()
+        self.detonation = game.danger.detonation.ravel().tolist()
+
+        blocks = game.grid == BLOCK
+        near = np.zeros_like(blocks)
+        near[1:] |= blocks[:-1]
+        near[:-1] |= blocks[1:]
+        near[:, 1:] |= blocks[:, :-1]
+        near[:, :-1] |= blocks[:, 1:]
+        self.near_block = near.ravel().tobytes()
+
+        safe = np.isin(game.grid, WALKABLE) & (game.danger.detonation == NEVER)
+        self.safe = bytearray(safe.ravel().tobytes())
+
+
+class BotController:
+    def __init__(self, player, view=None, aggression=0.5, safety_margin=10, seed=None):
+        self.player = player
+        self.view = view if view is not None else WorldView()
+        self.aggression = aggression  # Probabilité de chasser un adversaire plutôt que des blocs
+        self.safety_margin = safety_margin  # Ticks de marge pour quitter une zone d'explosion
+        self.rng = np.random.default_rng(seed)
+
+        self.reset()
+
+    def reset(self):
+        # Oublier le plan en cours (nouvelle manche)
+        self.plan_key = None
+        self.path = []
+        self.bomb_now = False
+
+    # ----------------------------------------
+    # DÉCISION À CHAQUE TICK
+    # ----------------------------------------
+    def next_action(self, game):
+        player = self.player
+        if not player.alive:
+            return ACTION_NONE
+
+        self.view.refresh(game)
+        width = game.grid.shape[1]
+        here = player.grid_y * width + player.grid_x
+
+        # Replanifier seulement si le monde a changé ou si le bot a changé de case
+        # (ou, sans chemin à suivre, une fois par seconde pour ne pas rester bloqué)
+        key = (game.world_version, here)
+        if key != self.plan_key or (not self.path and game.game_time % TICK_RATE == 0):
+            self.plan_key = key
+            self.plan(game, here)
+
+        action = ACTION_NONE
+        if self.bomb_now:
+            self.bomb_now = False
+            action = ACTION_BOMB
+
+        while self.path and self.path[0] == here:
+            self.path.pop(0)
+        if self.path:
+            action |= self.steer(self.path[0], width)
+        elif self.view.detonation[here] != NEVER:
+            # Pas d'issue trouvée : au moins rester centré sur la case
+            action |= self.steer(here, width)
+        return action
+
+    def steer(self, target, width):
+        # Direction vers le centre de la case cible, en s'alignant d'abord sur l'autre axe
+        player = self.player
+        tile_size = self.player.tile_size
+        target_x = (target % width) * tile_size + tile_size // 2
+        target_y = (target // width) * tile_size + tile_size // 2
+        dx = target_x - player.x
+        dy = target_y - player.y
+        tolerance = -(-player.speed // TICK_RATE)  # Pixels parcourus en un tick au plus
+
+        if abs(dx) >= abs(dy):
+            if abs(dy) >= tolerance:
+                return ACTION_DOWN if dy > 0 else ACTION_UP
+            if dx:
+                return ACTION_RIGHT if dx > 0 else ACTION_LEFT
+        else:
+            if abs(dx) >= tolerance:
+                return ACTION_RIGHT if dx > 0 else ACTION_LEFT
+            if dy:
+                return ACTION_DOWN if dy > 0 else ACTION_UP
+        return ACTION_NONE
+
+    # ----------------------------------------
+    # PLANIFICATION
+    # ----------------------------------------
+    def plan(self, game, here):
+        tiles = self.view.tiles
+        width = game.grid.shape[1]
+        danger = self.view.detonation
+        self.path = []
+
+        # 1. Sur une case qui va exploser : aller vers la case sûre la plus proche
+        if danger[here] != NEVER:
+            self.path = self.escape_path(tiles, width, here, danger, game)
+            return
+
+        # 2. Poser une bombe si elle touche un bloc ou un adversaire et qu'une fuite existe
+        if game.bombs.count(self.player) < self.player.max_bombs and tiles[here] == EMPTY:
+            cells = self.bomb_cells(game, width, here)
+            if self.worth_bombing(game, tiles, width, cells):
+                detonation = game.game_time + BOMB_TIMER
+                blast = list(danger)
+                for cell in cells:
+                    blast[cell] = min(blast[cell], detonation)
+                escape = self.escape_path(tiles, width, here, blast, game)
+                if escape:
+                    self.bomb_now = True
+                    self.path = escape
+                    return
+
+        # 3. Sinon aller vers un objectif : power-up, adversaire ou case d'où détruire un bloc
+        reachable, parents = self.distance_field(width, here)
+        goal = self.choose_goal(game, tiles, width, here, reachable)
+        if goal is not None:
+            self.path = self.build_path(parents, here, goal)
+
+    def distance_field(self, width, start):
+        # Parcours en largeur sur les cases sûres : cases atteignables par distance croissante,
+        # et case précédente de chacune pour reconstruire le chemin
+        unvisited = bytearray(self.view.safe)
+        unvisited[start] = 0
+        parents = {}
+        order = [start]
+        for cell in order:
+            for neighbour in (cell - width, cell + 1, cell + width, cell - 1):
+                if unvisited[neighbour]:
+                    unvisited[neighbour] = 0
+                    parents[neighbour] = cell
+                    order.append(neighbour)
+        return order, parents
+
+    def escape_path(self, tiles, width, here, danger, game):
+        # Chemin vers la case hors danger la plus proche, atteignable avant les explosions
+        ticks_per_tile = self.player.tile_size * TICK_RATE / max(self.player.speed, 1)
+        distances = {here: 0}
+        parents = {}
+        queue = deque([here])
+        while queue:
+            cell = queue.popleft()
+            if danger[cell] == NEVER:
+                return self.build_path(parents, here, cell)
+            distance = distances[cell] + 1
+            for neighbour in (cell - width, cell + 1, cell + width, cell - 1):
+                if neighbour in distances or tiles[neighbour] not in WALKABLE:
+                    continue
+                # Ne pas traverser une case qui explosera avant notre passage
+                arrival = game.game_time + distance * ticks_per_tile + self.safety_margin
+                if danger[neighbour] <= arrival:
+                    continue
+                distances[neighbour] = distance
+                parents[neighbour] = cell
+                queue.append(neighbour)
+        return []
+
+    def bomb_cells(self, game, width, here):
+        # Cases que toucherait une bombe posée ici par le bot
+        xs, ys = blast_rays(game.grid, self.player.grid_x, self.player.grid_y, self.player.bomb_power)
+        return [here] + (ys * width + xs).tolist()
+
+    def worth_bombing(self, game, tiles, width, cells):
+        if any(tiles[cell] == BLOCK for cell in cells):
+            return True
+        return any(other.alive and other is not self.player and other.grid_y * width + other.grid_x in cells
+                   for other in game.players)
+
+    def choose_goal(self, game, tiles, width, here, reachable):
+        # Les cases atteignables sont par distance croissante : la première trouvée est la plus proche
+        near_block = self.view.near_block
+        nearest_block = None
+        for cell in reachable:
+            if tiles[cell] != EMPTY:
+                return cell  # Power-up
+            if nearest_block is None and near_block[cell]:
+                nearest_block = cell
+
+        opponents = [(other.grid_x, other.grid_y) for other in game.players
+                     if other.alive and other is not self.player]
+        if opponents and (nearest_block is None or self.rng.random() < self.aggression):
+            # Se rapprocher de l'adversaire : la case atteignable la plus proche de lui
+            cells = np.array(reachable)
+            xs, ys = cells % width, cells // width
+            gap = np.min([np.abs(xs - x) + np.abs(ys - y) for x, y in opponents], axis=0)
+            goal = int(cells[gap.argmin()])
+            if goal != here:
+                return goal
+        return nearest_block
+
+    def build_path(self, parents, start, goal):
+        path = []
+        cell = goal
+        while cell != start:
+            path.append(cell)
+            cell = parents[cell]
+        path.reverse()
+        return path
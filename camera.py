@@ -0,0 +1,45 @@
+class Camera:
+    """Partie visible du plateau.
+
+    Quand le plateau tient dans la vue, il est centré et ne bouge pas (comme avant les grandes
+    cartes). Sinon la caméra suit les joueurs et reste dans les limites du plateau. offset_x et
+    offset_y sont la position à l'écran du coin haut-gauche du plateau : toutes les méthodes
+    draw les reçoivent déjà.
+    """
+
+    def __init__(self, view_width, view_height, grid_width, grid_height, tile_size):
+        self.view_width = view_width
+        self.view_height = view_height
+        self.tile_size = tile_size
+        self.world_width = grid_width * tile_size
+        self.world_height = grid_height * tile_size
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.offset_x = (view_width - self.world_width) // 2
+        self.offset_y = (view_height - self.world_height) // 2
+
+    @property
+    def scrolls(self):
+        return self.world_width > self.view_width or self.world_height > self.view_height
+
+    def follow(self, points):
+        # Centrer la vue sur le milieu des points donnés (positions en pixels du plateau)
+        if not points:
+            return
+        center_x = sum(x for x, _ in points) // len(points)
+        center_y = sum(y for _, y in points) // len(points)
+        if self.world_width > self.view_width:
+            left = min(max(center_x - self.view_width // 2, 0), self.world_width - self.view_width)
+            self.offset_x = -left
+        if self.world_height > self.view_height:
+            top = min(max(center_y - self.view_height // 2, 0), self.world_height - self.view_height)
+            self.offset_y = -top
+
+    def visible_tiles(self):
+        # Cases au moins en partie visibles : (x0, y0, x1, y1), x1 et y1 exclus
+        tile = self.tile_size
+        x0 = max(-self.offset_x // tile, 0)
+        y0 = max(-self.offset_y // tile, 0)
+        x1 = min((self.view_width - self.offset_x + tile - 1) // tile, self.grid_width)
+        y1 = min((self.view_height - self.offset_y + tile - 1) // tile, self.grid_height)
+        return x0, y0, x1, y1
@@ -0,0 +1,11 @@
+# Outils partagés par les lignes de commande (main.py, server.py, maps.py...).
+import argparse
+
+
+def map_size(text):
+    # « 41x31 » -> (41, 31)
+    try:
+        width, height = (int(value) for value in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"taille de plateau invalide: {text} (attendu LARGEURxHAUTEUR)")
+    return width, height
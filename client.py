@@ -0,0 +1,195 @@
+"""Client léger du serveur de jeu : affiche la partie reçue du serveur et lui envoie les actions.
+
+Le client ne simule rien : il tient une copie de la partie (une instance Bomberman qui n'avance
+jamais d'elle-même) mise à jour par les messages du serveur, et la dessine avec les méthodes
+draw habituelles. Avec --bot, le joueur est contrôlé par un bot et le client peut tourner sans
+écran (utile pour tester un serveur avec des clients locaux).
+
+Utilisation : python client.py [--host 127.0.0.1] [--port 7777] [--room nom] [--bot] [--headless]
+(sur une machine sans écran, lancer avec SDL_VIDEODRIVER=dummy)
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+import numpy as np
+import pygame
+
+from bomberman import Bomberman
+from contantes import *
+from grid import BLOCK
+from protocol import DEFAULT_PORT, MAX_MESSAGE_SIZE, encode
+
+
+class GameMirror:
+    """Copie locale d'une partie du serveur, mise à jour par les messages « snapshot » et « delta »."""
+
+    def __init__(self, screen=None):
+        self.screen = screen
+        self.game = Bomberman(screen)
+        self.bombs = {}  # Numéro de pose côté serveur -> bombe locale
+        self.scale = 1.0  # Taille des cases locale / taille des cases du serveur
+
+    def apply(self, message):
+        if message['type'] == 'snapshot':
+            self.load(message)
+        elif message['type'] == 'delta':
+            self.update(message)
+
+    def load(self, message):
+        # État complet : tout remplacer ; nouvelle partie si le plateau ou les joueurs diffèrent
+        n_players = len(message['players'])
+        if (message['height'], message['width']) != self.game.grid.shape or n_players != len(self.game.players):
+            self.game = Bomberman(self.screen, width=message['width'], height=message['height'],
+                                  n_players=n_players)
+        game = self.game
+        game.rematch_allowed = False  # Les manches sont lancées par le serveur
+        game.bombs.clear()
+        game.bomb_store.clear()
+        game.explosions.clear()
+        game.danger.clear()
+        self.bombs.clear()
+        self.scale = game.tile_size / message['tile_size']
+
+        game.grid = np.array(message['grid'], np.uint8).reshape(message['height'], message['width'])
+        game.world_version += 1
+        game.game_time = message['tick']
+        game.game_over = message['game_over']
+        for index, state in enumerate(message['players']):
+            self.set_player(game.players[index], state)
+        for bomb in message['bombs']:
+            self.add_bomb(*bomb)
+        for explosion in message['explosions']:
+            self.add_explosion(*explosion)
+
+    def update(self, message):
+        game = self.game
+        elapsed = message['tick'] - game.game_time
+        game.game_time = message['tick']
+        game.game_over = message['game_over']
+
+        # Les minuteurs sont décomptés localement, le serveur ne les renvoie pas
+        for store in (game.bomb_store, game.explosions):
+            np.subtract(store.timer, elapsed, out=store.timer, where=store.active)
+
+        for serial in message.get('bombs_removed', ()):
+            game.remove_bomb(self.bombs.pop(serial))
+        for x, y in message.get('explosions_removed', ()):
+            game.explosions.release(game.explosions.at(x, y))
+        for x, y, tile in message.get('tiles', ()):
+            opened = game.grid[y, x] == BLOCK
+            game.set_tile(x, y, tile)
+            if opened:
+                game.danger.open_tile(x, y, game.grid)
+        for bomb in message.get('bombs', ()):
+            self.add_bomb(*bomb)
+        for explosion in message.get('explosions', ()):
+            self.add_explosion(*explosion)
+
+        # Position précédente gardée pour interpoler l'affichage
+        for player in game.players:
+            player.previous_x, player.previous_y = player.x, player.y
+        for index, state in message.get('players', {}).items():
+            self.set_player(game.players[int(index)], state)
+
+    def set_player(self, player, state):
+        x, y, player.alive, player.score, player.speed, player.max_bombs, player.bomb_power = state
+        player.x = round(x * self.scale)
+        player.y = round(y * self.scale)
+        player.grid_x = player.x // player.tile_size
+        player.grid_y = player.y // player.tile_size
+
+    def add_bomb(self, serial, x, y, power, timer, owner):
+        game = self.game
+        bomb = game.bomb_store.create(x, y, power, game.players[owner] if owner >= 0 else None)
+        bomb.timer = timer
+        game.add_bomb(bomb)
+        self.bombs[serial] = bomb
+
+    def add_explosion(self, x, y, timer, duration):
+        explosion = self.game.explosions.create(x, y, 0)
+        explosion.duration = duration
+        explosion.timer = timer
+
+
+async def play(host='127.0.0.1', port=DEFAULT_PORT, room='default', screen=None, bot=False, max_ticks=None):
+    """Rejoint une salle et joue jusqu'à la fermeture (ou max_ticks ticks) ; renvoie la copie locale.
+
+    Avec un écran, les actions viennent du clavier (touches du joueur attribué) ; avec bot=True,
+    elles viennent d'un bot qui décide à partir de la copie locale.
+    """
+    reader, writer = await asyncio.open_connection(host, port, limit=MAX_MESSAGE_SIZE)
+    writer.write(encode({'type': 'join', 'room': room}))
+    welcome = json.loads(await reader.readline())
+    if welcome['type'] != 'welcome':
+        writer.close()
+        raise ConnectionError(welcome.get('message', "Connexion refusée"))
+
+    # Le premier état complet fixe la taille du plateau et le nombre de joueurs
+    mirror = GameMirror(screen)
+    mirror.apply(json.loads(await reader.readline()))
+    game = mirror.game
+    index = welcome['player']
+    controller = game.add_bot(index) if bot else None
+    sent_action = ACTION_NONE
+    ticks = 0
+
+    def send_action(action):
+        # Le serveur garde la dernière action reçue : n'envoyer que les changements
+        nonlocal sent_action
+        if action != sent_action:
+            sent_action = action
+            writer.write(encode({'type': 'input', 'action': action}))
+
+    async def receive():
+        nonlocal ticks
+        while max_ticks is None or ticks < max_ticks:
+            line = await reader.readline()
+            if not line:
+                break
+            message = json.loads(line)
+            mirror.apply(message)
+            if message['type'] == 'delta':
+                ticks += 1
+                if controller is not None:
+                    send_action(controller.next_action(game))
+
+    receiver = asyncio.create_task(receive())
+    try:
+        if screen is None:
+            await receiver
+        while not receiver.done():
+            game.handle_events()
+            if not game.running:
+                break
+            if controller is None:
+                send_action(game.players[index].read_action(game.keys))
+            game.draw()
+            await asyncio.sleep(1.0 / RENDER_FPS)
+    finally:
+        receiver.cancel()
+        writer.close()
+    return mirror
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Client Bomberman en réseau")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--room", default="default")
+    parser.add_argument("--bot", action="store_true", help="laisser un bot jouer à la place du clavier")
+    parser.add_argument("--headless", action="store_true", help="sans affichage (avec --bot)")
+    args = parser.parse_args()
+
+    screen = None if args.headless else pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    try:
+        asyncio.run(play(args.host, args.port, args.room, screen, args.bot or args.headless))
+    except (ConnectionError, KeyboardInterrupt) as error:
+        print(error)
+    pygame.quit()
+    sys.exit()
+
+
+if __name__ == "__main__":
+    main()
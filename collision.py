@@ -0,0 +1,152 @@
+"""Collisions des joueurs avec le décor et les bombes.
+
+La grille est résumée dans un tableau d'octets, un par case : SOLID pour un mur ou un bloc,
+BOMB_CELL pour une bombe, 0 pour une case libre. Il est tenu à jour case par case par
+Bomberman.set_tile, et reconstruit en une opération quand la grille a été remplacée d'un coup
+(retour en arrière, chargement d'un état).
+
+Un déplacement est découpé en sous-pas d'au plus le rayon de collision : même très rapide, un
+joueur ne peut pas traverser un obstacle. Quand un sous-pas est bloqué, le joueur avance
+jusqu'au contact (recherche dichotomique) au lieu de s'arrêter avant. Bloqué contre un coin
+alors qu'il est presque aligné sur un couloir libre, il glisse vers le centre du couloir.
+Aucun objet n'est créé pendant un déplacement.
+"""
+import numpy as np
+
+from grid import BLOCK, BOMB, WALL
+
+SOLID = 1
+BOMB_CELL = 2
+CORNER_SLIDE = 0.35  # Écart au centre du couloir (en fraction de case) encore corrigé en glissant
+
+# Type de case -> drapeaux de collision
+CELL_FLAGS = np.zeros(256, np.uint8)
+CELL_FLAGS[[WALL, BLOCK]] = SOLID
+CELL_FLAGS[BOMB] = BOMB_CELL
+
+
+class CollisionMap:
+    def __init__(self, tile_size, width, height):
+        self.tile_size = tile_size
+        self.width = width
+        self.height = height
+        self.cells = bytearray(width * height)
+        self.version = None  # world_version de la partie au dernier passage en revue de la grille
+
+        # Mêmes dimensions que Player et Bomb
+        player_radius = tile_size // 2 - 8
+        bomb_radius = tile_size // 2 - 5
+        self.radius = int(player_radius * 0.6)  # Rayon de collision (60% du rayon réel)
+        self.bomb_clearance_sq = (player_radius * 0.6 + bomb_radius * 0.8) ** 2
+        self.max_step = max(self.radius, 1)
+        self.slide = int(tile_size * CORNER_SLIDE)
+
+    def refresh(self, game):
+        # Reconstruire le tableau si la grille a changé sans passer par set_tile
+        if self.version != game.world_version:
+            self.cells[:] = CELL_FLAGS[game.grid].tobytes()
+            self.version = game.world_version
+
+    def set_tile(self, x, y, tile_type, version):
+        # Une case modifiée : mise à jour directe si le tableau était à jour juste avant
+        if self.version == version - 1:
+            self.cells[y * self.width + x] = CELL_FLAGS[tile_type]
+            self.version = version
+
+    # ----------------------------------------
+    # TESTS DE COLLISION
+    # ----------------------------------------
+    def blocked(self, x, y, own_cell):
+        # Le cercle de collision centré en (x, y) touche-t-il un obstacle ? Aux quatre points
+        # cardinaux, comme avant ; la bombe de la case own_cell (celle du joueur) est ignorée
+        r = self.radius
+        return (self.probe(x - r, y, x, y, own_cell) or self.probe(x + r, y, x, y, own_cell)
+                or self.probe(x, y - r, x, y, own_cell) or self.probe(x, y + r, x, y, own_cell))
+
+    def probe(self, point_x, point_y, x, y, own_cell):
+        tile_size = self.tile_size
+        grid_x = point_x // tile_size
+        grid_y = point_y // tile_size
+        if grid_x < 0 or grid_y < 0 or grid_x >= self.width or grid_y >= self.height:
+            return True
+        cell = grid_y * self.width + grid_x
+        flags = self.cells[cell]
+        if not flags:
+            return False
+        if flags & SOLID:
+            return True
+        if cell == own_cell:
+            return False
+
+        # Corps de la bombe : distance au centre de la case, comparée au carré
+        dx = grid_x * tile_size + tile_size // 2 - x
+        dy = grid_y * tile_size + tile_size // 2 - y
+        return dx * dx + dy * dy < self.bomb_clearance_sq
+
+    # ----------------------------------------
+    # DÉPLACEMENT
+    # ----------------------------------------
+    def move(self, player, dx, dy):
+        # Un axe après l'autre, comme avant ; glissement dans les coins si l'axe est bloqué
+        own_cell = player.grid_y * self.width + player.grid_x
+        if dx:
+            travelled = self.sweep(player, dx, 0, own_cell)
+            if travelled < abs(dx):
+                self.slide_corner(player, dx, 0, abs(dx) - travelled, own_cell)
+        if dy:
+            travelled = self.sweep(player, 0, dy, own_cell)
+            if travelled < abs(dy):
+                self.slide_corner(player, 0, dy, abs(dy) - travelled, own_cell)
+
+    def sweep(self, player, dx, dy, own_cell):
+        # Avancer de (dx, dy) (un seul axe) par sous-pas ; renvoie la distance parcourue
+        step_x = (dx > 0) - (dx < 0)
+        step_y = (dy > 0) - (dy < 0)
+        distance = abs(dx + dy)
+        x, y = player.x, player.y
+        travelled = 0
+        while travelled < distance:
+            advance = min(self.max_step, distance - travelled)
+            if self.blocked(x + step_x * advance, y + step_y * advance, own_cell):
+                # Obstacle dans ce sous-pas : avancer jusqu'au contact
+                low, high = 0, advance
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self.blocked(x + step_x * middle, y + step_y * middle, own_cell):
+                        high = middle
+                    else:
+                        low = middle
+                x += step_x * low
+                y += step_y * low
+                travelled += low
+                break
+            x += step_x * advance
+            y += step_y * advance
+            travelled += advance
+        player.x, player.y = x, y
+        return travelled
+
+    def slide_corner(self, player, dx, dy, remaining, own_cell):
+        # Bloqué en allant vers (dx, dy) : si la case suivante sur la ligne (ou colonne) du joueur
+        # est libre et qu'il en est proche du centre, le rapprocher de ce centre
+        tile_size = self.tile_size
+        grid_x = player.x // tile_size
+        grid_y = player.y // tile_size
+        next_x = grid_x + (dx > 0) - (dx < 0)
+        next_y = grid_y + (dy > 0) - (dy < 0)
+        if not (0 <= next_x < self.width and 0 <= next_y < self.height):
+            return
+        if self.cells[next_y * self.width + next_x]:
+            return
+
+        if dx:
+            offset = grid_y * tile_size + tile_size // 2 - player.y
+        else:
+            offset = grid_x * tile_size + tile_size // 2 - player.x
+        if offset == 0 or abs(offset) > self.slide:
+            return
+        nudge = min(remaining, abs(offset)) * ((offset > 0) - (offset < 0))
+        if dx:
+            self.sweep(player, 0, nudge, own_cell)
+        else:
+            self.sweep(player, nudge, 0, own_cell)
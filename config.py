@@ -0,0 +1,65 @@
+"""Configuration de l'affichage : taille de l'écran et des cases.
+
+Rien n'est calculé à l'import : la taille de l'écran n'est demandée à SDL que lorsqu'elle est
+lue pour la première fois, et seulement si elle n'a pas été donnée. Une partie reçoit sa
+configuration (Bomberman(..., config=...)) ; une nouvelle configuration peut lui être donnée
+en cours de partie (Bomberman.set_config) pour changer de résolution sans redémarrer.
+"""
+import pygame
+
+from rules import GRID_WIDTH, GRID_HEIGHT
+
+
+class Config:
+    def __init__(self, screen_size=None, tile_size=None, grid_width=GRID_WIDTH, grid_height=GRID_HEIGHT):
+        # screen_size : (largeur, hauteur) en pixels, par défaut la taille du bureau ;
+        # tile_size : taille des cases, par défaut la plus grande qui fait tenir le plateau
+        # de grid_width x grid_height cases à l'écran
+        self._screen_size = screen_size
+        self._tile_size = tile_size
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+
+    @property
+    def screen_size(self):
+        if self._screen_size is None:
+            if not pygame.display.get_init():
+                pygame.display.init()
+            info = pygame.display.Info()
+            self._screen_size = (info.current_w, info.current_h)
+        return self._screen_size
+
+    @property
+    def screen_width(self):
+        return self.screen_size[0]
+
+    @property
+    def screen_height(self):
+        return self.screen_size[1]
+
+    @property
+    def tile_size(self):
+        if self._tile_size is None:
+            # Prendre la plus petite dimension pour les cases carrées
+            self._tile_size = min(self.screen_width // self.grid_width, self.screen_height // self.grid_height)
+        return self._tile_size
+
+    @property
+    def width(self):
+        # Largeur du plateau par défaut en pixels
+        return self.tile_size * self.grid_width
+
+    @property
+    def height(self):
+        return self.tile_size * self.grid_height
+
+
+_default = None
+
+
+def get_config():
+    # Configuration par défaut (écran entier), créée au premier appel
+    global _default
+    if _default is None:
+        _default = Config()
+    return _default
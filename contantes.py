@@ -1,9 +1,12 @@
-from enum import Enum
-import pygame
-
-pygame.init()
+from rules import *
 
 IMAGE_PATH = "assets/"  # Dossier où vous stockerez vos images
+ASSET_CACHE_PATH = ".cache/assets/"  # Images déjà mises à la taille des cases (voir assets.py)
+
+# Affichage, découplé de la simulation (voir TICK_RATE)
+RENDER_FPS = 60  # Limite d'images par seconde (0 = sans limite)
+MAX_FRAME_TIME = 0.25  # Retard maximal rattrapé en une image, en secondes
+STARTUP_BUDGET = 1.0  # Durée visée du lancement à la première image, en secondes
 
 # Couleurs
 WHITE = (255, 255, 255)
@@ -17,37 +20,31 @@ BROWN = (139, 69, 19)
 PURPLE = (128, 0, 128)
 ORANGE = (255, 165, 0)
 CYAN = (0, 255, 255)
-
-
-# Création de la classe Enum pour les types de cases
-class TileType(Enum):
-    EMPTY = 0
-    WALL = 1
-    BLOCK = 2
-    BOMB = 3
-    EXPLOSION = 4
-    POWER_UP_BOMB = 5
-    POWER_UP_FLAME = 6
-    POWER_UP_SPEED = 7
-
-
-# Constantes du jeu
-FPS = 60
-
-# Obtenir les dimensions de l'écran
-info = pygame.display.Info()
-SCREEN_WIDTH = info.current_w
-SCREEN_HEIGHT = info.current_h
-
-# Définir la taille du plateau avec des proportions appropriées
-GRID_WIDTH = 21
-GRID_HEIGHT = 17
-
-# Calculer la taille des cases pour s'adapter à l'écran
-TILE_SIZE_W = SCREEN_WIDTH // GRID_WIDTH
-TILE_SIZE_H = SCREEN_HEIGHT // GRID_HEIGHT
-TILE_SIZE = min(TILE_SIZE_W, TILE_SIZE_H)  # Prendre la plus petite dimension pour les cases carrées
-
-# Recalculer les dimensions du plateau
-WIDTH = TILE_SIZE * GRID_WIDTH
-HEIGHT = TILE_SIZE * GRID_HEIGHT
+PINK = (255, 105, 180)
+NAVY = (0, 0, 128)
+TEAL = (0, 128, 128)
+MAROON = (128, 0, 0)
+OLIVE = (128, 128, 0)
+
+# Couleur de chaque joueur, dans l'ordre (les deux premières sont celles du jeu original)
+PLAYER_COLORS = (RED, BLUE, YELLOW, PURPLE, ORANGE, CYAN, WHITE, PINK,
+                 NAVY, TEAL, MAROON, OLIVE, BROWN, GRAY, (255, 215, 0), (192, 192, 192))
+
+# Dimensions de l'écran et des cases : calculées à la demande par config.py (aucun appel à SDL
+# à l'import). Ces noms restent lisibles ici (contantes.TILE_SIZE) pour les anciens scripts,
+# mais ne sont pas exportés par « from contantes import * » : le code du jeu passe par la
+# configuration de la partie.
+_LAYOUT = {
+    'SCREEN_WIDTH': lambda config: config.screen_width,
+    'SCREEN_HEIGHT': lambda config: config.screen_height,
+    'TILE_SIZE': lambda config: config.tile_size,
+    'WIDTH': lambda config: config.width,
+    'HEIGHT': lambda config: config.height,
+}
+
+
+def __getattr__(name):
+    if name in _LAYOUT:
+        from config import get_config
+        return _LAYOUT[name](get_config())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
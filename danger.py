@@ -0,0 +1,171 @@
+import numpy as np
+
+from grid import *
+
+NEVER = np.iinfo(np.int64).max  # Case qu'aucune bombe posée n'atteint
+
+
+class DangerMap:
+    """Carte des cases menacées par les bombes posées.
+
+    Pour chaque case : le tick de la prochaine explosion qui l'atteint (réactions en chaîne
+    comprises) et le joueur qui a posé la bombe responsable. La carte est tenue à jour au fil
+    des événements (pose, explosion, bloc détruit) au lieu d'être recalculée : seules les cases
+    des rayons concernés sont revues.
+
+    Quand deux bombes atteignent une case au même tick, elle est attribuée à celle qui aurait
+    explosé d'elle-même le plus tôt (la bombe qui déclenche la réaction en chaîne), puis à la
+    première posée, comme dans Bomberman.resolve_explosions.
+    """
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        self.width = width
+        self.cells_detonation = np.full((height, width), NEVER, np.int64)
+        self.cells_owner = np.full((height, width), None, object)
+        self.version = 0  # Incrémenté à chaque modification
+        # Cases à recalculer : une explosion en chaîne retire beaucoup de bombes d'un coup,
+        # les cases ne sont recalculées qu'une fois, à la lecture suivante
+        self.dirty = set()
+
+        self.rays = {}  # Bombe -> cases aplaties que son explosion atteint, la sienne comprise
+        self.ticks = {}  # Bombe -> tick de son explosion
+        self.ranks = {}  # Bombe -> tick d'explosion sans réaction en chaîne puis ordre de pose, en un entier
+        self.bomb_at = {}  # Case aplatie -> bombe posée
+        self.covering = {}  # Case aplatie -> bombes dont l'explosion atteint la case
+
+    @property
+    def detonation(self):
+        # Tableau (hauteur, largeur) du tick de la prochaine explosion de chaque case
+        if self.dirty:
+            self.refresh()
+        return self.cells_detonation
+
+    @property
+    def owner(self):
+        # Tableau (hauteur, largeur) du joueur responsable de cette explosion
+        if self.dirty:
+            self.refresh()
+        return self.cells_owner
+
+    def __contains__(self, tile):
+        x, y = tile
+        return self.detonation[y, x] != NEVER
+
+    def ticks_left(self, x, y, game_time):
+        # Ticks avant que la case (x, y) soit touchée, ou None si aucune bombe ne l'atteint
+        tick = self.detonation[y, x]
+        return None if tick == NEVER else int(tick) - game_time
+
+    def owner_at(self, x, y):
+        return self.owner[y, x]
+
+    def clear(self):
+        self.cells_detonation.fill(NEVER)
+        self.cells_owner.fill(None)
+        self.dirty.clear()
+        self.rays.clear()
+        self.ticks.clear()
+        self.ranks.clear()
+        self.bomb_at.clear()
+        self.covering.clear()
+        self.version += 1
+
+    def snapshot(self):
+        # Les listes de rayons ne sont jamais modifiées sur place : elles peuvent être partagées
+        return (self.cells_detonation.copy(), self.cells_owner.copy(), dict(self.rays), dict(self.ticks),
+                dict(self.ranks), dict(self.bomb_at), {cell: set(bombs) for cell, bombs in self.covering.items()},
+                set(self.dirty))
+
+    def restore(self, snapshot):
+        detonation, owner, rays, ticks, ranks, bomb_at, covering, dirty = snapshot
+        self.cells_detonation[:] = detonation
+        self.cells_owner[:] = owner
+        self.rays, self.ticks, self.ranks, self.bomb_at = dict(rays), dict(ticks), dict(ranks), dict(bomb_at)
+        self.covering = {cell: set(bombs) for cell, bombs in covering.items()}
+        self.dirty = set(dirty)
+        self.version += 1
+
+    # ----------------------------------------
+    # ÉVÉNEMENTS
+    # ----------------------------------------
+    def add_bomb(self, bomb, grid, game_time):
+        # Une bombe posée sur une case déjà menacée explosera au plus tard avec elle
+        cell = bomb.y * self.width + bomb.x
+        own_tick = game_time + bomb.timer
+        self.bomb_at[cell] = bomb
+        self.ranks[bomb] = own_tick << 24 | (bomb.serial & 0xFFFFFF)
+        threat = min((self.ticks[other] for other in self.covering.get(cell, ())), default=NEVER)
+        self.ticks[bomb] = min(own_tick, threat)
+        self.cover(bomb, grid)
+        self.dirty.update(self.rays[bomb])
+        self.propagate([bomb])
+
+    def remove_bomb(self, bomb):
+        # La bombe a explosé (ou a été retirée) : revoir les cases qu'elle menaçait
+        self.uncover(bomb)
+        del self.bomb_at[bomb.y * self.width + bomb.x]
+        del self.ticks[bomb]
+        del self.ranks[bomb]
+
+    def open_tile(self, x, y, grid):
+        # Un bloc détruit laisse passer les rayons qui s'arrêtaient sur lui
+        bombs = list(self.covering.get(y * self.width + x, ()))
+        if not bombs:
+            return
+        for bomb in bombs:
+            self.uncover(bomb)
+            self.cover(bomb, grid)
+            self.dirty.update(self.rays[bomb])
+        self.propagate(bombs)
+
+    # ----------------------------------------
+    # MISE À JOUR INCRÉMENTALE
+    # ----------------------------------------
+    def cover(self, bomb, grid):
+        xs, ys = blast_rays(grid, bomb.x, bomb.y, bomb.power)
+        cells = [bomb.y * self.width + bomb.x] + (ys * self.width + xs).tolist()
+        self.rays[bomb] = cells
+        for cell in cells:
+            self.covering.setdefault(cell, set()).add(bomb)
+
+    def uncover(self, bomb):
+        cells = self.rays.pop(bomb)
+        for cell in cells:
+            covering = self.covering[cell]
+            covering.discard(bomb)
+            if not covering:
+                del self.covering[cell]
+        self.dirty.update(cells)
+
+    def propagate(self, bombs):
+        # Les bombes atteintes par une explosion plus précoce explosent avec elle
+        pending = list(bombs)
+        while pending:
+            bomb = pending.pop()
+            tick = self.ticks[bomb]
+            for cell in self.rays[bomb]:
+                other = self.bomb_at.get(cell)
+                if other is not None and self.ticks[other] > tick:
+                    self.ticks[other] = tick
+                    self.dirty.update(self.rays[other])
+                    pending.append(other)
+
+    def refresh(self):
+        # Recalculer les cases modifiées à partir des bombes qui les atteignent
+        ticks, ranks = self.ticks, self.ranks
+        cells = list(self.dirty)
+        detonation = []
+        owners = []
+        for cell in cells:
+            bombs = self.covering.get(cell)
+            if bombs:
+                bomb = min(bombs, key=lambda b: (ticks[b], ranks[b]))
+                detonation.append(ticks[bomb])
+                owners.append(bomb.owner)
+            else:
+                detonation.append(NEVER)
+                owners.append(None)
+        self.cells_detonation.flat[cells] = detonation
+        self.cells_owner.flat[cells] = owners
+        self.dirty.clear()
+        self.version += 1
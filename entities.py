@@ -0,0 +1,130 @@
+import numpy as np
+
+
+class EntityField:
+    """Attribut d'une entité, lu et écrit dans la colonne correspondante de son magasin."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, entity, owner=None):
+        if entity is None:
+            return self
+        return getattr(entity.store, self.name).item(entity.slot)
+
+    def __set__(self, entity, value):
+        getattr(entity.store, self.name)[entity.slot] = value
+
+
+class ObjectField(EntityField):
+    """Attribut contenant un objet Python (ex. le joueur propriétaire), stocké dans une liste."""
+
+    def __get__(self, entity, owner=None):
+        if entity is None:
+            return self
+        return getattr(entity.store, self.name)[entity.slot]
+
+
+class EntityStore:
+    """Magasin d'entités en structure de tableaux.
+
+    Chaque champ numérique est un tableau numpy contigu indexé par emplacement, ce qui permet
+    de mettre à jour toutes les entités en une opération. Les emplacements libérés sont
+    réutilisés (liste libre) et chaque emplacement a une poignée créée une seule fois : créer
+    ou détruire une entité n'alloue donc aucun objet. La capacité double quand elle est pleine.
+    """
+
+    fields = {}  # Nom -> type numpy
+    object_fields = ()
+    entity_class = None
+
+    def __init__(self, capacity=32):
+        self.capacity = 0
+        self.active = np.zeros(0, bool)
+        for name, dtype in self.fields.items():
+            setattr(self, name, np.zeros(0, dtype))
+        for name in self.object_fields:
+            setattr(self, name, [])
+        self.entities = []
+        self.free = []
+        self.live = {}  # Emplacement -> entité, dans l'ordre de création
+        self.grow(capacity)
+
+    def __len__(self):
+        return len(self.live)
+
+    def __iter__(self):
+        return iter(self.live.values())
+
+    def grow(self, capacity):
+        # Agrandir les colonnes en gardant les entités existantes à leur emplacement
+        for name in ('active', *self.fields):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, column.dtype)
+            grown[:self.capacity] = column
+            setattr(self, name, grown)
+        for name in self.object_fields:
+            getattr(self, name).extend([None] * (capacity - self.capacity))
+
+        self.entities.extend(self.entity_class(self, slot) for slot in range(self.capacity, capacity))
+        # Les plus petits emplacements sont pris en premier
+        self.free[:0] = range(capacity - 1, self.capacity - 1, -1)
+        self.capacity = capacity
+
+    def acquire(self):
+        if not self.free:
+            self.grow(self.capacity * 2)
+        slot = self.free.pop()
+        self.active[slot] = True
+        entity = self.entities[slot]
+        self.live[slot] = entity
+        return entity
+
+    def release(self, entity):
+        slot = entity.slot
+        if not self.active[slot]:
+            raise ValueError(f"Emplacement {slot} déjà libre")
+        self.active[slot] = False
+        for name in self.object_fields:
+            getattr(self, name)[slot] = None
+        del self.live[slot]
+        self.free.append(slot)
+
+    def clear(self):
+        # Libérer toutes les entités en gardant la capacité et les poignées
+        self.active[:] = False
+        for name in self.object_fields:
+            column = getattr(self, name)
+            column[:] = [None] * len(column)
+        self.live.clear()
+        self.free = list(range(self.capacity - 1, -1, -1))
+
+    def snapshot(self):
+        # Copie des colonnes et de l'allocation des emplacements, pour un retour en arrière
+        columns = [getattr(self, name).copy() for name in ('active', *self.fields)]
+        objects = [list(getattr(self, name)) for name in self.object_fields]
+        return self.capacity, columns, objects, list(self.live), list(self.free)
+
+    def restore(self, snapshot):
+        # Les poignées restent les mêmes : une entité revient sur son emplacement d'origine
+        capacity, columns, objects, live, free = snapshot
+        if capacity > self.capacity:
+            self.grow(capacity)
+        for name, column in zip(('active', *self.fields), columns):
+            getattr(self, name)[:capacity] = column
+            getattr(self, name)[capacity:] = 0
+        for name, column in zip(self.object_fields, objects):
+            getattr(self, name)[:] = column + [None] * (self.capacity - capacity)
+        self.live = {slot: self.entities[slot] for slot in live}
+        self.free = list(range(self.capacity - 1, capacity - 1, -1)) + free
+
+    def slots_in_rect(self, x0, y0, x1, y1):
+        # Emplacements des entités dont la case est dans le rectangle [x0, x1[ x [y0, y1[ (vue de
+        # la caméra), pour lire leurs colonnes sans passer par les poignées
+        inside = self.active & (self.x >= x0) & (self.x < x1) & (self.y >= y0) & (self.y < y1)
+        return np.flatnonzero(inside)
+
+    def countdown(self):
+        # Décompte de tous les minuteurs actifs en une opération ; renvoie les emplacements arrivés à zéro
+        np.subtract(self.timer, 1, out=self.timer, where=self.active)
+        return np.flatnonzero(self.active & (self.timer <= 0))
@@ -0,0 +1,110 @@
+"""Événements d'une partie et journal des événements.
+
+La partie publie ses événements sur un bus (Bomberman.events) : bombe posée, explosion, réaction
+en chaîne, bloc détruit, power-up apparu ou ramassé, élimination (attribuée au poseur de la
+bombe) et fin de partie. Chaque événement est un tuple nommé dont le premier champ est le tick ;
+les joueurs y sont désignés par leur numéro (1, 2...), None pour personne.
+
+EventLog écrit les événements en JSONL depuis un thread d'arrière-plan : le thread du jeu ne
+fait que les déposer dans une file bornée, sans jamais attendre le disque. Si la file est
+pleine (disque trop lent), les événements en trop sont comptés puis abandonnés.
+
+Utilisation : log = EventLog("partie.jsonl"); game.events.subscribe(log.write) ... log.close()
+"""
+import json
+import queue
+import threading
+from collections import namedtuple
+
+MatchStart = namedtuple('MatchStart', 'tick seed width height players')
+ImagesLoaded = namedtuple('ImagesLoaded', 'tick tile_size error')  # error : None si chargées
+BombPlaced = namedtuple('BombPlaced', 'tick player x y power')
+Detonation = namedtuple('Detonation', 'tick player x y power chained')  # chained : déclenchée par une autre
+Chain = namedtuple('Chain', 'tick player bombs cells')  # Réaction en chaîne : bombes et cases touchées
+BlockDestroyed = namedtuple('BlockDestroyed', 'tick player x y')
+PowerUpSpawned = namedtuple('PowerUpSpawned', 'tick x y power_up')
+PowerUpCollected = namedtuple('PowerUpCollected', 'tick player x y power_up total')  # total : nouvelle valeur
+Kill = namedtuple('Kill', 'tick player victim')  # player : poseur de la bombe (victim pour un suicide)
+MatchEnd = namedtuple('MatchEnd', 'tick winner scores')
+
+EVENT_TYPES = (MatchStart, ImagesLoaded, BombPlaced, Detonation, Chain, BlockDestroyed, PowerUpSpawned,
+               PowerUpCollected, Kill, MatchEnd)
+
+QUEUE_SIZE = 8192  # Événements en attente d'écriture au plus
+BATCH_SIZE = 512  # Événements écrits en une fois
+
+
+def player_number(player):
+    return player.number if player is not None else None
+
+
+def to_record(event):
+    # {"event": "Kill", "tick": 120, "player": 1, "victim": 2}
+    return {'event': type(event).__name__, **event._asdict()}
+
+
+class EventBus:
+    def __init__(self):
+        self.handlers = []
+
+    def subscribe(self, handler):
+        # handler(event) est appelé pour chaque événement, sur le thread du jeu : il doit être rapide
+        self.handlers.append(handler)
+        return handler
+
+    def unsubscribe(self, handler):
+        self.handlers.remove(handler)
+
+    def emit(self, event):
+        for handler in self.handlers:
+            handler(event)
+
+
+class EventLog:
+    def __init__(self, path, queue_size=QUEUE_SIZE, batch_size=BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self.queue = queue.Queue(queue_size)
+        self.written = 0
+        self.dropped = 0
+        self.file = open(path, "w")
+        self.thread = threading.Thread(target=self.run, name="EventLog", daemon=True)
+        self.thread.start()
+
+    def write(self, event):
+        # Appelé par le jeu : déposer l'événement sans attendre
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def run(self):
+        # Thread d'écriture : attendre un événement, prendre ceux qui suivent et écrire le lot
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            done = batch[-1] is None  # Fin du journal (close)
+            if done:
+                batch.pop()
+            if batch:
+                self.file.write("".join(json.dumps(to_record(event)) + "\n" for event in batch))
+                self.file.flush()
+                self.written += len(batch)
+            if done:
+                return
+
+    def close(self):
+        # Écrire les événements en attente puis fermer le fichier
+        self.queue.put(None)
+        self.thread.join()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
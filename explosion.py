@@ -1,13 +1,26 @@
-import pygame
+import numpy as np
 from contantes import *
+from entities import EntityField, EntityStore, ObjectField
+
 
 class Explosion:
-    def __init__(self, x, y, duration):
-        self.x = x
-        self.y = y
-        self.duration = duration * FPS  # Convertir en frames
+    # Poignée vers un emplacement de ExplosionStore
+    __slots__ = ('store', 'slot')
+
+    x = EntityField()
+    y = EntityField()
+    timer = EntityField()
+    duration = EntityField()
+    owner = ObjectField()  # Joueur dont la bombe a provoqué l'explosion
+
+    def __init__(self, store, slot):
+        self.store = store
+        self.slot = slot
+
+    def reset(self, duration, owner=None):
+        self.duration = int(duration * FPS)  # Convertir en frames
         self.timer = self.duration
-        self.max_radius = TILE_SIZE // 2
+        self.owner = owner
 
     def update(self):
         self.timer -= 1
@@ -15,17 +28,43 @@ class Explosion:
     def is_finished(self):
         return self.timer <= 0
 
-    def draw(self, screen, offset_x, offset_y):
-        # Calculer la taille de l'explosion en fonction du temps restant
-        progress = self.timer / self.duration
-        radius = int(self.max_radius * progress)
-
-        # Dessiner l'explosion (cercle jaune qui rétrécit)
-        rect = pygame.Rect(
-            offset_x + self.x * TILE_SIZE,
-            offset_y + self.y * TILE_SIZE,
-            TILE_SIZE,
-            TILE_SIZE
-        )
-        pygame.draw.circle(screen, YELLOW, rect.center, radius)
-        pygame.draw.circle(screen, RED, rect.center, radius // 2)
+
+class ExplosionStore(EntityStore):
+    fields = {'x': np.int32, 'y': np.int32, 'timer': np.int32, 'duration': np.int32}
+    object_fields = ('owner',)
+    entity_class = Explosion
+
+    def __init__(self, capacity=128):
+        super().__init__(capacity)
+        self.by_tile = {}  # (x, y) -> explosion en cours sur la case
+
+    def at(self, x, y):
+        return self.by_tile.get((x, y))
+
+    def create(self, x, y, duration, owner=None):
+        # Une case déjà en feu est ravivée plutôt que de recevoir une deuxième explosion
+        explosion = self.by_tile.get((x, y))
+        if explosion is None:
+            explosion = self.acquire()
+            self.x[explosion.slot] = x
+            self.y[explosion.slot] = y
+            self.by_tile[(x, y)] = explosion
+        explosion.reset(duration, owner)
+        return explosion
+
+    def release(self, explosion):
+        del self.by_tile[(explosion.x, explosion.y)]
+        super().release(explosion)
+
+    def clear(self):
+        super().clear()
+        self.by_tile.clear()
+
+    def restore(self, snapshot):
+        super().restore(snapshot)
+        self.by_tile = {(explosion.x, explosion.y): explosion for explosion in self}
+
+    def tick(self):
+        # Décompte de toutes les explosions et suppression de celles qui sont terminées
+        for slot in self.countdown().tolist():
+            self.release(self.entities[slot])
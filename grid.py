@@ -0,0 +1,110 @@
+# Grille du plateau sous forme de tableau numpy uint8 (une case = un octet).
+# Les valeurs sont celles de TileType ; dans les boucles chaudes on compare avec les entiers
+# ci-dessous plutôt qu'avec les membres de l'Enum, bien plus lents à comparer à un scalaire numpy.
+from functools import lru_cache
+
+import numpy as np
+
+from rules import *
+
+EMPTY = TileType.EMPTY.value
+WALL = TileType.WALL.value
+BLOCK = TileType.BLOCK.value
+BOMB = TileType.BOMB.value
+POWER_UP_BOMB = TileType.POWER_UP_BOMB.value
+POWER_UP_FLAME = TileType.POWER_UP_FLAME.value
+POWER_UP_SPEED = TileType.POWER_UP_SPEED.value
+
+# Haut, Droite, Bas, Gauche
+DIRECTIONS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+RAY_DX = np.array([dx for dx, _ in DIRECTIONS])
+RAY_DY = np.array([dy for _, dy in DIRECTIONS])
+RAY_INDEX = np.arange(len(DIRECTIONS))
+
+
+def free_coordinate(value):
+    # Coordonnée impaire la plus proche en dessous : jamais sur un pilier (pilier = x et y pairs)
+    return value if value % 2 else value - 1
+
+
+def spawn_positions(width, height, count=4):
+    """Cases de départ de count joueurs.
+
+    Les deux coins du jeu original, puis les deux autres coins, le milieu des bords et enfin
+    des cases réparties sur le plateau.
+    """
+    right, bottom = free_coordinate(width - 2), free_coordinate(height - 2)
+    middle_x, middle_y = free_coordinate(width // 2), free_coordinate(height // 2)
+    positions = [(1, 1), (right, bottom), (right, 1), (1, bottom),
+                 (middle_x, 1), (middle_x, bottom), (1, middle_y), (right, middle_y)]
+
+    # Au-delà : grille régulière de cases libres, de plus en plus serrée
+    step = max(width, height)
+    while len(positions) < count and step > 2:
+        step //= 2
+        for y in range(1, height - 1, step):
+            for x in range(1, width - 1, step):
+                position = (free_coordinate(x), free_coordinate(y))
+                if position not in positions:
+                    positions.append(position)
+    if len(positions) < count:
+        raise ValueError(f"Plateau {width}x{height} trop petit pour {count} joueurs")
+    return positions[:count]
+
+
+def grid_template(width, height):
+    # Murs fixes : bords de la grille et motif classique de Bomberman
+    ys, xs = np.mgrid[0:height, 0:width]
+    border = (xs == 0) | (ys == 0) | (xs == width - 1) | (ys == height - 1)
+    pillars = (xs % 2 == 0) & (ys % 2 == 0)
+    return np.where(border | pillars, WALL, EMPTY).astype(np.uint8)
+
+
+def block_mask(template, spawns):
+    # Cases où un bloc destructible peut apparaître (libres, hors des coins de départ)
+    allowed = template == EMPTY
+    for x, y in spawns:
+        allowed[max(y - 1, 0):y + 2, max(x - 1, 0):x + 2] = False
+    return allowed
+
+
+def generate_grids(rng, count, width=GRID_WIDTH, height=GRID_HEIGHT, spawns=None):
+    # Génère count plateaux d'un coup, de forme (count, height, width)
+    if spawns is None:
+        spawns = spawn_positions(width, height, 2)
+    template = grid_template(width, height)
+    grids = np.repeat(template[None], count, axis=0)
+    grids[(rng.random(grids.shape) < BLOCK_DENSITY) & block_mask(template, spawns)] = BLOCK
+    return grids
+
+
+def create_grid(rng, width=GRID_WIDTH, height=GRID_HEIGHT, spawns=None):
+    return generate_grids(rng, 1, width, height, spawns)[0]
+
+
+@lru_cache(maxsize=None)
+def ray_offsets(width, power):
+    # Décalages (dans la grille aplatie) des cases de chaque rayon, de forme (4, power)
+    steps = np.arange(1, power + 1)
+    return (RAY_DY[:, None] * width + RAY_DX[:, None]) * steps, steps
+
+
+def blast_rays(grid, x, y, power):
+    """Cases atteintes par une explosion en (x, y) dans les quatre directions.
+
+    Renvoie les coordonnées (xs, ys), direction par direction et de la plus proche à la plus
+    lointaine. Un rayon s'arrête avant un mur et sur le premier bloc, qui est inclus. Le plateau
+    étant entouré de murs fixes, un rayon ne sort jamais de la grille.
+    """
+    width = grid.shape[1]
+    offsets, steps = ray_offsets(width, power)
+    cells = offsets + (y * width + x)
+    tiles = grid.take(cells, mode='clip')
+
+    # Longueur de chaque rayon : jusqu'au premier obstacle, le bloc détruit compris
+    stops = (tiles == WALL) | (tiles == BLOCK)
+    length = np.where(stops.any(axis=1), stops.argmax(axis=1), power)
+    length += (length < power) & (tiles[RAY_INDEX, np.minimum(length, power - 1)] == BLOCK)
+
+    cells = cells[steps <= length[:, None]]
+    return cells % width, cells // width
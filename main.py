@@ -1,15 +1,100 @@
+import time
+
+STARTED = time.perf_counter()  # Lancement, pour mesurer le temps jusqu'à la première image
+
+import argparse
+import os
 import pygame
 import sys
-from bomberman import Bomberman
+import serialization
+from bomberman import Bomberman, KEY_BINDINGS
+from cli import map_size
+from events import EventBus, EventLog
+from maps import load_pool
+from contantes import GRID_WIDTH, GRID_HEIGHT
+from profiler import FrameProfiler, StartupTimer
+from replay import InputRecorder
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Bomberman")
+    parser.add_argument("--dirty-rects", action="store_true", help="ne redessiner que les zones modifiées")
+    parser.add_argument("--seed", type=int, help="graine de la partie (aléatoire par défaut)")
+    parser.add_argument("--record", metavar="FICHIER", help="enregistrer les entrées pour relecture")
+    parser.add_argument("--profile", metavar="FICHIER",
+                        help="mesurer chaque image et exporter les mesures à la sortie (.csv ou .json)")
+    parser.add_argument("--bot", type=int, action="append", default=[], metavar="JOUEUR",
+                        help="confier le joueur (1, 2...) à l'ordinateur ; option répétable")
+    parser.add_argument("--players", type=int, default=2,
+                        help="nombre de joueurs ; au-delà de deux, les joueurs sans touches sont des bots")
+    parser.add_argument("--map", type=map_size, default=(GRID_WIDTH, GRID_HEIGHT), metavar="LxH",
+                        help="taille du plateau, impaire (ex. 41x31, jusqu'à 128x128)")
+    parser.add_argument("--best-of", type=int, default=1, metavar="N",
+                        help="série de N manches au plus (touche R entre les manches)")
+    parser.add_argument("--events", metavar="FICHIER",
+                        help="journal des événements de la partie (JSONL, écrit en arrière-plan)")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="afficher la durée de chaque étape du démarrage")
+    args = parser.parse_args()
+    for number in args.bot:
+        if not 1 <= number <= args.players:
+            parser.error(f"argument --bot: joueur {number} inexistant (1 à {args.players})")
+
+    startup = StartupTimer(STARTED)
+    startup.mark('imports')
+    pygame.init()
+    startup.mark('pygame.init')
     screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-    game = Bomberman(screen)
-    game.run()
+    startup.mark('display')
+    profiler = FrameProfiler() if args.profile else None
+    width, height = args.map
+    events = EventBus()
+    event_log = EventLog(args.events) if args.events else None
+    if event_log is not None:
+        events.subscribe(event_log.write)
+    # Plateau pris dans la réserve de plateaux validés s'il en existe une pour cette partie
+    maps = load_pool(width, height, args.players)
+    game = Bomberman(screen, dirty_rects=args.dirty_rects, seed=args.seed, profiler=profiler,
+                     width=width, height=height, n_players=args.players, events=events, maps=maps,
+                     best_of=args.best_of)
+    for number in set(args.bot) | set(range(len(KEY_BINDINGS) + 1, args.players + 1)):
+        game.add_bot(number - 1)
+    if args.record:
+        game.recorder = InputRecorder.for_game(game)
+    startup.mark('game')
+    game.startup = startup
+
+    try:
+        game.run()
+    except Exception:
+        # Garder l'état de la partie pour pouvoir reproduire le plantage (serialization.loads)
+        path = f"crash-{time.strftime('%Y%m%d-%H%M%S')}.bmstate"
+        with open(path, "wb") as file:
+            file.write(serialization.dumps(game))
+        print(f"État de la partie enregistré dans {path}")
+        raise
+    finally:
+        # Écrire les derniers événements en attente
+        if event_log is not None:
+            event_log.close()
+
+    if args.startup_report or startup.over_budget:
+        print(startup.report())
+    if args.record:
+        # Un fichier par manche (partie-1.bmr, partie-2.bmr...) s'il y en a eu plusieurs
+        game.recorder.finish(game)
+        recorders = game.recordings + [game.recorder]
+        if len(recorders) == 1:
+            game.recorder.save(args.record)
+        else:
+            stem, extension = os.path.splitext(args.record)
+            for number, recorder in enumerate(recorders, 1):
+                recorder.save(f"{stem}-{number}{extension}")
+    if args.profile:
+        profiler.dump(args.profile)
     pygame.quit()
     sys.exit()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,273 @@
+"""Génération, validation et réserves de plateaux.
+
+Un plateau est généré à partir d'une graine, en deux temps : un modèle place les murs fixes
+(modèles enregistrés avec @template, choisis par leur nom), puis des blocs destructibles sont
+semés sur les cases libres hors des coins de départ. Il n'est gardé que s'il est valide :
+
+- connexité : toutes les cases sans mur fixe communiquent (une fois les blocs détruits) ;
+- sécurité des départs : depuis sa case de départ, chaque joueur peut poser sa première bombe
+  et se mettre à l'abri en quelques cases, sans traverser de bloc ;
+- équité : les murs n'allongent pas plus le chemin vers l'adversaire le plus proche pour un
+  joueur que pour les autres, et chacun a à peu près autant de blocs autour de lui.
+
+Les plateaux valides sont générés à l'avance et rangés dans une réserve (fichier .bmpool : un
+en-tête puis les plateaux bout à bout, un octet par case), lue par projection en mémoire
+(mmap) : une partie prend un plateau de la réserve sans rien générer ni décoder.
+
+Utilisation : python maps.py --count 256 [--map 21x17] [--players 2] [--seed 0] [--template classic]
+"""
+import argparse
+import mmap
+import os
+import struct
+from collections import deque
+
+import numpy as np
+
+from cli import map_size
+from grid import *
+from rules import *
+
+MAP_POOL_PATH = "maps/"
+POOL_MAGIC = b"BMMP"
+POOL_VERSION = 1
+# Magic, version, nombre de joueurs, largeur, hauteur, nombre de plateaux
+POOL_HEADER = struct.Struct("<4sBBHHI")
+
+EXTRA_WALL_DENSITY = 0.08  # Modèle « scattered » : murs ajoutés sur les cases libres
+MAX_ESCAPE_STEPS = 4  # Cases au plus pour s'abriter de sa première bombe
+FAIRNESS_RATIO = 1.25  # Écart maximal des détours vers l'adversaire le plus proche (rapport)
+FAIRNESS_RADIUS = 6  # Blocs comptés autour de chaque départ : à au plus 6 cases de marche
+FAIRNESS_BLOCKS = 0.2  # Écart maximal de la proportion de blocs autour de deux départs
+MAX_ATTEMPTS = 1000
+
+TEMPLATES = {}  # Nom -> fonction (rng, largeur, hauteur, départs) -> grille de murs fixes
+
+
+def template(name):
+    # Décorateur : enregistre un modèle de plateau sous ce nom
+    def register(function):
+        TEMPLATES[name] = function
+        return function
+    return register
+
+
+@template('classic')
+def classic_template(rng, width, height, spawns):
+    # Bords et piliers une case sur deux, comme le jeu original
+    return grid_template(width, height)
+
+
+@template('open')
+def open_template(rng, width, height, spawns):
+    # Arène sans piliers : seuls les blocs arrêtent les explosions
+    grid = np.full((height, width), EMPTY, np.uint8)
+    grid[[0, -1], :] = WALL
+    grid[:, [0, -1]] = WALL
+    return grid
+
+
+@template('scattered')
+def scattered_template(rng, width, height, spawns):
+    # Piliers classiques et murs supplémentaires, symétriques par rapport au centre du plateau
+    grid = grid_template(width, height)
+    extra = rng.random(grid.shape) < EXTRA_WALL_DENSITY
+    extra |= extra[::-1, ::-1]
+    grid[extra & block_mask(grid, spawns)] = WALL
+    # Les poches ainsi fermées deviennent des murs
+    open_ground = grid != WALL
+    grid[open_ground & (distances(open_ground, spawns[0]) < 0)] = WALL
+    return grid
+
+
+def place_blocks(rng, walls, spawns, density=BLOCK_DENSITY):
+    # Blocs destructibles sur les cases libres, hors des coins de départ
+    grid = walls.copy()
+    grid[(rng.random(grid.shape) < density) & block_mask(walls, spawns)] = BLOCK
+    return grid
+
+
+def distances(passable, start):
+    """Distance en cases (marche en 4 directions) de start à chaque case, -1 si inaccessible.
+
+    passable : tableau booléen des cases praticables ; le bord du plateau ne doit pas l'être.
+    """
+    height, width = passable.shape
+    open_cells = passable.ravel().tolist()
+    result = [-1] * (width * height)
+    first = start[1] * width + start[0]
+    result[first] = 0
+    pending = deque([first])
+    while pending:
+        cell = pending.popleft()
+        step = result[cell] + 1
+        for neighbour in (cell - width, cell + 1, cell + width, cell - 1):
+            if open_cells[neighbour] and result[neighbour] < 0:
+                result[neighbour] = step
+                pending.append(neighbour)
+    return np.array(result, np.int32).reshape(height, width)
+
+
+def check_map(grid, spawns):
+    """Renvoie None si le plateau est valide, sinon la raison de son rejet."""
+    if (grid[[0, -1], :] != WALL).any() or (grid[:, [0, -1]] != WALL).any():
+        return "bords ouverts"
+
+    # Connexité : toutes les cases sans mur fixe atteignables depuis le premier départ
+    open_ground = grid != WALL
+    if (distances(open_ground, spawns[0])[open_ground] < 0).any():
+        return "zone fermée"
+
+    for x, y in spawns:
+        if grid[y, x] != EMPTY:
+            return f"départ ({x}, {y}) occupé"
+        # Abri le plus proche de la première bombe, en ne marchant que sur des cases libres
+        walk = distances(grid == EMPTY, (x, y))
+        blast = np.zeros(grid.shape, bool)
+        xs, ys = blast_rays(grid, x, y, PLAYER_BOMB_POWER)
+        blast[ys, xs] = True
+        blast[y, x] = True
+        shelters = walk[(walk >= 0) & ~blast]
+        if shelters.size == 0 or shelters.min() > MAX_ESCAPE_STEPS:
+            return f"départ ({x}, {y}) sans abri"
+
+    # Équité : détour imposé par les murs vers l'adversaire le plus proche (chemin rapporté à la
+    # distance à vol d'oiseau, la disposition des départs n'y est pour rien) et proportion de
+    # blocs à portée
+    detours = []
+    blocks = []
+    for x, y in spawns:
+        routes = distances(open_ground, (x, y))
+        detours.append(min(routes[oy, ox] / (abs(ox - x) + abs(oy - y))
+                           for ox, oy in spawns if (ox, oy) != (x, y)))
+        around = (routes > 0) & (routes <= FAIRNESS_RADIUS)
+        blocks.append((grid[around] == BLOCK).mean())
+    if max(detours) > FAIRNESS_RATIO * min(detours):
+        return "détours inégaux"
+    if max(blocks) - min(blocks) > FAIRNESS_BLOCKS:
+        return "blocs mal répartis"
+    return None
+
+
+def generate_map(rng, width=GRID_WIDTH, height=GRID_HEIGHT, spawns=None, template_name='classic',
+                 density=BLOCK_DENSITY):
+    # Premier plateau valide tiré avec ce modèle
+    if spawns is None:
+        spawns = spawn_positions(width, height, 2)
+    make_walls = TEMPLATES[template_name]
+    for _ in range(MAX_ATTEMPTS):
+        grid = place_blocks(rng, make_walls(rng, width, height, spawns), spawns, density)
+        if check_map(grid, spawns) is None:
+            return grid
+    raise ValueError(f"Aucun plateau {width}x{height} valide avec le modèle {template_name} "
+                     f"pour {len(spawns)} joueurs")
+
+
+def pool_path(width, height, n_players):
+    return os.path.join(MAP_POOL_PATH, f"{width}x{height}-{n_players}.bmpool")
+
+
+class MapPool:
+    """Plateaux validés pour une taille et un nombre de joueurs donnés.
+
+    Une partie prend le plateau numéro seed % len(réserve) : la même graine donne le même
+    plateau. Une réserve chargée depuis un fichier reste projetée en mémoire ; seul le plateau
+    choisi est copié.
+    """
+
+    def __init__(self, grids, n_players):
+        self.grids = grids  # Tableau (nombre, hauteur, largeur) de cases
+        self.n_players = n_players
+        self.mapping = None  # Projection en mémoire du fichier, le cas échéant
+
+    @property
+    def width(self):
+        return self.grids.shape[2]
+
+    @property
+    def height(self):
+        return self.grids.shape[1]
+
+    def __len__(self):
+        return len(self.grids)
+
+    def fits(self, width, height, n_players):
+        return len(self) > 0 and (self.width, self.height, self.n_players) == (width, height, n_players)
+
+    def pick(self, seed):
+        # Numéro et copie du plateau de la partie de graine seed
+        index = seed % len(self)
+        return index, np.array(self.grids[index])
+
+    @classmethod
+    def build(cls, count, width=GRID_WIDTH, height=GRID_HEIGHT, n_players=2, seed=0, templates=None,
+              density=BLOCK_DENSITY):
+        # count plateaux valides, les modèles donnés (tous par défaut) à tour de rôle
+        templates = list(templates or TEMPLATES)
+        rng = np.random.default_rng(seed)
+        spawns = spawn_positions(width, height, n_players)
+        grids = np.empty((count, height, width), np.uint8)
+        for i in range(count):
+            grids[i] = generate_map(rng, width, height, spawns, templates[i % len(templates)], density)
+        return cls(grids, n_players)
+
+    def to_bytes(self):
+        header = POOL_HEADER.pack(POOL_MAGIC, POOL_VERSION, self.n_players, self.width, self.height, len(self))
+        return header + self.grids.tobytes()
+
+    def save(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mapping) < POOL_HEADER.size:
+            raise ValueError("Réserve de plateaux tronquée")
+        magic, version, n_players, width, height, count = POOL_HEADER.unpack_from(mapping)
+        if magic != POOL_MAGIC:
+            raise ValueError("Ce fichier n'est pas une réserve de plateaux")
+        if version != POOL_VERSION:
+            raise ValueError(f"Version de réserve non gérée: {version}")
+        if len(mapping) != POOL_HEADER.size + count * width * height:
+            raise ValueError("Réserve de plateaux tronquée")
+        grids = np.frombuffer(mapping, np.uint8, count * width * height, POOL_HEADER.size)
+        pool = cls(grids.reshape(count, height, width), n_players)
+        pool.mapping = mapping
+        return pool
+
+
+def load_pool(width, height, n_players, path=None):
+    # Réserve correspondant à la partie, ou None si elle n'existe pas (plateau généré à la place)
+    try:
+        pool = MapPool.load(path or pool_path(width, height, n_players))
+    except (OSError, ValueError):
+        return None
+    return pool if pool.fits(width, height, n_players) else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Génère une réserve de plateaux validés")
+    parser.add_argument("--count", type=int, default=256)
+    parser.add_argument("--map", type=map_size, default=(GRID_WIDTH, GRID_HEIGHT), metavar="LxH")
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--template", action="append", choices=sorted(TEMPLATES),
+                        help="modèle de plateau ; option répétable (défaut : tous)")
+    parser.add_argument("--density", type=float, default=BLOCK_DENSITY, help="proportion de blocs")
+    parser.add_argument("--output", help=f"fichier de la réserve (défaut : {MAP_POOL_PATH}LxH-J.bmpool)")
+    args = parser.parse_args()
+
+    width, height = args.map
+    pool = MapPool.build(args.count, width, height, args.players, args.seed, args.template, args.density)
+    path = args.output or pool_path(width, height, args.players)
+    pool.save(path)
+    print(f"{len(pool)} plateaux {width}x{height} pour {args.players} joueurs dans {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,59 @@
-from bomb import Bomb
 import pygame
 from contantes import *
-import math
+from grid import *
+from config import get_config
+from events import BombPlaced, PowerUpCollected
+from operator import attrgetter
+
+# Attributs qui changent pendant la partie (sauvegardés par snapshot pour un retour en arrière)
+STATE = ('grid_x', 'grid_y', 'x', 'y', 'previous_x', 'previous_y', 'speed', 'sub_pixel', 'max_bombs',
+         'bomb_power', 'alive', 'score', 'blocks_destroyed', 'powerups_collected', 'survival_time')
+read_state = attrgetter(*STATE)
 
 
 class Player:
-    def __init__(self, grid_x, grid_y, color, key_up, key_down, key_left, key_right, key_bomb):
-        # Position et apparence
+    __slots__ = (
+        'grid_x', 'grid_y', 'x', 'y', 'previous_x', 'previous_y', 'number', 'color', 'radius', 'tile_size',
+        'speed', 'sub_pixel', 'max_bombs', 'bomb_power', 'alive',
+        'score', 'blocks_destroyed', 'powerups_collected', 'survival_time',
+        'key_up', 'key_down', 'key_left', 'key_right', 'key_bomb', 'controller',
+    )
+
+    def __init__(self, grid_x, grid_y, color, key_up, key_down, key_left, key_right, key_bomb, number=1,
+                 tile_size=None):
+        # Apparence
+        self.tile_size = tile_size if tile_size is not None else get_config().tile_size
+        self.number = number  # Numéro affiché (Joueur 1, 2...)
+        self.color = color
+        self.radius = self.tile_size // 2 - 8
+
+        # Position, caractéristiques et points de départ
+        self.reset(grid_x, grid_y)
+
+        # Touches de contrôle (None : joueur sans clavier, bot ou joueur distant)
+        self.key_up = key_up
+        self.key_down = key_down
+        self.key_left = key_left
+        self.key_right = key_right
+        self.key_bomb = key_bomb
+        # Contrôleur de l'ordinateur (BotController) ; None : joueur au clavier
+        self.controller = None
+
+    def reset(self, grid_x, grid_y):
+        # Remettre le joueur sur sa case de départ avec les caractéristiques initiales (nouvelle manche)
         self.grid_x = grid_x
         self.grid_y = grid_y
-        self.x = grid_x * TILE_SIZE + TILE_SIZE // 2
-        self.y = grid_y * TILE_SIZE + TILE_SIZE // 2
-        self.color = color
-        self.radius = TILE_SIZE // 2 - 8
+        self.x = grid_x * self.tile_size + self.tile_size // 2
+        self.y = grid_y * self.tile_size + self.tile_size // 2
+        # Position au tick précédent, pour interpoler l'affichage
+        self.previous_x = self.x
+        self.previous_y = self.y
 
         # Caractéristiques
-        self.speed = 3
-        self.max_bombs = 1
-        self.bomb_power = 2
-        self.active_bombs = 0
+        self.speed = PLAYER_SPEED  # Pixels par seconde
+        self.sub_pixel = 0  # Déplacement en réserve, en 1/TICK_RATE de pixel
+        self.max_bombs = PLAYER_MAX_BOMBS
+        self.bomb_power = PLAYER_BOMB_POWER
         self.alive = True
 
         # Système de points
@@ -27,152 +62,135 @@ class Player:
         self.powerups_collected = 0
         self.survival_time = 0
 
-        # Touches de contrôle
-        self.key_up = key_up
-        self.key_down = key_down
-        self.key_left = key_left
-        self.key_right = key_right
-        self.key_bomb = key_bomb
+    def snapshot(self):
+        return read_state(self)
+
+    def restore(self, state):
+        for name, value in zip(STATE, state):
+            setattr(self, name, value)
 
     def handle_input(self, keys, game):
-        # Déplacement
-        dx, dy = 0, 0
+        self.apply_action(self.read_action(keys), game)
 
+    def read_action(self, keys):
+        # Convertir l'état du clavier en action (une direction, éventuellement avec ACTION_BOMB)
+        action = ACTION_NONE
         if keys[self.key_up]:
-            dy = -self.speed
+            action = ACTION_UP
         elif keys[self.key_down]:
-            dy = self.speed
+            action = ACTION_DOWN
         elif keys[self.key_left]:
-            dx = -self.speed
+            action = ACTION_LEFT
         elif keys[self.key_right]:
-            dx = self.speed
+            action = ACTION_RIGHT
 
-        # Vérifier si le mouvement est valide
-        if self.can_move(self.x + dx, self.y, game) and dx != 0:
-            self.x += dx
-        if self.can_move(self.x, self.y + dy, game) and dy != 0:
-            self.y += dy
+        if keys[self.key_bomb]:
+            action |= ACTION_BOMB
+        return action
 
-        # Placement de bombe
-        if keys[self.key_bomb] and self.active_bombs < self.max_bombs:
+    def apply_action(self, action, game):
+        # Déplacement : pixels entiers parcourus pendant ce tick, le reste est gardé pour le suivant
+        dx, dy = 0, 0
+        direction = action & ~ACTION_BOMB
+
+        if ACTION_UP <= direction <= ACTION_RIGHT:
+            distance, self.sub_pixel = divmod(self.sub_pixel + self.speed, TICK_RATE)
+            if direction == ACTION_UP:
+                dy = -distance
+            elif direction == ACTION_DOWN:
+                dy = distance
+            elif direction == ACTION_LEFT:
+                dx = -distance
+            else:
+                dx = distance
+
+        # Avancer par sous-pas jusqu'au contact d'un obstacle (voir collision.py)
+        if dx or dy:
+            game.collision.move(self, dx, dy)
+
+        # Placement de bombe (bombes du joueur encore posées : voir BombIndex)
+        if action & ACTION_BOMB and game.bombs.count(self) < self.max_bombs:
             self.place_bomb(game)
 
     def can_move(self, new_x, new_y, game):
-        # Calculer le rayon effectif pour la collision (60% du rayon réel)
-        effective_radius = int(self.radius * 0.6)
-
-        # Vérifier les collisions aux quatre points cardinaux du cercle
-        points_to_check = [
-            (new_x - effective_radius, new_y),  # Point gauche
-            (new_x + effective_radius, new_y),  # Point droit
-            (new_x, new_y - effective_radius),  # Point haut
-            (new_x, new_y + effective_radius)  # Point bas
-        ]
-
-        for point_x, point_y in points_to_check:
-            grid_x = point_x // TILE_SIZE
-            grid_y = point_y // TILE_SIZE
-
-            # Vérifier si le point est en dehors des limites
-            if grid_x < 0 or grid_x >= GRID_WIDTH or grid_y < 0 or grid_y >= GRID_HEIGHT:
-                return False
-
-            # Vérifier si le point touche un mur ou un bloc
-            tile_type = game.grid[grid_y][grid_x]
-            if tile_type in [TileType.WALL, TileType.BLOCK]:
-                return False
-
-            # Vérifier s'il y a une bombe (sauf celle qu'on vient de poser)
-            if tile_type == TileType.BOMB:
-                # Vérifier si le joueur est déjà sur cette case (pour permettre de sortir de sa propre bombe)
-                if self.grid_x == grid_x and self.grid_y == grid_y:
-                    continue
-
-                # Sinon, vérifier la collision avec le corps de la bombe
-                for bomb in game.bombs:
-                    if bomb.x == grid_x and bomb.y == grid_y:
-                        # Calculer le centre de la bombe
-                        bomb_center_x = (bomb.x * TILE_SIZE) + (TILE_SIZE // 2)
-                        bomb_center_y = (bomb.y * TILE_SIZE) + (TILE_SIZE // 2)
-
-                        # Calculer la distance entre le joueur et la bombe
-                        distance = math.sqrt((new_x - bomb_center_x) ** 2 + (new_y - bomb_center_y) ** 2)
-
-                        # Si la distance est inférieure à la somme des rayons, il y a collision
-                        if distance < (self.radius * 0.6 + bomb.radius * 0.8):
-                            return False
-
-        return True
+        # Le joueur tiendrait-il en (new_x, new_y) sans toucher un mur, un bloc ou une bombe ?
+        collision = game.collision
+        collision.refresh(game)
+        return not collision.blocked(new_x, new_y, self.grid_y * collision.width + self.grid_x)
 
     def can_move_to(self, grid_x, grid_y, game):
         # Cette méthode n'est plus utilisée directement, mais on la garde pour compatibilité
         # Vérifier si la position est dans les limites
-        if grid_x < 0 or grid_x >= GRID_WIDTH or grid_y < 0 or grid_y >= GRID_HEIGHT:
+        height, width = game.grid.shape
+        if grid_x < 0 or grid_x >= width or grid_y < 0 or grid_y >= height:
             return False
 
         # Vérifier si la case est libre
-        tile_type = game.grid[grid_y][grid_x]
-        if tile_type in [TileType.WALL, TileType.BLOCK]:
+        tile_type = game.grid[grid_y, grid_x]
+        if tile_type == WALL or tile_type == BLOCK:
             return False
 
         # Vérifier s'il y a une bombe
-        if tile_type == TileType.BOMB:
+        if tile_type == BOMB:
             # On autorise le joueur à marcher sur sa propre bombe qu'il vient de poser
             # mais pas sur les autres bombes
-            for bomb in game.bombs:
-                if bomb.x == grid_x and bomb.y == grid_y and not bomb.just_placed:
-                    return False
+            bomb = game.bombs.at(grid_x, grid_y)
+            if bomb is not None and not bomb.just_placed:
+                return False
 
         return True
 
     def update(self, game):
         # Mettre à jour la position sur la grille
-        self.grid_x = self.x // TILE_SIZE
-        self.grid_y = self.y // TILE_SIZE
+        tile_size = self.tile_size
+        self.grid_x = self.x // tile_size
+        self.grid_y = self.y // tile_size
 
         # Vérifier s'il y a un power-up
-        tile_type = game.grid[self.grid_y][self.grid_x]
-        if tile_type in [TileType.POWER_UP_BOMB, TileType.POWER_UP_FLAME, TileType.POWER_UP_SPEED]:
-            game.grid[self.grid_y][self.grid_x] = TileType.EMPTY
-            self.collect_power_up(tile_type)
+        tile_type = game.grid[self.grid_y, self.grid_x]
+        if POWER_UP_BOMB <= tile_type <= POWER_UP_SPEED:
+            game.set_tile(self.grid_x, self.grid_y, TileType.EMPTY)
+            power_up = TileType(tile_type)
+            total = self.collect_power_up(power_up, points=game.scoring.power_up)
+            game.emit(PowerUpCollected(game.game_time, self.number, self.grid_x, self.grid_y, power_up.name, total))
 
         # Régler le décalage pour être au centre de la case
-        if self.x % TILE_SIZE == 0 and self.y % TILE_SIZE == 0:
-            self.x = self.grid_x * TILE_SIZE + TILE_SIZE // 2
-            self.y = self.grid_y * TILE_SIZE + TILE_SIZE // 2
+        if self.x % tile_size == 0 and self.y % tile_size == 0:
+            self.x = self.grid_x * tile_size + tile_size // 2
+            self.y = self.grid_y * tile_size + tile_size // 2
 
-    def collect_power_up(self, power_up_type):
-        player_num = 1 if self.color == RED else 2
+    def collect_power_up(self, power_up_type, points=SCORE_POWER_UP):
+        # Appliquer le bonus et renvoyer la nouvelle valeur de la caractéristique augmentée
 
         # Incrémenter le compteur de power-ups collectés
         self.powerups_collected += 1
 
         # Points de base pour avoir ramassé un power-up
-        self.score += 250
+        self.score += points
 
         if power_up_type == TileType.POWER_UP_BOMB:
             # Augmenter le nombre de bombes
             self.max_bombs += 1
-            print(f"Joueur {player_num} : +1 bombe! (Total: {self.max_bombs})")
+            return self.max_bombs
         elif power_up_type == TileType.POWER_UP_FLAME:
             # Augmenter la portée des explosions
             self.bomb_power += 1
-            print(f"Joueur {player_num} : +1 puissance! (Total: {self.bomb_power})")
+            return self.bomb_power
         elif power_up_type == TileType.POWER_UP_SPEED:
             # Augmenter la vitesse de déplacement
-            self.speed += 1
-            print(f"Joueur {player_num} : +1 vitesse! (Total: {self.speed})")
+            self.speed += SPEED_BONUS
+            return self.speed
 
     def place_bomb(self, game):
         # Placement de bombe sur la grille
-        if game.grid[self.grid_y][self.grid_x] == TileType.EMPTY:
-            game.grid[self.grid_y][self.grid_x] = TileType.BOMB
-            bomb = Bomb(self.grid_x, self.grid_y, self.bomb_power, self)
-            game.bombs.append(bomb)
-            self.active_bombs += 1
-
-    def draw(self, screen, offset_x, offset_y):
-        # Dessiner le joueur (un cercle)
-        x_pos = offset_x + self.x
-        y_pos = offset_y + self.y
-        pygame.draw.circle(screen, self.color, (x_pos, y_pos), self.radius)
\ No newline at end of file
+        if game.grid[self.grid_y, self.grid_x] == EMPTY:
+            bomb = game.bomb_store.create(self.grid_x, self.grid_y, self.bomb_power, self)
+            game.add_bomb(bomb)
+            game.emit(BombPlaced(game.game_time, self.number, self.grid_x, self.grid_y, self.bomb_power))
+
+    def draw(self, screen, offset_x, offset_y, alpha=1.0):
+        # Dessiner le joueur (un cercle) entre sa position précédente et actuelle,
+        # et renvoyer la zone modifiée
+        x_pos = offset_x + self.previous_x + (self.x - self.previous_x) * alpha
+        y_pos = offset_y + self.previous_y + (self.y - self.previous_y) * alpha
+        return pygame.draw.circle(screen, self.color, (x_pos, y_pos), self.radius)
\ No newline at end of file
@@ -0,0 +1,185 @@
+"""Mesure du temps passé dans chaque phase d'une image.
+
+Les durées des dernières images sont gardées dans un tampon circulaire de taille fixe, avec
+le nombre de bombes et d'explosions. Le graphe s'affiche par-dessus le jeu (touche F3) et
+le tampon peut être exporté en CSV ou en JSON pour être joint à un rapport de bug.
+"""
+import csv
+import json
+import time
+
+import numpy as np
+import pygame
+
+from contantes import *
+
+# Les phases imbriquées (update_bombs dans update) sont comptées dans les deux
+PHASES = ('handle_events', 'update', 'update_bombs', 'update_explosions', 'draw_grid', 'draw_ui', 'display.flip')
+PHASE_COLORS = (WHITE, GREEN, ORANGE, YELLOW, CYAN, PURPLE, RED)
+COUNTERS = ('bombs', 'explosions')
+
+
+class Section:
+    # Chronomètre d'une phase, réutilisé à chaque image (aucune allocation)
+    __slots__ = ('profiler', 'index', 'start')
+
+    def __init__(self, profiler, index):
+        self.profiler = profiler
+        self.index = index
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.profiler.current[self.index] += time.perf_counter() - self.start
+
+
+class NullSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+
+class NullProfiler:
+    # Même interface que FrameProfiler, sans aucune mesure
+    visible = False
+    null_section = NullSection()
+
+    def section(self, name):
+        return self.null_section
+
+    def end_frame(self, bombs=0, explosions=0):
+        pass
+
+    def toggle(self):
+        pass
+
+    def draw(self, screen, text_cache):
+        return None
+
+
+class FrameProfiler:
+    def __init__(self, size=600):
+        self.size = size
+        self.frames = 0
+        self.visible = False
+        self.sections = {name: Section(self, i) for i, name in enumerate(PHASES)}
+        self.current = np.zeros(len(PHASES))
+        # Une ligne par image : durée totale, durée de chaque phase (secondes), compteurs
+        self.samples = np.zeros((size, 1 + len(PHASES) + len(COUNTERS)))
+        self.last_frame = time.perf_counter()
+
+    def section(self, name):
+        return self.sections[name]
+
+    def end_frame(self, bombs=0, explosions=0):
+        now = time.perf_counter()
+        row = self.samples[self.frames % self.size]
+        row[0] = now - self.last_frame
+        row[1:1 + len(PHASES)] = self.current
+        row[1 + len(PHASES):] = (bombs, explosions)
+        self.current[:] = 0.0
+        self.last_frame = now
+        self.frames += 1
+
+    def history(self):
+        # Lignes du tampon dans l'ordre chronologique
+        if self.frames < self.size:
+            return self.samples[:self.frames]
+        start = self.frames % self.size
+        return np.concatenate((self.samples[start:], self.samples[:start]))
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def draw(self, screen, text_cache, height=120):
+        # Graphe des dernières images : une colonne par image, empilée par phase de premier niveau
+        if not self.visible or self.frames == 0:
+            return None
+
+        history = self.history()[-screen.get_width() // 2:]
+        rect = pygame.Rect(0, screen.get_height() - height - 40, len(history) * 2, height)
+        screen.fill(BLACK, rect)
+
+        # Échelle : la hauteur du graphe représente deux images à TICK_RATE
+        scale = height / (2.0 / TICK_RATE)
+        top_level = [PHASES.index(name) for name in ('handle_events', 'update', 'draw_grid', 'draw_ui', 'display.flip')]
+        for i, row in enumerate(history):
+            x = rect.x + i * 2
+            y = rect.bottom
+            for index in top_level:
+                bar = int(row[1 + index] * scale)
+                if bar:
+                    pygame.draw.line(screen, PHASE_COLORS[index], (x, y), (x, max(y - bar, rect.y)), 2)
+                    y -= bar
+        # Budget d'une image à TICK_RATE
+        budget_y = rect.bottom - int(scale / TICK_RATE)
+        pygame.draw.line(screen, RED, (rect.x, budget_y), (rect.right, budget_y))
+
+        mean = history.mean(axis=0)
+        label = (f"{mean[0] * 1000:.1f} ms/image  bombes: {int(history[-1][-2])}"
+                 f"  explosions: {int(history[-1][-1])}")
+        text = text_cache.render(label, WHITE, 'Arial', 16)
+        return rect.union(screen.blit(text, (rect.x + 4, rect.y + 4)))
+
+    def summary(self):
+        history = self.history()
+        columns = ('frame',) + PHASES
+        return {
+            name: {
+                'mean_ms': float(history[:, i].mean() * 1000),
+                'p95_ms': float(np.percentile(history[:, i], 95) * 1000),
+                'max_ms': float(history[:, i].max() * 1000),
+            }
+            for i, name in enumerate(columns)
+        } if len(history) else {}
+
+    def dump(self, path):
+        # Export du tampon : JSON si le nom se termine par .json, CSV sinon
+        history = self.history()
+        header = ['frame_ms'] + [f'{name}_ms' for name in PHASES] + list(COUNTERS)
+        rows = [[round(value * 1000, 4) for value in row[:1 + len(PHASES)]] + [int(value) for value in row[1 + len(PHASES):]]
+                for row in history]
+
+        with open(path, 'w', newline='') as file:
+            if path.endswith('.json'):
+                json.dump({'columns': header, 'frames': rows, 'summary': self.summary()}, file, indent=1)
+            else:
+                writer = csv.writer(file)
+                writer.writerow(header)
+                writer.writerows(rows)
+
+
+class StartupTimer:
+    """Durée de chaque étape du démarrage, du lancement à la première image affichée."""
+
+    def __init__(self, start=None, budget=STARTUP_BUDGET):
+        self.start = start if start is not None else time.perf_counter()
+        self.last = self.start
+        self.budget = budget  # Durée visée en secondes
+        self.steps = []
+
+    def mark(self, name):
+        # Fin de l'étape « name » (commencée à la fin de la précédente)
+        now = time.perf_counter()
+        self.steps.append((name, now - self.last))
+        self.last = now
+
+    @property
+    def total(self):
+        return self.last - self.start
+
+    @property
+    def over_budget(self):
+        return self.total > self.budget
+
+    def report(self):
+        lines = [f"{name:16s} {duration * 1000:8.1f} ms" for name, duration in self.steps]
+        status = "dépassé" if self.over_budget else "ok"
+        lines.append(f"{'total':16s} {self.total * 1000:8.1f} ms  (budget {self.budget * 1000:.0f} ms : {status})")
+        return "\n".join(lines)
@@ -0,0 +1,102 @@
+"""Protocole entre le serveur de jeu et ses clients.
+
+Une ligne JSON par message, sur TCP :
+  client -> serveur : {"type": "join", "room": "nom"}, puis {"type": "input", "action": code ACTION_*}
+                      à chaque changement d'action
+  serveur -> client : {"type": "welcome", "player": indice}, {"type": "snapshot", ...} (état complet),
+                      puis {"type": "delta", ...} à chaque tick, ou {"type": "error", "message": ...}
+
+Les positions des joueurs sont en pixels du serveur ; le message « snapshot » donne sa taille
+de case pour que le client les convertisse.
+"""
+import json
+
+import numpy as np
+
+from contantes import *
+
+DEFAULT_PORT = 7777
+MAX_MESSAGE_SIZE = 64 * 1024
+
+
+def encode(message):
+    return json.dumps(message, separators=(',', ':')).encode() + b"\n"
+
+
+class StateEncoder:
+    """État d'une partie sous forme de message : complet, ou différence avec le tick précédent.
+
+    Les minuteurs des bombes et des explosions ne sont pas renvoyés à chaque tick : le client
+    les décompte lui-même. Une explosion n'est renvoyée que lorsqu'elle apparaît ou est ravivée.
+    """
+
+    def __init__(self):
+        self.grid = None
+        self.players = []
+        self.bombs = {}  # Numéro de pose -> [x, y, puissance, minuteur, propriétaire]
+        self.explosions = {}  # (x, y) -> [minuteur, durée]
+
+    def capture(self, game):
+        owners = {player: i for i, player in enumerate(game.players)}
+        players = [[player.x, player.y, player.alive, player.score, player.speed, player.max_bombs,
+                    player.bomb_power] for player in game.players]
+        bombs = {bomb.serial: [bomb.x, bomb.y, bomb.power, bomb.timer, owners.get(bomb.owner, -1)]
+                 for bomb in game.bombs}
+        explosions = {(explosion.x, explosion.y): [explosion.timer, explosion.duration]
+                      for explosion in game.explosions}
+        return players, bombs, explosions
+
+    def snapshot(self, game):
+        players, bombs, explosions = self.capture(game)
+        self.grid = game.grid.copy()
+        self.players = players
+        self.bombs = bombs
+        self.explosions = explosions
+        return {
+            'type': 'snapshot',
+            'tick': game.game_time,
+            'tile_size': game.tile_size,
+            'game_over': game.game_over,
+            'width': game.grid.shape[1],
+            'height': game.grid.shape[0],
+            'grid': game.grid.ravel().tolist(),
+            'players': players,
+            'bombs': [[serial] + bomb for serial, bomb in bombs.items()],
+            'explosions': [[x, y] + explosion for (x, y), explosion in explosions.items()],
+        }
+
+    def delta(self, game):
+        players, bombs, explosions = self.capture(game)
+        message = {'type': 'delta', 'tick': game.game_time, 'game_over': game.game_over}
+
+        ys, xs = np.nonzero(game.grid != self.grid)
+        if len(xs):
+            message['tiles'] = [[x, y, tile] for x, y, tile in
+                                zip(xs.tolist(), ys.tolist(), game.grid[ys, xs].tolist())]
+            self.grid[ys, xs] = game.grid[ys, xs]
+
+        changed = {i: player for i, (player, previous) in enumerate(zip(players, self.players))
+                   if player != previous}
+        if changed:
+            message['players'] = changed
+
+        added = [[serial] + bomb for serial, bomb in bombs.items() if serial not in self.bombs]
+        removed = [serial for serial in self.bombs if serial not in bombs]
+        if added:
+            message['bombs'] = added
+        if removed:
+            message['bombs_removed'] = removed
+
+        # Explosions nouvelles ou ravivées (minuteur qui n'a pas simplement diminué d'un tick)
+        lit = [[x, y] + explosion for (x, y), explosion in explosions.items()
+               if (x, y) not in self.explosions or self.explosions[(x, y)][0] - 1 != explosion[0]]
+        out = [[x, y] for (x, y) in self.explosions if (x, y) not in explosions]
+        if lit:
+            message['explosions'] = lit
+        if out:
+            message['explosions_removed'] = out
+
+        self.players = players
+        self.bombs = bombs
+        self.explosions = explosions
+        return message
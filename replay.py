@@ -0,0 +1,180 @@
+"""Enregistrement des entrées d'une partie et relecture.
+
+Une partie est entièrement déterminée par sa graine et par les actions des joueurs à chaque
+tick (un octet ACTION_* par joueur). L'enregistrement ne contient donc que cela, compressé,
+plus l'empreinte de l'état final pour détecter une désynchronisation à la relecture. Un plateau
+pris dans une réserve (maps.py) est enregistré avec les actions : la relecture ne dépend pas
+du fichier de la réserve. Les positions étant en pixels, la taille des cases de la partie est
+enregistrée aussi, et la relecture se fait avec la même.
+
+Utilisation : python replay.py partie.bmr [--render]
+"""
+import argparse
+import struct
+import sys
+import time
+import zlib
+
+import numpy as np
+import pygame
+
+from bomberman import Bomberman
+from config import Config
+from contantes import *
+
+MAGIC = b"BMRP"
+VERSION = 4
+# Magic, version, nombre de joueurs, graine, nombre de ticks, empreinte de l'état final
+HEADER_V1 = struct.Struct("<4sBBIII")
+# Version 2 : largeur et hauteur du plateau en plus
+HEADER_V2 = struct.Struct("<4sBBIIIBB")
+# Version 3 : plateau de départ enregistré ou non (s'il l'est, ses cases précèdent les actions)
+HEADER_V3 = struct.Struct("<4sBBIIIBBB")
+# Version 4 : taille des cases en plus
+HEADER = struct.Struct("<4sBBIIIBBBH")
+
+
+class InputRecorder:
+    def __init__(self, seed, n_players, width=GRID_WIDTH, height=GRID_HEIGHT, grid=None, tile_size=0):
+        # grid : plateau de départ, s'il ne se déduit pas de la graine (réserve de plateaux) ;
+        # tile_size : taille des cases de la partie, 0 si inconnue
+        self.seed = seed
+        self.n_players = n_players
+        self.width = width
+        self.height = height
+        self.grid = grid.copy() if grid is not None else None
+        self.tile_size = tile_size
+        self.actions = bytearray()
+        self.final_checksum = 0
+
+    @classmethod
+    def for_game(cls, game):
+        # Enregistreur de la manche en cours ; le plateau est gardé s'il vient d'une réserve
+        return cls(game.seed, len(game.players), game.width, game.height,
+                   game.grid if game.map_index is not None else None, game.tile_size)
+
+    @property
+    def ticks(self):
+        return len(self.actions) // self.n_players
+
+    def record(self, actions):
+        self.actions.extend(actions)
+
+    def finish(self, game):
+        self.final_checksum = game.checksum()
+
+    def to_bytes(self):
+        header = HEADER.pack(MAGIC, VERSION, self.n_players, self.seed, self.ticks, self.final_checksum,
+                             self.width, self.height, self.grid is not None, self.tile_size)
+        grid = self.grid.tobytes() if self.grid is not None else b""
+        return header + zlib.compress(grid + bytes(self.actions), 9)
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+
+class Recording:
+    def __init__(self, seed, n_players, actions, final_checksum=0, width=GRID_WIDTH, height=GRID_HEIGHT,
+                 grid=None, tile_size=0):
+        self.seed = seed
+        self.n_players = n_players
+        self.actions = actions
+        self.final_checksum = final_checksum
+        self.width = width
+        self.height = height
+        self.grid = grid
+        self.tile_size = tile_size  # 0 : inconnue (enregistrement antérieur à la version 4)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version = struct.unpack_from("<4sB", data)
+        if magic != MAGIC:
+            raise ValueError("Ce fichier n'est pas un enregistrement de partie")
+        has_grid = False
+        tile_size = 0
+        if version == 1:
+            # Plateau de taille fixe avant la version 2
+            _, _, n_players, seed, ticks, final_checksum = HEADER_V1.unpack_from(data)
+            width, height, header_size = GRID_WIDTH, GRID_HEIGHT, HEADER_V1.size
+        elif version == 2:
+            _, _, n_players, seed, ticks, final_checksum, width, height = HEADER_V2.unpack_from(data)
+            header_size = HEADER_V2.size
+        elif version == 3:
+            _, _, n_players, seed, ticks, final_checksum, width, height, has_grid = HEADER_V3.unpack_from(data)
+            header_size = HEADER_V3.size
+        elif version == VERSION:
+            (_, _, n_players, seed, ticks, final_checksum, width, height, has_grid,
+             tile_size) = HEADER.unpack_from(data)
+            header_size = HEADER.size
+        else:
+            raise ValueError(f"Version d'enregistrement non gérée: {version}")
+        payload = zlib.decompress(data[header_size:])
+        grid_size = width * height if has_grid else 0
+        if len(payload) != grid_size + ticks * n_players:
+            raise ValueError("Enregistrement tronqué")
+        grid = np.frombuffer(payload, np.uint8, grid_size).reshape(height, width) if has_grid else None
+        return cls(seed, n_players, payload[grid_size:], final_checksum, width, height, grid, tile_size)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+    def ticks(self):
+        # Actions des joueurs, tick par tick
+        n = self.n_players
+        for start in range(0, len(self.actions), n):
+            yield self.actions[start:start + n]
+
+
+def replay(recording, screen=None):
+    """Rejoue un enregistrement et renvoie la partie dans son état final.
+
+    Sans écran, la partie est re-simulée aussi vite que possible ; avec un écran, elle est
+    affichée au rythme normal (TICK_RATE ticks par seconde).
+    """
+    # Même taille de cases que la partie enregistrée : les positions sont en pixels
+    config = Config(screen.get_size() if screen is not None else None, recording.tile_size or None)
+    game = Bomberman(screen, seed=recording.seed, width=recording.width, height=recording.height,
+                     n_players=recording.n_players, config=config, grid=recording.grid)
+    game.rematch_allowed = False
+
+    for actions in recording.ticks():
+        game.step(actions)
+        if screen is not None:
+            game.handle_events()
+            if not game.running:
+                break
+            game.draw()
+            game.clock.tick(TICK_RATE)
+    return game
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Relecture d'une partie enregistrée")
+    parser.add_argument("path")
+    parser.add_argument("--render", action="store_true", help="afficher la partie pendant la relecture")
+    args = parser.parse_args()
+
+    recording = Recording.load(args.path)
+    screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN) if args.render else None
+
+    start = time.perf_counter()
+    game = replay(recording, screen)
+    elapsed = time.perf_counter() - start
+
+    print(f"{game.game_time} ticks rejoués en {elapsed:.3f}s")
+    for i, player in enumerate(game.players):
+        print(f"Joueur {i + 1}: {player.score} points ({'vivant' if player.alive else 'éliminé'})")
+
+    if recording.final_checksum and game.running:
+        if game.checksum() != recording.final_checksum:
+            print("Désynchronisation : l'état final diffère de celui enregistré")
+            return 1
+        print("État final identique à l'enregistrement")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
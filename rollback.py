@@ -0,0 +1,103 @@
+"""Retour en arrière (rollback) pour le jeu en ligne.
+
+Chaque tick, l'état de la partie est sauvegardé avant d'avancer. Les actions des joueurs distants
+qui ne sont pas encore arrivées sont prédites (leur dernière action connue est répétée) ; quand
+la vraie action arrive en retard et diffère de la prédiction, la partie revient au tick concerné
+et re-simule jusqu'au tick courant, sans affichage.
+
+Les événements d'un tick (events.py) ne sont publiés sur le bus de la partie qu'une fois le tick
+sorti de la fenêtre, quand il ne peut plus être corrigé : ceux d'un tick re-simulé remplacent
+ceux du premier passage. Appeler flush() en fin de partie publie ceux des derniers ticks.
+"""
+from collections import deque
+
+from contantes import *
+from events import EventBus
+
+
+class Rollback:
+    def __init__(self, game, window=8):
+        self.game = game
+        self.window = window  # Nombre de ticks sur lesquels on peut revenir
+        # (numéro du tick, état avant le tick, actions appliquées, actions prédites : un booléen par
+        # joueur, événements du tick pas encore publiés)
+        self.history = deque(maxlen=window)
+        self.frame = 0  # Ticks avancés depuis le début (game_time s'arrête en fin de partie)
+        self.last_actions = [ACTION_NONE] * len(game.players)  # Dernière action connue de chaque joueur
+        self.rollbacks = 0
+
+        # La partie publie sur un bus interne ; les événements sont gardés avec leur tick
+        self.events = game.events  # Bus des abonnés (journal...) : événements confirmés seulement
+        self.pending = None  # Événements du tick en cours de simulation
+        game.events = EventBus()
+        game.events.subscribe(self.collect)
+
+    def collect(self, event):
+        # Événement publié hors d'un tick (chargement des images...) : rien à corriger
+        if self.pending is None:
+            self.events.emit(event)
+        else:
+            self.pending.append(event)
+
+    def publish(self, events):
+        for event in events:
+            self.events.emit(event)
+
+    def simulate(self, entry_tick, actions, predicted):
+        # Sauvegarder l'état, puis avancer d'un tick en gardant ses événements
+        self.pending = []
+        self.history.append((entry_tick, self.game.snapshot(), actions, predicted, self.pending))
+        try:
+            self.game.step(actions)
+        finally:
+            self.pending = None
+
+    def flush(self):
+        # Publier les événements des ticks encore dans la fenêtre (fin de partie)
+        for entry in self.history:
+            self.publish(entry[4])
+            entry[4].clear()
+
+    def advance(self, actions):
+        # Un tick ; None pour une action pas encore reçue, remplacée par la prédiction
+        predicted = [action is None for action in actions]
+        actions = [self.last_actions[i] if action is None else action for i, action in enumerate(actions)]
+        for i, action in enumerate(actions):
+            self.last_actions[i] = action
+        if len(self.history) == self.window:
+            # Le plus ancien tick sort de la fenêtre : ses événements sont définitifs
+            self.publish(self.history[0][4])
+        self.simulate(self.frame, actions, predicted)
+        self.frame += 1
+
+    def correct(self, tick, player, action):
+        """Action reçue en retard du joueur « player » pour le tick numéro « tick » (compté par advance).
+
+        Renvoie True si la prédiction était fausse et que la partie a été re-simulée.
+        """
+        start = next((i for i, entry in enumerate(self.history) if entry[0] == tick), None)
+        if start is None:
+            raise ValueError(f"Tick {tick} hors de la fenêtre de retour en arrière")
+        self.history[start][3][player] = False  # L'action de ce tick est désormais connue
+        if self.history[start][2][player] == action:
+            return False
+
+        # Seuls les ticks suivants encore prédits reprennent la nouvelle action ; une action déjà
+        # reçue pour un tick suivant est gardée et devient la prédiction des ticks d'après. Les
+        # événements du premier passage sont abandonnés : la re-simulation publie les siens
+        entries = [self.history[i] for i in range(start, len(self.history))]
+        for _ in entries:
+            self.history.pop()
+
+        self.game.restore(entries[0][1])
+        known = action
+        for entry_tick, _, actions, predicted, _ in entries:
+            actions = list(actions)
+            if entry_tick == tick or predicted[player]:
+                actions[player] = known
+            else:
+                known = actions[player]
+            self.simulate(entry_tick, actions, predicted)
+        self.last_actions[player] = known
+        self.rollbacks += 1
+        return True
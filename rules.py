@@ -0,0 +1,67 @@
+# Règles du jeu indépendantes de l'affichage.
+# Ce module n'importe pas pygame : il est partagé par le jeu et par la simulation sans écran.
+from collections import namedtuple
+from enum import IntEnum
+
+
+# Création de la classe Enum pour les types de cases
+# (IntEnum : les valeurs sont stockées telles quelles dans la grille numpy)
+class TileType(IntEnum):
+    EMPTY = 0
+    WALL = 1
+    BLOCK = 2
+    BOMB = 3
+    EXPLOSION = 4
+    POWER_UP_BOMB = 5
+    POWER_UP_FLAME = 6
+    POWER_UP_SPEED = 7
+
+
+# Constantes du jeu
+# La simulation avance à pas fixe, indépendamment de la fréquence d'affichage : tous les
+# minuteurs comptent des ticks (durées données en secondes et converties avec TICK_RATE).
+# Les vitesses sont en pixels par seconde : à chaque tick, un joueur avance de
+# vitesse / TICK_RATE pixels, et le reste de la division est reporté au tick suivant
+TICK_RATE = 60  # Ticks de simulation par seconde
+FPS = TICK_RATE
+
+# Définir la taille du plateau avec des proportions appropriées
+GRID_WIDTH = 21
+GRID_HEIGHT = 17
+# Tailles de plateau possibles (au-delà de l'écran, la caméra suit les joueurs)
+MIN_GRID_SIZE = 7
+MAX_GRID_SIZE = 128
+MAX_PLAYERS = 16
+
+# Génération du plateau
+BLOCK_DENSITY = 0.4  # 40% de chance d'ajouter un bloc destructible
+POWER_UP_CHANCE = 0.3  # Chance de spawner un power-up quand un bloc est détruit
+
+# Bombes et explosions
+BOMB_TIMER = FPS * 3  # 3 secondes avant explosion
+EXPLOSION_DURATION = 2.0  # En secondes
+
+# Caractéristiques de départ des joueurs
+PLAYER_SPEED = 180  # Pixels par seconde
+SPEED_BONUS = 60  # Pixels par seconde en plus par power-up de vitesse
+PLAYER_MAX_BOMBS = 1
+PLAYER_BOMB_POWER = 2
+
+# Système de points
+SCORE_BLOCK = 100  # Par bloc détruit
+SCORE_POWER_UP = 250  # Par power-up ramassé
+SCORE_KILL = 5000  # Pour avoir éliminé un adversaire
+SCORE_WIN = 10000  # Bonus pour le gagnant
+SCORE_SURVIVAL = 1  # Par seconde de survie
+
+# Barème d'une partie (Bomberman(..., scoring=...)), pour comparer des réglages sans toucher au code
+Scoring = namedtuple('Scoring', ('block', 'power_up', 'kill', 'win', 'survival'))
+DEFAULT_SCORING = Scoring(SCORE_BLOCK, SCORE_POWER_UP, SCORE_KILL, SCORE_WIN, SCORE_SURVIVAL)
+
+# Actions d'un joueur pour un tick : une direction, éventuellement combinée avec ACTION_BOMB
+ACTION_NONE = 0
+ACTION_UP = 1
+ACTION_DOWN = 2
+ACTION_LEFT = 3
+ACTION_RIGHT = 4
+ACTION_BOMB = 8
@@ -0,0 +1,177 @@
+"""Sérialisation binaire de l'état complet d'une partie.
+
+Format versionné, en petit-boutiste, sans pickle ni JSON :
+  en-tête (HEADER), état du générateur aléatoire (RNG_STATE),
+  grille (deux cases par octet), puis les enregistrements de taille fixe des joueurs, des
+  bombes et des explosions (PLAYER_RECORD, BOMB_RECORD, EXPLOSION_RECORD).
+
+StateView lit un état sans le copier : les tableaux de joueurs, de bombes et d'explosions sont
+des vues numpy sur le tampon d'origine (bytes, memoryview, mmap...). restore() recharge un état
+dans une partie, à l'identique : la suite de la partie est la même qu'avec l'originale.
+Les bots (contrôleurs) ne font pas partie de l'état.
+"""
+import struct
+
+import numpy as np
+
+from bomberman import Bomberman
+from config import Config
+
+MAGIC = b"BMST"
+VERSION = 3
+
+# Magic, version, largeur, hauteur, nombre de joueurs, taille des cases, nombre de bombes,
+# nombre d'explosions, tick, graine, prochain numéro de bombe, partie terminée
+HEADER = struct.Struct("<4sHBBBHHHIIIB")
+# Générateur PCG64 : état et incrément (128 bits chacun), demi-tirage 32 bits en réserve
+RNG_STATE = struct.Struct("<16s16sBI")
+
+PLAYER_RECORD = np.dtype([
+    ('x', '<i4'), ('y', '<i4'), ('previous_x', '<i4'), ('previous_y', '<i4'),
+    ('grid_x', 'u1'), ('grid_y', 'u1'), ('alive', 'u1'), ('speed', '<u2'), ('sub_pixel', '<u2'),
+    ('max_bombs', 'u1'), ('bomb_power', 'u1'),
+    ('score', '<i4'), ('blocks_destroyed', '<u2'), ('powerups_collected', '<u2'), ('survival_time', '<u4'),
+])
+BOMB_RECORD = np.dtype([
+    ('x', 'u1'), ('y', 'u1'), ('power', 'u1'), ('owner', 'i1'), ('timer', '<i2'), ('serial', '<u4'),
+])
+EXPLOSION_RECORD = np.dtype([
+    ('x', 'u1'), ('y', 'u1'), ('owner', 'i1'), ('timer', '<i2'), ('duration', '<i2'),
+])
+
+PLAYER_STATS = ('speed', 'sub_pixel', 'max_bombs', 'bomb_power', 'score', 'blocks_destroyed',
+                'powerups_collected', 'survival_time')
+
+
+def pack_grid(grid):
+    # Valeurs de TileType sur 4 bits : deux cases par octet
+    cells = grid.ravel()
+    if len(cells) % 2:
+        cells = np.append(cells, 0)
+    return ((cells[0::2] << 4) | cells[1::2]).astype(np.uint8).tobytes()
+
+
+def unpack_grid(packed, width, height):
+    cells = np.empty(len(packed) * 2, np.uint8)
+    cells[0::2] = packed >> 4
+    cells[1::2] = packed & 0x0F
+    return cells[:width * height].reshape(height, width)
+
+
+def dumps(game):
+    """Encode l'état complet de la partie."""
+    height, width = game.grid.shape
+    index = {player: i for i, player in enumerate(game.players)}
+    bombs = sorted(game.bombs, key=lambda bomb: bomb.serial)
+
+    players = np.array([(player.x, player.y, player.previous_x, player.previous_y, player.grid_x, player.grid_y,
+                          player.alive, *(getattr(player, name) for name in PLAYER_STATS))
+                         for player in game.players], PLAYER_RECORD)
+    bomb_records = np.array([(bomb.x, bomb.y, bomb.power, index.get(bomb.owner, -1), bomb.timer, bomb.serial)
+                             for bomb in bombs], BOMB_RECORD)
+    explosions = np.array([(explosion.x, explosion.y, index.get(explosion.owner, -1), explosion.timer,
+                            explosion.duration) for explosion in game.explosions], EXPLOSION_RECORD)
+
+    rng = game.rng.bit_generator.state
+    header = HEADER.pack(MAGIC, VERSION, width, height, len(game.players), game.tile_size, len(bombs),
+                         len(explosions), game.game_time, game.seed, game.bomb_store.next_serial, game.game_over)
+    rng_state = RNG_STATE.pack(rng['state']['state'].to_bytes(16, 'little'), rng['state']['inc'].to_bytes(16, 'little'),
+                               rng['has_uint32'], rng['uinteger'])
+    return b"".join((header, rng_state, pack_grid(game.grid), players.tobytes(), bomb_records.tobytes(),
+                     explosions.tobytes()))
+
+
+class StateView:
+    """Lecture d'un état encodé par dumps(), sans copie du tampon."""
+
+    def __init__(self, buffer):
+        buffer = memoryview(buffer)
+        (magic, version, self.width, self.height, n_players, self.tile_size, n_bombs, n_explosions,
+         self.game_time, self.seed, self.next_serial, game_over) = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError("Ce tampon ne contient pas un état de partie")
+        if version != VERSION:
+            raise ValueError(f"Version d'état non gérée: {version}")
+        self.game_over = bool(game_over)
+
+        offset = HEADER.size
+        state, inc, has_uint32, uinteger = RNG_STATE.unpack_from(buffer, offset)
+        self.rng_state = {
+            'bit_generator': 'PCG64',
+            'state': {'state': int.from_bytes(state, 'little'), 'inc': int.from_bytes(inc, 'little')},
+            'has_uint32': has_uint32,
+            'uinteger': uinteger,
+        }
+        offset += RNG_STATE.size
+
+        grid_size = (self.width * self.height + 1) // 2
+        self.packed_grid = np.frombuffer(buffer, np.uint8, grid_size, offset)
+        offset += grid_size
+        self.players = np.frombuffer(buffer, PLAYER_RECORD, n_players, offset)
+        offset += PLAYER_RECORD.itemsize * n_players
+        self.bombs = np.frombuffer(buffer, BOMB_RECORD, n_bombs, offset)
+        offset += BOMB_RECORD.itemsize * n_bombs
+        self.explosions = np.frombuffer(buffer, EXPLOSION_RECORD, n_explosions, offset)
+        self.size = offset + EXPLOSION_RECORD.itemsize * n_explosions
+        if self.size > len(buffer):
+            raise ValueError("État tronqué")
+
+    @property
+    def grid(self):
+        return unpack_grid(self.packed_grid, self.width, self.height)
+
+
+def restore(game, state):
+    """Recharge dans game un état (StateView ou tampon encodé par dumps())."""
+    if not isinstance(state, StateView):
+        state = StateView(state)
+    if len(state.players) != len(game.players):
+        raise ValueError(f"État pour {len(state.players)} joueurs")
+    if (state.height, state.width) != game.grid.shape:
+        raise ValueError(f"État pour un plateau de {state.width}x{state.height}")
+    if state.tile_size != game.tile_size:
+        raise ValueError(f"État enregistré avec des cases de {state.tile_size} pixels")
+
+    game.seed = state.seed
+    game.rng.bit_generator.state = state.rng_state
+    game.game_time = state.game_time
+    game.game_over = state.game_over
+    game.grid = state.grid
+
+    for player, record in zip(game.players, state.players.tolist()):
+        (player.x, player.y, player.previous_x, player.previous_y, player.grid_x, player.grid_y,
+         alive, *stats) = record
+        player.alive = bool(alive)
+        for name, value in zip(PLAYER_STATS, stats):
+            setattr(player, name, value)
+
+    game.bombs.clear()
+    game.bomb_store.clear()
+    game.danger.clear()
+    for x, y, power, owner, timer, serial in state.bombs.tolist():
+        bomb = game.bomb_store.create(x, y, power, game.players[owner] if owner >= 0 else None)
+        bomb.timer = timer
+        bomb.serial = serial
+        game.add_bomb(bomb)
+    game.bomb_store.next_serial = state.next_serial
+
+    game.explosions.clear()
+    for x, y, owner, timer, duration in state.explosions.tolist():
+        explosion = game.explosions.create(x, y, 0, game.players[owner] if owner >= 0 else None)
+        explosion.duration = duration
+        explosion.timer = timer
+
+    game.world_version += 1
+    if game.background is not None:
+        game.build_background()
+    return game
+
+
+def loads(data, screen=None):
+    """Crée une partie à partir d'un état encodé par dumps()."""
+    state = StateView(data)
+    # Même taille de cases que la partie d'origine : les positions sont en pixels
+    config = Config(screen.get_size() if screen is not None else None, state.tile_size)
+    game = Bomberman(screen, seed=state.seed, width=state.width, height=state.height,
+                     n_players=len(state.players), config=config)
+    return restore(game, state)
@@ -0,0 +1,218 @@
+"""Serveur de jeu en réseau : le serveur fait tourner les parties, les clients ne font qu'afficher.
+
+Chaque salle (room) est une partie Bomberman sans affichage qui avance à TICK_RATE ticks par
+seconde. Les clients envoient leurs actions, le serveur leur renvoie à chaque tick seulement ce
+qui a changé depuis le tick précédent (cases, joueurs, bombes et explosions ajoutées ou
+retirées). Les places libres d'une salle sont tenues par des bots.
+
+Le protocole (messages JSON sur TCP) est décrit dans protocol.py.
+
+Utilisation : python server.py [--host 0.0.0.0] [--port 7777]
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import asyncio
+import json
+import random
+
+from bomberman import Bomberman
+from cli import map_size
+from contantes import *
+from maps import load_pool
+from protocol import DEFAULT_PORT, MAX_MESSAGE_SIZE, StateEncoder, encode
+
+RESTART_DELAY = TICK_RATE * 3  # Ticks entre la fin d'une partie et la suivante
+MAX_WRITE_BUFFER = 256 * 1024  # Un client qui n'arrive pas à suivre est déconnecté
+
+
+class Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.action = ACTION_NONE  # Dernière action reçue, appliquée à chaque tick
+
+    def send(self, data):
+        # Les données sont mises en tampon ; un client trop lent est déconnecté
+        if self.writer.is_closing():
+            return
+        if self.writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            self.writer.close()
+            return
+        self.writer.write(data)
+
+    async def receive(self):
+        # Message suivant, ou None à la déconnexion
+        try:
+            line = await self.reader.readline()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            return None
+        if not line:
+            return None
+        # Message illisible ou qui n'est pas un objet JSON : ignoré comme un message vide
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return {}
+        return message if isinstance(message, dict) else {}
+
+
+class Room:
+    def __init__(self, name, tick_rate=TICK_RATE, seed=None, width=GRID_WIDTH, height=GRID_HEIGHT, n_players=2,
+                 maps=None):
+        self.name = name
+        self.tick_rate = tick_rate
+        self.width = width
+        self.height = height
+        self.n_players = n_players
+        self.maps = maps  # Réserve de plateaux validés (MapPool), partagée par les salles
+        self.rng = random.Random(seed)
+        self.connections = {}  # Indice du joueur -> Connection
+        self.task = None
+        self.new_match()
+
+    def new_match(self):
+        # Nouvelle partie : toutes les places libres sont tenues par des bots
+        self.game = Bomberman(None, seed=self.rng.randrange(2 ** 32), width=self.width, height=self.height,
+                              n_players=self.n_players, maps=self.maps)
+        for index in range(len(self.game.players)):
+            if index not in self.connections:
+                self.game.add_bot(index)
+        self.encoder = StateEncoder()
+        self.restart_in = None
+        self.broadcast(encode(self.encoder.snapshot(self.game)))
+
+    @property
+    def full(self):
+        return len(self.connections) == len(self.game.players)
+
+    def join(self, connection):
+        # Donner au client la première place libre (reprise à un bot) et lui envoyer l'état complet
+        index = next(i for i in range(len(self.game.players)) if i not in self.connections)
+        self.connections[index] = connection
+        self.game.players[index].controller = None
+        connection.send(encode({'type': 'welcome', 'player': index, 'room': self.name}))
+        connection.send(encode(StateEncoder().snapshot(self.game)))
+        return index
+
+    def leave(self, index):
+        # La place libérée est reprise par un bot
+        del self.connections[index]
+        self.game.add_bot(index)
+
+    def broadcast(self, data):
+        for connection in list(self.connections.values()):
+            connection.send(data)
+
+    def tick(self):
+        if self.game.game_over:
+            if self.restart_in is None:
+                self.restart_in = RESTART_DELAY
+            self.restart_in -= 1
+            if self.restart_in <= 0:
+                self.new_match()
+            return
+
+        actions = self.game.read_actions()
+        for index, connection in self.connections.items():
+            actions[index] = connection.action
+        self.game.step(actions)
+        self.broadcast(encode(self.encoder.delta(self.game)))
+
+    async def run(self):
+        # Boucle à pas fixe ; en cas de retard, les ticks manqués sont rattrapés (dans la limite
+        # de MAX_FRAME_TIME) pour que la partie garde sa vitesse
+        loop = asyncio.get_running_loop()
+        tick_duration = 1.0 / self.tick_rate
+        next_tick = loop.time()
+        while self.connections:
+            self.tick()
+            next_tick += tick_duration
+            delay = next_tick - loop.time()
+            if delay < -MAX_FRAME_TIME:
+                next_tick = loop.time()
+            await asyncio.sleep(max(delay, 0))
+
+
+class GameServer:
+    def __init__(self, tick_rate=TICK_RATE, max_rooms=64, width=GRID_WIDTH, height=GRID_HEIGHT, n_players=2):
+        self.tick_rate = tick_rate
+        self.max_rooms = max_rooms
+        self.room_options = {'width': width, 'height': height, 'n_players': n_players,
+                             'maps': load_pool(width, height, n_players)}
+        self.rooms = {}
+
+    async def handle_client(self, reader, writer):
+        connection = Connection(reader, writer)
+        room = index = None
+        try:
+            message = await connection.receive()
+            if not message or message.get('type') != 'join':
+                connection.send(encode({'type': 'error', 'message': "Message « join » attendu"}))
+                return
+
+            room = self.find_room(str(message.get('room', 'default')))
+            if room is None:
+                connection.send(encode({'type': 'error', 'message': "Salle pleine ou trop de salles"}))
+                return
+            index = room.join(connection)
+            if room.task is None:
+                room.task = asyncio.create_task(room.run())
+
+            while True:
+                message = await connection.receive()
+                if message is None:
+                    break
+                if message.get('type') == 'input':
+                    action = message.get('action')
+                    if isinstance(action, int) and 0 <= action <= (ACTION_RIGHT | ACTION_BOMB):
+                        connection.action = action
+        finally:
+            if room is not None and index is not None:
+                room.leave(index)
+                if not room.connections:
+                    self.close_room(room)
+            writer.close()
+
+    def find_room(self, name):
+        room = self.rooms.get(name)
+        if room is None:
+            if len(self.rooms) >= self.max_rooms:
+                return None
+            room = self.rooms[name] = Room(name, self.tick_rate, **self.room_options)
+        return None if room.full else room
+
+    def close_room(self, room):
+        if room.task is not None:
+            room.task.cancel()
+        self.rooms.pop(room.name, None)
+
+    async def serve(self, host='127.0.0.1', port=DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle_client, host, port, limit=MAX_MESSAGE_SIZE)
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serveur de parties Bomberman")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--max-rooms", type=int, default=64)
+    parser.add_argument("--players", type=int, default=2, help="joueurs par salle (places libres : bots)")
+    parser.add_argument("--map", type=map_size, default=(GRID_WIDTH, GRID_HEIGHT), metavar="LxH",
+                        help="taille du plateau des salles")
+    args = parser.parse_args()
+
+    print(f"Serveur Bomberman sur {args.host}:{args.port}")
+    try:
+        width, height = args.map
+        server = GameServer(max_rooms=args.max_rooms, width=width, height=height, n_players=args.players)
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+import time
+
+import numpy as np
+
+from grid import *
+
+
+class BatchSimulation:
+    """Simulation sans affichage de plusieurs parties en parallèle.
+
+    Reprend les règles de Bomberman.update (entrées, joueurs, bombes, explosions, fin de partie)
+    sur des tableaux numpy de forme (parties, ...). Les actions de chaque joueur sont des codes
+    ACTION_* (direction, éventuellement combinée avec ACTION_BOMB) au lieu de l'état du clavier.
+    Les explosions n'existent que sous forme de minuteur par case, et le point d'élimination
+    est attribué au propriétaire de la bombe qui a touché le joueur. Les déplacements gardent le
+    test d'un pas entier (sans sous-pas ni glissement dans les coins, voir collision.py).
+    """
+
+    def __init__(self, n_matches, n_players=2, width=GRID_WIDTH, height=GRID_HEIGHT,
+                 tile_size=48, bomb_capacity=32, seed=None, scoring=DEFAULT_SCORING):
+        spawns = spawn_positions(width, height)
+        if not 1 <= n_players <= len(spawns):
+            raise ValueError(f"Nombre de joueurs invalide: {n_players} (1 à {len(spawns)})")
+        if tile_size < 20:
+            raise ValueError(f"Taille de case trop petite: {tile_size}")
+
+        self.n_matches = n_matches
+        self.n_players = n_players
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.bomb_capacity = bomb_capacity
+        self.scoring = scoring
+        self.rng = np.random.default_rng(seed)
+        self.spawns = spawns[:n_players]
+
+        # Mêmes dimensions que Player et Bomb pour la collision
+        player_radius = tile_size // 2 - 8
+        bomb_radius = tile_size // 2 - 5
+        self.collision_radius = int(player_radius * 0.6)
+        self.bomb_clearance_sq = (player_radius * 0.6 + bomb_radius * 0.8) ** 2
+        self.explosion_frames = int(EXPLOSION_DURATION * FPS)
+
+        shape = (n_matches, n_players)
+        self.match_index = np.broadcast_to(np.arange(n_matches)[:, None], shape)
+        self.player_index = np.broadcast_to(np.arange(n_players)[None, :], shape)
+
+        # Plateaux et cases
+        self.grid = np.empty((n_matches, height, width), np.uint8)
+        self.explosion_timer = np.zeros((n_matches, height, width), np.int16)
+        self.bomb_at = np.full((n_matches, height, width), -1, np.int16)
+
+        # Joueurs
+        self.x = np.zeros(shape, np.int32)
+        self.y = np.zeros(shape, np.int32)
+        self.grid_x = np.zeros(shape, np.int32)
+        self.grid_y = np.zeros(shape, np.int32)
+        self.alive = np.zeros(shape, bool)
+        self.speed = np.zeros(shape, np.int32)  # Pixels par seconde
+        self.sub_pixel = np.zeros(shape, np.int32)  # Déplacement en réserve, en 1/TICK_RATE de pixel
+        self.max_bombs = np.zeros(shape, np.int32)
+        self.bomb_power = np.zeros(shape, np.int32)
+        self.active_bombs = np.zeros(shape, np.int32)
+        self.score = np.zeros(shape, np.int64)
+        self.blocks_destroyed = np.zeros(shape, np.int32)
+        self.powerups_collected = np.zeros(shape, np.int32)
+        self.survival_time = np.zeros(shape, np.int32)
+
+        # Bombes (emplacements fixes par partie)
+        bomb_shape = (n_matches, bomb_capacity)
+        self.bomb_active = np.zeros(bomb_shape, bool)
+        self.bomb_x = np.zeros(bomb_shape, np.int32)
+        self.bomb_y = np.zeros(bomb_shape, np.int32)
+        self.bomb_timer = np.zeros(bomb_shape, np.int16)
+        self.bomb_slot_power = np.zeros(bomb_shape, np.int32)  # Puissance de chaque bombe posée
+        self.bomb_owner = np.zeros(bomb_shape, np.int32)
+
+        # État des parties
+        self.game_time = np.zeros(n_matches, np.int64)
+        self.game_over = np.zeros(n_matches, bool)
+
+        self.reset()
+
+    def reset(self, matches=None):
+        # Réinitialise les parties indiquées (indices ou masque booléen), toutes par défaut
+        if matches is None:
+            matches = np.arange(self.n_matches)
+        else:
+            matches = np.asarray(matches)
+            if matches.dtype == bool:
+                matches = np.flatnonzero(matches)
+        if matches.size == 0:
+            return
+
+        self.grid[matches] = self.generate_grids(matches.size)
+        self.explosion_timer[matches] = 0
+        self.bomb_at[matches] = -1
+
+        ts = self.tile_size
+        for p, (sx, sy) in enumerate(self.spawns):
+            self.grid_x[matches, p] = sx
+            self.grid_y[matches, p] = sy
+            self.x[matches, p] = sx * ts + ts // 2
+            self.y[matches, p] = sy * ts + ts // 2
+        self.alive[matches] = True
+        self.speed[matches] = PLAYER_SPEED
+        self.sub_pixel[matches] = 0
+        self.max_bombs[matches] = PLAYER_MAX_BOMBS
+        self.bomb_power[matches] = PLAYER_BOMB_POWER
+        self.active_bombs[matches] = 0
+        self.score[matches] = 0
+        self.blocks_destroyed[matches] = 0
+        self.powerups_collected[matches] = 0
+        self.survival_time[matches] = 0
+
+        self.bomb_active[matches] = False
+        self.game_time[matches] = 0
+        self.game_over[matches] = False
+
+    def generate_grids(self, count):
+        # Équivalent de Bomberman.create_grid pour plusieurs plateaux à la fois
+        return generate_grids(self.rng, count, self.width, self.height, self.spawns)
+
+    # ----------------------------------------
+    # BOUCLE DE SIMULATION
+    # ----------------------------------------
+    def step(self, actions):
+        # Avance toutes les parties non terminées d'un tick ; actions est de forme (parties, joueurs)
+        actions = np.asarray(actions)
+        if actions.shape != (self.n_matches, self.n_players):
+            raise ValueError(f"Forme des actions invalide: {actions.shape}")
+
+        running = ~self.game_over
+        self.apply_actions(actions, running)
+
+        self.game_time += running
+        self.update_players(running)
+        self.update_bombs(running)
+        self.update_explosions(running)
+
+        # Vérification des conditions de fin de partie
+        ended = running & (self.alive.sum(axis=1) <= 1)
+        self.score += np.where(ended[:, None] & self.alive, self.scoring.win, 0)
+        self.game_over |= ended
+        return self.game_over
+
+    def apply_actions(self, actions, running):
+        # Équivalent de Player.handle_input pour tous les joueurs
+        active = self.alive & running[:, None]
+        direction = np.where(active, actions & 7, ACTION_NONE)
+
+        # Pixels entiers parcourus pendant ce tick, le reste est gardé pour le suivant
+        moving = (direction >= ACTION_UP) & (direction <= ACTION_RIGHT)
+        distance, sub_pixel = np.divmod(self.sub_pixel + self.speed, TICK_RATE)
+        self.sub_pixel = np.where(moving, sub_pixel, self.sub_pixel)
+        dx = np.where(direction == ACTION_LEFT, -distance, np.where(direction == ACTION_RIGHT, distance, 0))
+        dy = np.where(direction == ACTION_UP, -distance, np.where(direction == ACTION_DOWN, distance, 0))
+
+        # Vérifier si le mouvement est valide, un axe après l'autre
+        move_x = (dx != 0) & self.can_move(self.x + dx, self.y)
+        self.x += np.where(move_x, dx, 0)
+        move_y = (dy != 0) & self.can_move(self.x, self.y + dy)
+        self.y += np.where(move_y, dy, 0)
+
+        # Placement de bombe, joueur par joueur pour départager deux joueurs sur la même case
+        wants_bomb = active & ((actions & ACTION_BOMB) != 0) & (self.active_bombs < self.max_bombs)
+        for p in range(self.n_players):
+            matches = np.flatnonzero(wants_bomb[:, p])
+            if matches.size:
+                self.place_bombs(matches, p)
+
+    def can_move(self, new_x, new_y):
+        # Équivalent vectorisé de Player.can_move : quatre points cardinaux du cercle de collision
+        ts = self.tile_size
+        r = self.collision_radius
+        allowed = np.ones(new_x.shape, bool)
+
+        for point_x, point_y in ((new_x - r, new_y), (new_x + r, new_y), (new_x, new_y - r), (new_x, new_y + r)):
+            grid_x = point_x // ts
+            grid_y = point_y // ts
+            inside = (grid_x >= 0) & (grid_x < self.width) & (grid_y >= 0) & (grid_y < self.height)
+            grid_x = np.clip(grid_x, 0, self.width - 1)
+            grid_y = np.clip(grid_y, 0, self.height - 1)
+
+            tile = self.grid[self.match_index, grid_y, grid_x]
+            allowed &= inside & (tile != WALL) & (tile != BLOCK)
+
+            # Collision avec le corps d'une bombe, sauf sur la case où se trouve déjà le joueur
+            on_bomb = (tile == BOMB) & ((grid_x != self.grid_x) | (grid_y != self.grid_y))
+            distance_sq = (new_x - (grid_x * ts + ts // 2)) ** 2 + (new_y - (grid_y * ts + ts // 2)) ** 2
+            allowed &= ~(on_bomb & (distance_sq < self.bomb_clearance_sq))
+
+        return allowed
+
+    def place_bombs(self, matches, p):
+        # Équivalent de Player.place_bomb pour le joueur p dans les parties indiquées
+        grid_x = self.grid_x[matches, p]
+        grid_y = self.grid_y[matches, p]
+        slot = np.argmin(self.bomb_active[matches], axis=1)
+        ok = (self.grid[matches, grid_y, grid_x] == EMPTY) & ~self.bomb_active[matches, slot]
+        matches, slot, grid_x, grid_y = matches[ok], slot[ok], grid_x[ok], grid_y[ok]
+
+        self.grid[matches, grid_y, grid_x] = BOMB
+        self.bomb_at[matches, grid_y, grid_x] = slot
+        self.bomb_active[matches, slot] = True
+        self.bomb_x[matches, slot] = grid_x
+        self.bomb_y[matches, slot] = grid_y
+        self.bomb_timer[matches, slot] = BOMB_TIMER
+        self.bomb_slot_power[matches, slot] = self.bomb_power[matches, p]
+        self.bomb_owner[matches, slot] = p
+        self.active_bombs[matches, p] += 1
+
+    def update_players(self, running):
+        # Équivalent de Player.update et du temps de survie dans Bomberman.update
+        active = self.alive & running[:, None]
+        ts = self.tile_size
+        self.grid_x = np.where(active, self.x // ts, self.grid_x)
+        self.grid_y = np.where(active, self.y // ts, self.grid_y)
+
+        # Ramassage des power-ups (le premier joueur sur la case le prend)
+        for p in range(self.n_players):
+            matches = np.flatnonzero(active[:, p])
+            grid_x = self.grid_x[matches, p]
+            grid_y = self.grid_y[matches, p]
+            tile = self.grid[matches, grid_y, grid_x]
+            bonus = (tile >= POWER_UP_BOMB) & (tile <= POWER_UP_SPEED)
+            if not bonus.any():
+                continue
+            matches, tile = matches[bonus], tile[bonus]
+            self.grid[matches, grid_y[bonus], grid_x[bonus]] = EMPTY
+            self.powerups_collected[matches, p] += 1
+            self.score[matches, p] += self.scoring.power_up
+            self.max_bombs[matches, p] += tile == POWER_UP_BOMB
+            self.bomb_power[matches, p] += tile == POWER_UP_FLAME
+            self.speed[matches, p] += (tile == POWER_UP_SPEED) * SPEED_BONUS
+
+        # Régler le décalage pour être au centre de la case
+        centred = active & (self.x % ts == 0) & (self.y % ts == 0)
+        self.x = np.where(centred, self.grid_x * ts + ts // 2, self.x)
+        self.y = np.where(centred, self.grid_y * ts + ts // 2, self.y)
+
+        # Temps de survie et points de survie chaque seconde
+        self.survival_time += active
+        self.score += (active & (self.game_time % FPS == 0)[:, None]) * self.scoring.survival
+
+    def update_bombs(self, running):
+        # Décompte des bombes puis explosions, réactions en chaîne comprises
+        ticking = self.bomb_active & running[:, None]
+        self.bomb_timer -= ticking
+        due = ticking & (self.bomb_timer <= 0)
+        if not due.any():
+            return
+
+        # Comme dans Bomberman.resolve_explosions, les blocs touchés restent en place jusqu'à la
+        # fin de la réaction en chaîne : ils arrêtent aussi les rayons des bombes suivantes
+        blast = np.zeros(self.grid.shape, bool)
+        blast_owner = np.full(self.grid.shape, -1, np.int32)
+        block_hits = []
+        while due.any():
+            due = self.explode_bombs(*np.nonzero(due), blast, blast_owner, block_hits)
+        if block_hits:
+            self.destroy_blocks(*(np.concatenate(column) for column in zip(*block_hits)))
+
+        self.explosion_timer[blast] = self.explosion_frames
+
+        # Vérifier si des joueurs sont touchés par l'explosion
+        hit = self.alive & blast[self.match_index, self.grid_y, self.grid_x]
+        if hit.any():
+            self.alive &= ~hit
+            killer = blast_owner[self.match_index, self.grid_y, self.grid_x]
+            credited = hit & (killer >= 0) & (killer != self.player_index)  # Pas de points pour un suicide
+            np.add.at(self.score, (self.match_index[credited], killer[credited]), self.scoring.kill)
+
+    def explode_bombs(self, matches, slots, blast, blast_owner, block_hits):
+        # Fait exploser un lot de bombes et renvoie le masque des bombes touchées en chaîne ;
+        # les blocs touchés sont ajoutés à block_hits, sans être détruits
+        self.bomb_active[matches, slots] = False
+        x = self.bomb_x[matches, slots]
+        y = self.bomb_y[matches, slots]
+        power = self.bomb_slot_power[matches, slots]
+        owner = self.bomb_owner[matches, slots]
+
+        # Retirer les bombes de la grille et décrémenter les compteurs des joueurs
+        self.bomb_at[matches, y, x] = -1
+        self.grid[matches, y, x] = EMPTY
+        np.subtract.at(self.active_bombs, (matches, owner), 1)
+
+        blast[matches, y, x] = True
+        blast_owner[matches, y, x] = owner
+
+        chained = np.zeros(self.bomb_active.shape, bool)
+        for dx, dy in DIRECTIONS:
+            open_ray = np.ones(matches.size, bool)
+            for i in range(1, int(power.max()) + 1):
+                nx = x + dx * i
+                ny = y + dy * i
+                open_ray &= (power >= i) & (nx >= 0) & (nx < self.width) & (ny >= 0) & (ny < self.height)
+                k = np.flatnonzero(open_ray)
+                if k.size == 0:
+                    break
+                m, kx, ky = matches[k], nx[k], ny[k]
+                tile = self.grid[m, ky, kx]
+
+                # L'explosion est bloquée par un mur fixe, ou après avoir détruit un bloc
+                reached = tile != WALL
+                blast[m[reached], ky[reached], kx[reached]] = True
+                blast_owner[m[reached], ky[reached], kx[reached]] = owner[k[reached]]
+                block = tile == BLOCK
+                if block.any():
+                    block_hits.append((m[block], ky[block], kx[block], owner[k[block]]))
+                open_ray[k[~reached | block]] = False
+
+                # Déclencher une réaction en chaîne
+                bomb = tile == BOMB
+                if bomb.any():
+                    chained[m[bomb], self.bomb_at[m[bomb], ky[bomb], kx[bomb]]] = True
+
+        return chained & self.bomb_active
+
+    def destroy_blocks(self, matches, y, x, owner):
+        # Un bloc touché par plusieurs rayons n'est détruit (et compté) qu'une fois
+        flat = (matches * self.height + y) * self.width + x
+        _, first = np.unique(flat, return_index=True)
+        matches, y, x, owner = matches[first], y[first], x[first], owner[first]
+
+        np.add.at(self.blocks_destroyed, (matches, owner), 1)
+        np.add.at(self.score, (matches, owner), self.scoring.block)
+
+        # Chance de spawner un power-up
+        spawn = self.rng.random(matches.size) < POWER_UP_CHANCE
+        power_up = self.rng.integers(POWER_UP_BOMB, POWER_UP_SPEED + 1, matches.size)
+        self.grid[matches, y, x] = np.where(spawn, power_up, EMPTY)
+
+    def update_explosions(self, running):
+        # Mise à jour des explosions (le minuteur de chaque case diminue jusqu'à 0)
+        np.subtract(self.explosion_timer, 1, out=self.explosion_timer,
+                    where=(self.explosion_timer > 0) & running[:, None, None])
+
+
+def benchmark(n_matches=1024, ticks=600, seed=0):
+    # Mesure le débit de la simulation avec des actions aléatoires
+    simulation = BatchSimulation(n_matches, seed=seed)
+    rng = np.random.default_rng(seed)
+    actions = rng.integers(0, 5, (ticks, n_matches, simulation.n_players))
+    actions |= np.where(rng.random(actions.shape) < 0.02, ACTION_BOMB, 0)
+
+    start = time.perf_counter()
+    for tick in range(ticks):
+        simulation.reset(simulation.game_over)
+        simulation.step(actions[tick])
+    elapsed = time.perf_counter() - start
+    return n_matches * ticks / elapsed
+
+
+if __name__ == "__main__":
+    print(f"{benchmark():.0f} ticks de partie par seconde")
@@ -0,0 +1,81 @@
+"""Images pré-calculées des bombes, des explosions et des power-ups.
+
+Toutes les images d'animation sont dessinées une seule fois pour une taille de cases, dans une
+seule surface (l'atlas) : une image par valeur du minuteur d'une bombe, une par rayon
+d'explosion et une par power-up. C'est le seul endroit où ces objets sont dessinés. À
+l'affichage, chaque image n'est plus qu'une zone de l'atlas, et toutes les bombes et
+explosions visibles sont copiées à l'écran en un appel à Surface.blits.
+"""
+import pygame
+
+from contantes import *
+from grid import POWER_UP_BOMB, POWER_UP_FLAME, POWER_UP_SPEED
+
+COLUMNS = 16  # Images par ligne de l'atlas
+COLOR_KEY = (255, 0, 255)  # Couleur transparente (absente des images)
+
+
+class SpriteAtlas:
+    def __init__(self, tile_size):
+        self.tile_size = tile_size
+        self.max_radius = tile_size // 2  # Rayon d'une explosion qui commence
+        bomb_radius = tile_size // 2 - 5
+
+        # Une image par minuteur de bombe (0 à BOMB_TIMER), par rayon d'explosion et par power-up
+        frames = [self.draw_bomb(timer, bomb_radius) for timer in range(BOMB_TIMER + 1)]
+        frames += [self.draw_explosion(radius) for radius in range(self.max_radius + 1)]
+        frames += [self.draw_power_up(color) for color in (ORANGE, RED, CYAN)]
+
+        rows = (len(frames) + COLUMNS - 1) // COLUMNS
+        self.sheet = pygame.Surface((COLUMNS * tile_size, rows * tile_size)).convert()
+        self.sheet.fill(COLOR_KEY)
+        self.areas = [pygame.Rect(i % COLUMNS * tile_size, i // COLUMNS * tile_size, tile_size, tile_size)
+                      for i in range(len(frames))]
+        self.sheet.blits(list(zip(frames, self.areas)), doreturn=False)
+        # Sans RLEACCEL : une surface RLE est décodée depuis son début à chaque copie d'une zone
+        self.sheet.set_colorkey(COLOR_KEY)
+
+        self.bomb_areas = self.areas[:BOMB_TIMER + 1]
+        self.explosion_areas = self.areas[BOMB_TIMER + 1:BOMB_TIMER + 2 + self.max_radius]
+        self.power_up_areas = dict(zip((POWER_UP_BOMB, POWER_UP_FLAME, POWER_UP_SPEED), self.areas[-3:]))
+
+    def frame(self):
+        surface = pygame.Surface((self.tile_size, self.tile_size))
+        surface.fill(COLOR_KEY)
+        return surface
+
+    def draw_bomb(self, timer, radius):
+        # Cercle noir qui pulse et mèche qui raccourcit
+        surface = self.frame()
+        center = (self.tile_size // 2, self.tile_size // 2)
+        pulse_factor = (timer % 20) / 20
+        size = int(radius * (0.8 + 0.2 * pulse_factor))
+        pygame.draw.circle(surface, BLACK, center, size)
+        fuse_length = int(self.tile_size * 0.2 * (timer / BOMB_TIMER))
+        if fuse_length > 0:
+            pygame.draw.line(surface, RED, (center[0], center[1] - size // 2),
+                             (center[0], center[1] - size // 2 - fuse_length), 3)
+        return surface
+
+    def draw_explosion(self, radius):
+        # Cercle jaune qui rétrécit avec le temps restant, cœur rouge
+        surface = self.frame()
+        center = (self.tile_size // 2, self.tile_size // 2)
+        pygame.draw.circle(surface, YELLOW, center, radius)
+        pygame.draw.circle(surface, RED, center, radius // 2)
+        return surface
+
+    def draw_power_up(self, color):
+        # Fond vert et disque de la couleur du bonus
+        surface = self.frame()
+        surface.fill(GREEN)
+        pygame.draw.circle(surface, color, (self.tile_size // 2, self.tile_size // 2), self.tile_size // 3)
+        return surface
+
+    def bomb_area(self, timer):
+        return self.bomb_areas[min(max(timer, 0), BOMB_TIMER)]
+
+    def explosion_area(self, timer, duration):
+        # Rayon proportionnel au temps restant
+        radius = int(self.max_radius * (timer / duration))
+        return self.explosion_areas[min(max(radius, 0), self.max_radius)]
@@ -0,0 +1,41 @@
+import pytest
+
+import player
+from bomberman import Bomberman
+from config import Config
+from contantes import *
+from grid import grid_template
+
+
+@pytest.mark.parametrize('tick_rate', [60, 120, 144, 240])
+def test_speed_per_second_does_not_depend_on_tick_rate(monkeypatch, tick_rate):
+    # Une seconde de déplacement sur une ligne dégagée : PLAYER_SPEED pixels, puis
+    # PLAYER_SPEED + SPEED_BONUS avec un power-up, quelle que soit la fréquence des ticks
+    monkeypatch.setattr(player, 'TICK_RATE', tick_rate)
+    game = Bomberman(None, seed=0, config=Config(tile_size=48), grid=grid_template(GRID_WIDTH, GRID_HEIGHT))
+    p = game.players[0]
+    start = p.x
+    for _ in range(tick_rate):
+        p.apply_action(ACTION_RIGHT, game)
+    assert p.x - start == PLAYER_SPEED
+
+    p.speed += SPEED_BONUS
+    start = p.x
+    for _ in range(tick_rate):
+        p.apply_action(ACTION_LEFT, game)
+    assert start - p.x == PLAYER_SPEED + SPEED_BONUS
+
+
+def test_bomb_limit_counts_bombs_still_on_the_board():
+    game = Bomberman(None, seed=0, config=Config(tile_size=48), grid=grid_template(GRID_WIDTH, GRID_HEIGHT))
+    p = game.players[0]
+    game.step([ACTION_BOMB, ACTION_NONE])
+    for _ in range(game.tile_size):
+        game.step([ACTION_RIGHT | ACTION_BOMB, ACTION_NONE])
+    assert game.bombs.count(p) == PLAYER_MAX_BOMBS
+
+    # Une fois la bombe explosée, le joueur peut en poser une autre
+    while game.bombs.count(p):
+        game.step([ACTION_NONE, ACTION_NONE])
+    game.step([ACTION_BOMB, ACTION_NONE])
+    assert game.bombs.count(p) == 1
@@ -0,0 +1,51 @@
+from bomberman import Bomberman
+from contantes import *
+from rollback import Rollback
+
+
+def test_late_action_keeps_inputs_received_for_later_ticks():
+    # L'action du joueur 0 pour le tick 7 arrive en retard, celles des ticks 8 à 13 sont déjà
+    # arrivées : après correction, la partie doit être celle qui a reçu toutes les actions à temps
+    inputs = [ACTION_NONE] * 7 + [ACTION_DOWN] + [ACTION_NONE] * 6
+    reference = Bomberman(None, seed=0)
+    for action in inputs:
+        reference.step([action, ACTION_NONE])
+
+    game = Bomberman(None, seed=0)
+    rollback = Rollback(game, window=16)
+    for tick, action in enumerate(inputs):
+        rollback.advance([None if tick == 7 else action, ACTION_NONE])
+    assert rollback.correct(7, 0, ACTION_DOWN)
+
+    assert game.players[0].y == reference.players[0].y
+    assert game.checksum() == reference.checksum()
+    assert rollback.last_actions[0] == ACTION_NONE
+
+
+def test_events_of_corrected_ticks_replace_mispredicted_ones():
+    # Un bot joue le joueur 1, dont les actions arrivent avec 5 ticks de retard : les événements
+    # publiés doivent être ceux de la partie de référence
+    reference = Bomberman(None, seed=1)
+    reference.add_bot(0)
+    reference.add_bot(1)
+    expected = []
+    reference.events.subscribe(expected.append)
+    inputs = []
+    while not reference.game_over and reference.game_time < 2000:
+        inputs.append(reference.read_actions())
+        reference.step(inputs[-1])
+
+    game = Bomberman(None, seed=1)
+    published = []
+    game.events.subscribe(published.append)
+    rollback = Rollback(game)
+    for tick, actions in enumerate(inputs):
+        rollback.advance([actions[0], None])
+        if tick >= 5:
+            rollback.correct(tick - 5, 1, inputs[tick - 5][1])
+    for tick in range(max(len(inputs) - 5, 0), len(inputs)):
+        rollback.correct(tick, 1, inputs[tick][1])
+    rollback.flush()
+
+    assert rollback.rollbacks > 0
+    assert published == expected
@@ -0,0 +1,65 @@
+import numpy as np
+
+from grid import *
+from simulation import BatchSimulation
+
+
+def test_bomb_power_per_player_survives_other_bombs():
+    # Le joueur 0 ramasse deux bonus de puissance, puis le joueur 1 pose une bombe dans
+    # l'emplacement 0 : la puissance du joueur 0 ne doit pas changer
+    sim = BatchSimulation(1, n_players=2, seed=0)
+    for _ in range(2):
+        x, y = sim.grid_x[0, 0], sim.grid_y[0, 0]
+        sim.grid[0, y, x] = POWER_UP_FLAME
+        sim.step(np.full((1, 2), ACTION_NONE))
+    assert sim.bomb_power[0, 0] == PLAYER_BOMB_POWER + 2
+
+    sim.step(np.array([[ACTION_NONE, ACTION_BOMB]]))
+    assert sim.bomb_active[0, 0]
+    assert sim.bomb_slot_power[0, 0] == PLAYER_BOMB_POWER
+    assert sim.bomb_power[0, 0] == PLAYER_BOMB_POWER + 2
+    assert sim.bomb_power[0, 1] == PLAYER_BOMB_POWER
+
+    # La bombe du joueur 0 part avec sa propre puissance
+    sim.step(np.array([[ACTION_BOMB, ACTION_NONE]]))
+    assert sim.bomb_slot_power[0, 1] == PLAYER_BOMB_POWER + 2
+
+
+def test_chain_matches_bomberman(monkeypatch):
+    # Bloc en (5, 1) et réaction en chaîne (5, 3) -> (7, 3) -> (7, 1) : le bloc, touché dès la
+    # première bombe, doit encore arrêter le rayon de (7, 1) vers la gauche dans les deux moteurs
+    import bomberman
+    import simulation
+    from config import Config
+
+    monkeypatch.setattr(simulation, 'POWER_UP_CHANCE', 0)
+    monkeypatch.setattr(bomberman, 'POWER_UP_CHANCE', 0)
+    board = grid_template(GRID_WIDTH, GRID_HEIGHT)
+    board[1, 5] = BLOCK
+    bombs = [(5, 3, 1), (7, 3, BOMB_TIMER), (7, 1, BOMB_TIMER)]  # x, y, minuteur
+
+    game = bomberman.Bomberman(None, seed=0, config=Config(tile_size=48))
+    game.grid[:] = board
+    for x, y, timer in bombs:
+        bomb = game.bomb_store.create(x, y, 4, game.players[0])
+        bomb.timer = timer
+        game.add_bomb(bomb)
+    game.step([ACTION_NONE, ACTION_NONE])
+
+    sim = BatchSimulation(1, n_players=2, seed=0)
+    sim.grid[0] = board
+    for slot, (x, y, timer) in enumerate(bombs):
+        sim.grid[0, y, x] = BOMB
+        sim.bomb_at[0, y, x] = slot
+        sim.bomb_active[0, slot] = True
+        sim.bomb_x[0, slot], sim.bomb_y[0, slot] = x, y
+        sim.bomb_timer[0, slot] = timer
+        sim.bomb_slot_power[0, slot] = 4
+    sim.active_bombs[0, 0] = len(bombs)
+    sim.step(np.full((1, 2), ACTION_NONE))
+
+    assert not sim.bomb_active.any()
+    assert (sim.grid[0] == game.grid).all()
+    burning = {(explosion.x, explosion.y) for explosion in game.explosions}
+    assert set(zip(*np.nonzero(sim.explosion_timer[0].T))) == burning
+    assert (3, 1) not in burning and (4, 1) not in burning
@@ -0,0 +1,47 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    """Polices et textes déjà rendus pour l'interface.
+
+    Un texte n'est rendu que la première fois qu'il est demandé avec une couleur et une police
+    données ; les surfaces les moins récemment utilisées sont supprimées au-delà de max_size.
+    """
+
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, name, size):
+        # Les polices système ne sont cherchées qu'une fois
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.SysFont(name, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, text, color, name, size):
+        key = (name, size, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(name, size).render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
@@ -0,0 +1,212 @@
+"""Tournoi de bots sans affichage, réparti sur tous les cœurs.
+
+Chaque partie oppose des configurations de bots (options de BotController) sur un plateau
+tiré de sa graine : la partie numéro i a la graine seed + i et se rejoue à l'identique. Les
+configurations tournent de place en place d'une partie à l'autre pour ne pas avantager un
+coin. Les résultats sont écrits partie par partie en JSONL au fil du tournoi, puis agrégés :
+taux de victoire, distribution des scores et durée des parties.
+
+Utilisation : python tournament.py --matches 2000 --bot prudent:aggression=0.2,safety_margin=20
+              --bot agressif:aggression=0.9 [--players 2] [--score-kill 3000] [--output resultats.jsonl]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+
+from bomberman import Bomberman
+from config import Config
+from contantes import *
+from maps import load_pool
+
+TOURNAMENT_TILE_SIZE = 48  # Taille des cases des parties sans écran (indépendante de la machine)
+MAX_MATCH_TICKS = TICK_RATE * 180  # Une partie sans vainqueur au bout de 3 minutes est nulle
+PLAYER_RESULTS = ('score', 'alive', 'blocks_destroyed', 'powerups_collected', 'survival_time')
+
+
+def play_match(spec):
+    """Joue une partie décrite par spec (voir Tournament.matches) et renvoie son résultat."""
+    index, seed, seats, options, scoring, width, height, max_ticks = spec
+    game = Bomberman(None, seed=seed, width=width, height=height, n_players=len(seats),
+                     config=Config(tile_size=TOURNAMENT_TILE_SIZE), scoring=Scoring(*scoring),
+                     maps=load_pool(width, height, len(seats)))
+    game.quiet = True
+    for i, name in enumerate(seats):
+        game.add_bot(i, **options[name])
+
+    while not game.game_over and game.game_time < max_ticks:
+        game.step(game.read_actions())
+
+    alive = [i for i, player in enumerate(game.players) if player.alive]
+    winner = seats[alive[0]] if game.game_over and len(alive) == 1 else None
+    return {
+        'match': index,
+        'seed': seed,
+        'ticks': game.game_time,
+        'timeout': not game.game_over,
+        'winner': winner,
+        'players': [dict(bot=name, **{field: getattr(player, field) for field in PLAYER_RESULTS})
+                    for name, player in zip(seats, game.players)],
+    }
+
+
+class Tournament:
+    def __init__(self, bots, n_matches, n_players=2, seed=0, scoring=DEFAULT_SCORING,
+                 width=GRID_WIDTH, height=GRID_HEIGHT, max_ticks=MAX_MATCH_TICKS):
+        # bots : nom de la configuration -> options de BotController
+        self.bots = bots
+        self.n_matches = n_matches
+        self.n_players = n_players
+        self.seed = seed
+        self.scoring = scoring
+        self.width = width
+        self.height = height
+        self.max_ticks = max_ticks
+
+    def matches(self):
+        # Description de chaque partie : les configurations décalées d'une place à chaque partie
+        names = list(self.bots)
+        for index in range(self.n_matches):
+            seats = [names[(index + seat) % len(names)] for seat in range(self.n_players)]
+            yield (index, self.seed + index, seats, self.bots, tuple(self.scoring), self.width, self.height,
+                   self.max_ticks)
+
+    def run(self, output=None, processes=None, progress=None):
+        """Joue toutes les parties et renvoie leurs résultats (dans l'ordre où elles se terminent).
+
+        Chaque résultat est écrit dès son arrivée dans output (chemin JSONL) s'il est donné ;
+        progress(résultats reçus, total) est appelé après chaque partie.
+        """
+        processes = processes or os.cpu_count()
+        # Petits paquets de parties : peu d'échanges entre processus, charge encore équilibrée
+        chunksize = max(1, self.n_matches // (processes * 8))
+        results = []
+        file = open(output, "w") if output else None
+        try:
+            with multiprocessing.Pool(processes) as pool:
+                for result in pool.imap_unordered(play_match, self.matches(), chunksize):
+                    results.append(result)
+                    if file is not None:
+                        file.write(json.dumps(result) + "\n")
+                    if progress is not None:
+                        progress(len(results), self.n_matches)
+        finally:
+            if file is not None:
+                file.close()
+        return results
+
+
+def summarize(results):
+    """Statistiques du tournoi : par configuration de bot, et sur la durée des parties."""
+    bots = {}
+    for result in results:
+        for player in result['players']:
+            stats = bots.setdefault(player['bot'], {'seats': 0, 'wins': 0, 'scores': [], 'blocks': [],
+                                                    'powerups': []})
+            stats['seats'] += 1
+            stats['wins'] += result['winner'] == player['bot'] and player['alive']
+            stats['scores'].append(player['score'])
+            stats['blocks'].append(player['blocks_destroyed'])
+            stats['powerups'].append(player['powerups_collected'])
+
+    summary = {'bots': {}}
+    for name, stats in bots.items():
+        scores = np.array(stats['scores'])
+        summary['bots'][name] = {
+            'seats': stats['seats'],
+            'wins': stats['wins'],
+            'win_rate': stats['wins'] / stats['seats'],
+            'score_mean': float(scores.mean()),
+            'score_std': float(scores.std()),
+            'score_p10': float(np.percentile(scores, 10)),
+            'score_p50': float(np.percentile(scores, 50)),
+            'score_p90': float(np.percentile(scores, 90)),
+            'blocks_mean': float(np.mean(stats['blocks'])),
+            'powerups_mean': float(np.mean(stats['powerups'])),
+        }
+
+    seconds = np.array([result['ticks'] for result in results]) / TICK_RATE
+    summary['matches'] = len(results)
+    summary['draws'] = sum(result['winner'] is None for result in results)
+    summary['timeouts'] = sum(result['timeout'] for result in results)
+    if len(results):
+        summary['length_mean_s'] = float(seconds.mean())
+        summary['length_p50_s'] = float(np.percentile(seconds, 50))
+        summary['length_p90_s'] = float(np.percentile(seconds, 90))
+    return summary
+
+
+def print_summary(summary):
+    print(f"{summary['matches']} parties, {summary['draws']} nulles dont {summary['timeouts']} "
+          f"au temps limite")
+    if summary['matches']:
+        print(f"Durée : moyenne {summary['length_mean_s']:.1f}s, médiane {summary['length_p50_s']:.1f}s, "
+              f"90% sous {summary['length_p90_s']:.1f}s")
+    print(f"{'bot':16s} {'victoires':>10s} {'taux':>7s} {'score moyen':>12s} {'p10':>8s} {'p50':>8s} "
+          f"{'p90':>8s} {'blocs':>6s}")
+    for name, stats in sorted(summary['bots'].items(), key=lambda item: -item[1]['win_rate']):
+        print(f"{name:16s} {stats['wins']:10d} {stats['win_rate']:7.1%} {stats['score_mean']:12.0f} "
+              f"{stats['score_p10']:8.0f} {stats['score_p50']:8.0f} {stats['score_p90']:8.0f} "
+              f"{stats['blocks_mean']:6.1f}")
+
+
+def bot_option(text):
+    # « nom:aggression=0.8,safety_margin=15 » -> (nom, {'aggression': 0.8, 'safety_margin': 15})
+    name, _, settings = text.partition(":")
+    options = {}
+    for setting in filter(None, settings.split(",")):
+        key, _, value = setting.partition("=")
+        if key not in ('aggression', 'safety_margin'):
+            raise argparse.ArgumentTypeError(f"option de bot inconnue: {key}")
+        try:
+            options[key] = float(value) if key == 'aggression' else int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"valeur invalide pour {key}: {value}")
+    return name, options
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tournoi de bots Bomberman sans affichage")
+    parser.add_argument("--bot", type=bot_option, action="append", default=[], metavar="NOM:OPTIONS",
+                        help="configuration de bot (ex. agressif:aggression=0.9,safety_margin=5) ; option répétable")
+    parser.add_argument("--matches", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0, help="graine de la première partie")
+    parser.add_argument("--processes", type=int, default=os.cpu_count(), help="processus en parallèle")
+    parser.add_argument("--max-seconds", type=int, default=MAX_MATCH_TICKS // TICK_RATE,
+                        help="durée maximale d'une partie (secondes de jeu)")
+    parser.add_argument("--output", default="tournament.jsonl", help="résultats partie par partie (JSONL)")
+    parser.add_argument("--summary", help="statistiques agrégées (JSON)")
+    for field, default in DEFAULT_SCORING._asdict().items():
+        parser.add_argument(f"--score-{field.replace('_', '-')}", type=int, default=default,
+                            help=f"points du barème « {field} » (défaut {default})")
+    args = parser.parse_args()
+
+    bots = dict(args.bot) or {'défaut': {}}
+    scoring = Scoring(*(getattr(args, f"score_{field}") for field in Scoring._fields))
+    tournament = Tournament(bots, args.matches, args.players, args.seed, scoring,
+                            max_ticks=args.max_seconds * TICK_RATE)
+
+    start = time.perf_counter()
+
+    def progress(done, total):
+        if done % 100 == 0 or done == total:
+            print(f"\r{done}/{total} parties ({time.perf_counter() - start:.0f}s)", end="", file=sys.stderr)
+
+    results = tournament.run(args.output, args.processes, progress)
+    print(file=sys.stderr)
+    summary = summarize(results)
+    summary['scoring'] = scoring._asdict()
+    summary['elapsed_s'] = time.perf_counter() - start
+    print_summary(summary)
+    if args.summary:
+        with open(args.summary, "w") as file:
+            json.dump(summary, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()